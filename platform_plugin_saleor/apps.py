@@ -3,7 +3,7 @@ platform_plugin_saleor Django application initialization.
 """
 
 from django.apps import AppConfig
-from edx_django_utils.plugins import PluginSettings, PluginURLs
+from edx_django_utils.plugins import PluginSettings, PluginSignals, PluginURLs
 
 
 class PlatformPluginSaleorConfig(AppConfig):
@@ -12,6 +12,7 @@ class PlatformPluginSaleorConfig(AppConfig):
     """
 
     name = 'platform_plugin_saleor'
+    default_auto_field = 'django.db.models.BigAutoField'
 
     plugin_app = {
         PluginURLs.CONFIG: {
@@ -36,4 +37,40 @@ class PlatformPluginSaleorConfig(AppConfig):
                 "common": {PluginSettings.RELATIVE_PATH: "settings.common"},
             },
         },
+        PluginSignals.CONFIG: {
+            "lms.djangoapp": {
+                PluginSignals.RELATIVE_PATH: "signals",
+                PluginSignals.RECEIVERS: [
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: "sync_course_product_on_save",
+                        PluginSignals.SIGNAL_PATH: "django.db.models.signals.post_save",
+                        PluginSignals.SENDER_PATH: (
+                            "openedx.core.djangoapps.content.course_overviews.models.CourseOverview"
+                        ),
+                    },
+                ],
+            },
+            "cms.djangoapp": {
+                PluginSignals.RELATIVE_PATH: "signals",
+                PluginSignals.RECEIVERS: [
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: "sync_course_product_on_save",
+                        PluginSignals.SIGNAL_PATH: "django.db.models.signals.post_save",
+                        PluginSignals.SENDER_PATH: (
+                            "openedx.core.djangoapps.content.course_overviews.models.CourseOverview"
+                        ),
+                    },
+                ],
+            },
+        },
     }
+
+    def ready(self):
+        """
+        Parse the Saleor GraphQL documents once, before the first request needs them.
+        """
+        from platform_plugin_saleor.saleor_client.documents import (  # pylint: disable=import-outside-toplevel
+            compile_documents,
+        )
+
+        compile_documents()
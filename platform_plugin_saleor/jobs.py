@@ -0,0 +1,182 @@
+"""Resumable catalog syncs.
+
+A full catalog sync can stop halfway, e.g. on a deploy, an OOM kill or a Saleor outage.
+Its progress is stored in a SaleorSyncJob: courses are processed in ID order, and after
+each batch the ID of its last course, the cursor, is saved along with the failures. A
+resumed job continues after the cursor, so the courses already created are not sent again.
+
+The batches in flight when the job stopped may have reached Saleor without being
+recorded. A resumed job upserts them, and retries the recorded failures, instead of
+creating them again, which would fail on the external reference of existing products.
+"""
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.models import SaleorSyncJob, SaleorSyncJobFailure
+
+
+def start_job(name: str, course_ids=None, in_flight: int = 0, shard: str = "") -> SaleorSyncJob:
+    """
+    Create a sync job.
+
+    Args:
+        name (str): Name of the job, used to resume it.
+        course_ids (list, optional): IDs of the selected courses. If not provided, the
+            job syncs every course.
+        in_flight (int): Maximum number of courses sent to Saleor before being recorded.
+        shard (str): Shard of the courses synced by the job, as ``INDEX/COUNT``. Empty
+            for every shard.
+
+    Returns:
+        SaleorSyncJob: The job.
+
+    Raises:
+        ValueError: If a job with that name already exists.
+    """
+    job, created = SaleorSyncJob.objects.get_or_create(
+        name=name,
+        defaults={"course_ids": course_ids, "in_flight": in_flight, "shard": shard},
+    )
+
+    if not created:
+        raise ValueError(f"Sync job '{name}' already exists, use --resume to continue it.")
+
+    return job
+
+
+def resume_job(name: str, in_flight: int = 0) -> tuple:
+    """
+    Reopen a sync job that did not complete.
+
+    The failures of courses deleted since then are dropped, as there is nothing to retry.
+
+    Args:
+        name (str): Name of the job.
+        in_flight (int): Maximum number of courses sent to Saleor before being recorded,
+            for this run.
+
+    Returns:
+        tuple: The job, and the number of courses after its cursor that may have
+            reached Saleor when it stopped.
+
+    Raises:
+        ValueError: If the job does not exist or is completed.
+    """
+    try:
+        job = SaleorSyncJob.objects.get(name=name)
+    except SaleorSyncJob.DoesNotExist as e:
+        raise ValueError(f"Sync job '{name}' does not exist.") from e
+
+    if job.status == SaleorSyncJob.COMPLETED:
+        raise ValueError(f"Sync job '{name}' is already completed.")
+
+    job.failures.exclude(course_id__in=CourseOverview.objects.values("id")).delete()
+
+    unconfirmed = job.in_flight
+    job.in_flight = in_flight
+    job.save(update_fields=["in_flight", "updated_at"])
+
+    return job, unconfirmed
+
+
+def get_job_courses(job: SaleorSyncJob):
+    """
+    Return the courses of a job left to process, in ID order.
+
+    The courses are not filtered by the shard of the job, which is done in Python, see
+    ``platform_plugin_saleor.sharding.filter_shard``.
+
+    Args:
+        job (SaleorSyncJob): The job.
+
+    Returns:
+        QuerySet: The courses after the cursor of the job.
+    """
+    courses = CourseOverview.objects.all()
+
+    if job.course_ids is not None:
+        courses = courses.filter(id__in=job.course_ids)
+
+    if job.cursor:
+        courses = courses.filter(id__gt=job.cursor)
+
+    return courses.order_by("id")
+
+
+def get_failed_courses(job: SaleorSyncJob):
+    """
+    Return the courses that failed in a job, in ID order.
+
+    Args:
+        job (SaleorSyncJob): The job.
+
+    Returns:
+        QuerySet: The courses.
+    """
+    return CourseOverview.objects.filter(
+        id__in=job.failures.values_list("course_id", flat=True),
+    ).order_by("id")
+
+
+def record_results(job: SaleorSyncJob, results: dict, advance: bool = True):
+    """
+    Store the outcome of a batch of a job atomically.
+
+    Args:
+        job (SaleorSyncJob): The job.
+        results (dict): An OperationResult per course ID, in ID order.
+        advance (bool): Whether to move the cursor to the last course of the batch. Not
+            for batches of retried failures, which are behind the cursor.
+    """
+    if not results:
+        return
+
+    succeeded = [course_id for course_id, result in results.items() if result.ok]
+    failures = [
+        SaleorSyncJobFailure(job=job, course_id=course_id, error=str(result.error))
+        for course_id, result in results.items() if not result.ok
+    ]
+
+    with transaction.atomic():
+        # Only courses behind the cursor can have a recorded failure.
+        if not advance:
+            job.failures.filter(course_id__in=succeeded).delete()
+
+        SaleorSyncJobFailure.objects.bulk_create(
+            failures,
+            update_conflicts=True,
+            unique_fields=["job", "course_id"],
+            update_fields=["error", "updated_at"],
+        )
+
+        if advance:
+            job.cursor = next(reversed(results))
+            SaleorSyncJob.objects.filter(pk=job.pk).update(
+                cursor=job.cursor,
+                processed=F("processed") + len(results),
+                updated_at=timezone.now(),
+            )
+
+
+def finish_job(job: SaleorSyncJob) -> bool:
+    """
+    Mark a job as completed, unless some of its courses failed.
+
+    A job with failures stays open, so resuming it retries them.
+
+    Args:
+        job (SaleorSyncJob): The job.
+
+    Returns:
+        bool: True if the job is completed.
+    """
+    if job.failures.exists():
+        return False
+
+    job.status = SaleorSyncJob.COMPLETED
+    job.save(update_fields=["status", "updated_at"])
+
+    return True
@@ -1,18 +1,45 @@
 """Django management command to create Saleor products for Open edX courses."""
 
+import asyncio
 import logging
+import resource
+import sys
+import time
+from collections import deque
 
+from aiohttp import ClientError
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 from gql.transport.aiohttp import log as aiohttp_logger
+from gql.transport.exceptions import TransportError
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
 
+from platform_plugin_saleor.jobs import (
+    finish_job,
+    get_failed_courses,
+    get_job_courses,
+    record_results,
+    resume_job,
+    start_job,
+)
+from platform_plugin_saleor.mappings import save_course_product_ids
+from platform_plugin_saleor.saleor_client.batch import DEFAULT_BATCH_SIZE, OperationResult, iter_batches
 from platform_plugin_saleor.saleor_client.client import SaleorApiClient
-from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig
-from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
+from platform_plugin_saleor.saleor_client.concurrency import AdaptiveLimiter
+from platform_plugin_saleor.saleor_client.config import get_default_config
+from platform_plugin_saleor.saleor_client.exceptions import CircuitOpenError
+from platform_plugin_saleor.saleor_client.metrics import InMemoryMetricsSink
+from platform_plugin_saleor.saleor_client.retry import RetryPolicy
+from platform_plugin_saleor.saleor_client.transport import SaleorPoolConfig
+from platform_plugin_saleor.sharding import filter_shard, format_shard, parse_shard
+from platform_plugin_saleor.sync import DEFAULT_CHECKPOINT, sync_modified_courses
 
 aiohttp_logger.setLevel(logging.WARNING)
 
+# Errors failing a whole batch once its retries are exhausted, rather than some of its courses.
+BATCH_ERRORS = (TransportError, ClientError, asyncio.TimeoutError)
+
 
 class Command(BaseCommand):
     """
@@ -21,10 +48,21 @@ class Command(BaseCommand):
     Usage:
         - Provide a list of course IDs as positional arguments to create products for specific courses.
         - Use the --all flag to process all courses in the CourseOverview model.
+        - Use the --incremental flag to create or update the products of the courses modified
+          since the previous incremental run.
+        - Use --resume with the name of a job that stopped to continue it where it stopped.
+        - Use --shard INDEX/COUNT to only sync a slice of the courses, running one process per
+          shard, e.g. on several machines.
 
     Example:
         python manage.py saleor_create_course_products course-v1:edX+DemoX+Demo_Course
         python manage.py saleor_create_course_products --all
+        python manage.py saleor_create_course_products --all --concurrency 8
+        python manage.py saleor_create_course_products --all --concurrency 32 --adaptive
+        python manage.py saleor_create_course_products --incremental
+        python manage.py saleor_create_course_products --all --job catalog
+        python manage.py saleor_create_course_products --resume catalog
+        python manage.py saleor_create_course_products --all --shard 0/4
     """
 
     help = "Creates Saleor products for courses from CourseOverview models."
@@ -45,6 +83,68 @@ class Command(BaseCommand):
             action="store_true",
             help="Process all available courses",
         )
+        parser.add_argument(
+            "--job",
+            help="Name of the sync job, to resume it if it stops. Defaults to a timestamped name",
+        )
+        parser.add_argument(
+            "--resume",
+            metavar="JOB",
+            help="Continue a sync job that stopped, retrying its failed courses",
+        )
+        parser.add_argument(
+            "--shard",
+            metavar="INDEX/COUNT",
+            help="Only sync the courses whose key hashes to this shard, e.g. 0/4, with one process per shard",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Create or update the products of the courses modified since the checkpoint",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=DEFAULT_CHECKPOINT,
+            help="Name of the checkpoint used by --incremental",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="With --incremental, push courses even if their product did not change",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of products created per productBulkCreate call",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of productBulkCreate calls in flight at once",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of courses fetched from the database at a time",
+        )
+        parser.add_argument(
+            "--adaptive",
+            action="store_true",
+            help="Adapt the calls in flight to Saleor latency and errors, up to --concurrency",
+        )
+        parser.add_argument(
+            "--columnar",
+            action="store_true",
+            help="Fetch the mapped columns with values_list and build the products column by column",
+        )
+        parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help="Print per-operation Saleor latency and payload metrics at the end",
+        )
 
     def handle(self, *args, **options):
         """
@@ -52,46 +152,342 @@ class Command(BaseCommand):
         """
         course_ids = options.get("course_ids")
         process_all = options.get("all")
+        incremental = options.get("incremental")
+        resume = options.get("resume")
+        batch_size = options.get("batch_size")
+        concurrency = options.get("concurrency")
+        chunk_size = options.get("chunk_size")
+        limiter = AdaptiveLimiter(max_limit=concurrency) if options.get("adaptive") else None
+        metrics_sink = InMemoryMetricsSink() if options.get("metrics") else None
 
-        if not course_ids and not process_all:
+        if not course_ids and not process_all and not incremental and not resume:
             self.stdout.write(
                 self.style.ERROR(
-                    "Please specify course IDs or use --all to process all courses."
+                    "Please specify course IDs, use --all to process all courses, --incremental "
+                    "to process the courses modified since the last run or --resume to continue a job."
                 )
             )
             return
 
-        client = SaleorApiClient(
+        if resume and (course_ids or process_all or incremental or options.get("shard")):
+            self.stdout.write(self.style.ERROR("--resume takes the courses and shard of the job, do not select any."))
+            return
+
+        if batch_size < 1 or concurrency < 1 or chunk_size < 1:
+            self.stdout.write(
+                self.style.ERROR("--batch-size, --concurrency and --chunk-size must be positive integers."))
+            return
+
+        config = get_default_config()
+        columnar = options.get("columnar")
+        checkpoint = options.get("checkpoint")
+        job = None
+        unconfirmed = 0
+
+        try:
+            shard = parse_shard(options["shard"]) if options.get("shard") else None
+
+            if incremental:
+                if shard:
+                    checkpoint = f"{checkpoint}:{format_shard(shard)}"
+            elif resume:
+                job, unconfirmed = resume_job(resume, in_flight=batch_size * concurrency)
+                shard = parse_shard(job.shard) if job.shard else None
+            else:
+                job = self._start_job(course_ids, process_all, options.get("job"), batch_size * concurrency, shard)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+
+        if job:
+            self.stdout.write(f"Sync job '{job.name}', continue it with --resume {job.name} if it stops.")
+        elif not incremental:
+            return
+
+        if shard:
+            self.stdout.write(f"Syncing shard {format_shard(shard)} of the courses.")
+
+        with SaleorApiClient(
             base_url=settings.SALEOR_API_URL,
-            token=settings.SALEOR_API_TOKEN
-        )
+            token=settings.SALEOR_API_TOKEN,
+            pool_config=SaleorPoolConfig(),
+            # Products are unique by external reference, so a retried productBulkCreate
+            # cannot create duplicates. If the first attempt did reach Saleor, the retry
+            # reports those rows as failed on their existing external reference: they are
+            # recorded as failures of the job, and --resume upserts them. Incremental
+            # syncs upsert, and retry such courses on the next run.
+            retry_policy=RetryPolicy(retry_mutations=True),
+            metrics_sink=metrics_sink,
+            limiter=limiter,
+        ) as client:
+            if incremental:
+                self._sync_modified_courses(
+                    client,
+                    config,
+                    checkpoint,
+                    batch_size,
+                    chunk_size,
+                    options.get("force"),
+                    shard,
+                )
+            else:
+                self._create_products(
+                    client,
+                    config,
+                    job,
+                    self._iter_job_batches(job, config, batch_size, chunk_size, columnar, resume, unconfirmed, shard),
+                    batch_size,
+                    concurrency,
+                    columnar,
+                    shard,
+                )
 
-        config = EdxCourseOverviewSaleorConfig()
+        self.stdout.write(f"Peak memory: {self._get_peak_memory_mb():.1f} MB")
 
-        if course_ids:
+        if limiter:
+            self.stdout.write(f"Final Saleor concurrency limit: {limiter.limit}")
+
+        if metrics_sink:
+            self._write_metrics(metrics_sink)
+
+    def _write_metrics(self, metrics_sink):
+        """
+        Print the per-operation metrics collected during the run, slowest first.
+        """
+        self.stdout.write("Saleor operations:")
+
+        for operation_name, summary in metrics_sink.summary().items():
+            self.stdout.write(
+                f"  - {operation_name}: {summary['calls']} calls, "
+                f"p50 {summary['p50_duration'] * 1000:.0f}ms, "
+                f"p95 {summary['p95_duration'] * 1000:.0f}ms, "
+                f"{summary['errors']} errors, {summary['retries']} retries, "
+                f"{summary['request_bytes']}B sent, {summary['response_bytes']}B received"
+            )
+
+    def _start_job(self, course_ids, process_all, name, in_flight, shard):
+        """
+        Start the sync job of the selected courses.
+
+        Returns:
+            SaleorSyncJob or None: The job, or None if none of the given IDs exist.
+
+        Raises:
+            ValueError: If a job with that name already exists.
+        """
+        if not process_all:
             self.stdout.write(f"Fetching specific courses: {', '.join(course_ids)}")
-            courses = CourseOverview.objects.filter(id__in=course_ids)
 
-            if not courses:
+            if not CourseOverview.objects.filter(id__in=course_ids).exists():
                 self.stdout.write(
                     self.style.WARNING("No courses found for those IDs."))
-                return
+                return None
 
-        if process_all:
-            courses = CourseOverview.objects.all()
+        if not name:
+            name = f"catalog-{timezone.now():%Y%m%d-%H%M%S}"
 
-        self.stdout.write(f"Found {courses.count()} courses to process")
+            if shard:
+                name += f"-shard-{shard[0]}-of-{shard[1]}"
 
-        for course in courses:
-            try:
-                client.create_course_product(course, config)
-                self.stdout.write(
-                    self.style.SUCCESS(f"Created product for course: {course.id}"))
+        return start_job(
+            name,
+            course_ids=None if process_all else course_ids,
+            in_flight=in_flight,
+            shard=format_shard(shard),
+        )
 
-            except ValueError as e:
-                self.stdout.write(
-                    self.style.ERROR(f"Error creating product for course {course.id}: {str(e)}"))
+    @staticmethod
+    def _iter_job_batches(job, config, batch_size, chunk_size, columnar, resume, unconfirmed, shard):
+        """
+        Yield the batches of courses of a job, each with whether to upsert it and whether
+        it moves the cursor. Only the courses of the shard, if any, are included.
+
+        On resume, the failed courses come first, then the courses after the cursor. Both
+        the failed courses and the ``unconfirmed`` courses that may have reached Saleor
+        before the job stopped are upserted rather than created.
+        """
+        def select_fields(courses):
+            if columnar:
+                return courses.values_list(*config.product_serializer.row_fields)
+
+            return courses.only(*config.get_model_fields(), "display_name", "short_description")
+
+        if resume:
+            failed_courses = select_fields(get_failed_courses(job)).iterator(chunk_size=chunk_size)
+
+            for batch in iter_batches(failed_courses, batch_size):
+                yield batch, True, False
+
+        courses = filter_shard(
+            select_fields(get_job_courses(job)).iterator(chunk_size=chunk_size),
+            shard,
+            (lambda row: row[0]) if columnar else (lambda course: course.id),
+        )
+        sent = 0
+
+        for batch in iter_batches(courses, batch_size):
+            yield batch, sent < unconfirmed, True
+            sent += len(batch)
+
+    @staticmethod
+    def _get_shard_label(shard):
+        """
+        Return the shard for the summary lines, or an empty string without shard.
+        """
+        return f" of shard {format_shard(shard)}" if shard else ""
+
+    @staticmethod
+    def _get_peak_memory_mb():
+        """
+        Return the peak resident memory of the process, in megabytes.
+        """
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux.
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    def _sync_modified_courses(self, client, config, checkpoint, batch_size, chunk_size, force, shard):
+        """
+        Create or update the products of the courses modified since the checkpoint.
+        """
+        failed = []
+        started_at = time.perf_counter()
+
+        try:
+            report = sync_modified_courses(
+                client,
+                config,
+                checkpoint=checkpoint,
+                batch_size=batch_size,
+                chunk_size=chunk_size,
+                force=force,
+                on_results=lambda results: self._write_results(results, failed, action="sync"),
+                shard=shard,
+            )
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(f"Error syncing products: {str(e)}"))
+            return
+        except (CircuitOpenError, *BATCH_ERRORS) as e:
+            # The checkpoint keeps the progress of the batches synced before the error.
+            self.stdout.write(self.style.ERROR(
+                f"Error syncing products: {str(e) or type(e).__name__} Run --incremental again to continue."))
+            return
+
+        elapsed = time.perf_counter() - started_at
+
+        self.stdout.write(
+            f"Synced {len(report.results) - len(failed)} products, {len(failed)} failed, "
+            f"{len(report.skipped)} unchanged{self._get_shard_label(shard)}, in {elapsed:.2f}s."
+        )
+        self.stdout.write(
+            f"Checkpoint '{checkpoint}' moved from {report.since} to {report.synced_until}."
+        )
+
+    def _create_products(self, client, config, job, batches, batch_size, concurrency, columnar, shard=None):
+        """
+        Create the Saleor products of the batches of courses of a job, in bulk.
+
+        With ``columnar``, the courses are ``values_list`` rows instead of model instances.
 
-            except GraphQLError as e:
+        Up to ``concurrency`` batches are in flight at once. Results are printed and
+        recorded in the job in course order, as each oldest pending batch completes.
+
+        A batch failing as a whole, e.g. on a server error, is recorded as a failure of each
+        of its courses. If the circuit breaker opens, the job stops to be resumed later.
+        """
+        self.stdout.write(f"Processing courses in batches of {batch_size}")
+
+        if columnar:
+            create_products_bulk = client.async_client.create_course_product_rows_bulk
+            upsert_products = client.async_client.upsert_course_product_rows
+        else:
+            create_products_bulk = client.async_client.create_course_products_bulk
+            upsert_products = client.async_client.upsert_course_products
+
+        failed = []
+        processed = 0
+        pending = deque()
+        started_at = time.perf_counter()
+
+        try:
+            # Courses are read here, outside the client event loop, one batch at a time.
+            for batch, upsert, advance in batches:
+                if len(pending) >= concurrency:
+                    processed += self._record_results(job, *pending.popleft(), failed)
+
+                send_products = upsert_products if upsert else create_products_bulk
+                pending.append((
+                    client.submit(send_products(batch, config, batch_size=batch_size)),
+                    advance,
+                    [str(row[0]) if columnar else str(row.id) for row in batch],
+                ))
+
+            while pending:
+                processed += self._record_results(job, *pending.popleft(), failed)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(f"Error creating products: {str(e)}"))
+            return
+        except CircuitOpenError as e:
+            self.stdout.write(
+                self.style.ERROR(f"Error creating products: {str(e)} Continue with --resume {job.name}."))
+            return
+        finally:
+            for future, _, _ in pending:
+                future.cancel()
+
+        elapsed = time.perf_counter() - started_at
+
+        self.stdout.write(f"Created {processed - len(failed)} products, {len(failed)} failed.")
+        self.stdout.write(
+            f"Processed {processed} courses{self._get_shard_label(shard)} in {elapsed:.2f}s "
+            f"({processed / elapsed if elapsed else 0:.1f} courses/s)."
+        )
+
+        if finish_job(job):
+            self.stdout.write(f"Sync job '{job.name}' completed.")
+        else:
+            self.stdout.write(
+                f"Sync job '{job.name}' has {job.failures.count()} failed courses, "
+                f"retry them with --resume {job.name}."
+            )
+
+    def _record_results(self, job, future, advance, course_ids, failed):
+        """
+        Wait for a batch, then record its results in the job, store the product IDs and print them.
+
+        If the whole batch failed, its error is the result of each of its ``course_ids``.
+
+        Returns:
+            int: The number of courses in the batch.
+        """
+        try:
+            results = future.result()
+        except BATCH_ERRORS as e:
+            results = {course_id: OperationResult(error=e) for course_id in course_ids}
+        record_results(job, results, advance=advance)
+        save_course_product_ids({
+            course_id: result.data["id"]
+            for course_id, result in results.items() if result.ok and (result.data or {}).get("id")
+        })
+
+        return self._write_results(results, failed)
+
+    def _write_results(self, results, failed, action="create"):
+        """
+        Print the result of each course of a batch, collecting the failed course IDs.
+
+        Returns:
+            int: The number of courses in the batch.
+        """
+        done, doing = ("Synced", "syncing") if action == "sync" else ("Created", "creating")
+
+        for course_id, result in results.items():
+            if result.ok:
+                self.stdout.write(
+                    self.style.SUCCESS(f"{done} product for course: {course_id}"))
+            else:
+                failed.append(course_id)
                 self.stdout.write(
-                    self.style.ERROR(f"Error creating product for course {course.id}: {str(e)}"))
+                    self.style.ERROR(f"Error {doing} product for course {course_id}: {str(result.error)}"))
+
+        return len(results)
@@ -7,7 +7,7 @@ from django.core.management.base import BaseCommand
 from gql.transport.aiohttp import log as aiohttp_logger
 
 from platform_plugin_saleor.saleor_client.client import SaleorApiClient
-from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig
+from platform_plugin_saleor.saleor_client.config import get_default_config
 from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
 
 aiohttp_logger.setLevel(logging.WARNING)
@@ -31,13 +31,11 @@ class Command(BaseCommand):
         self.stdout.write("Creating product attributes in Saleor...")
 
         try:
-            client = SaleorApiClient(
+            with SaleorApiClient(
                 base_url=settings.SALEOR_API_URL,
                 token=settings.SALEOR_API_TOKEN
-            )
-            config = EdxCourseOverviewSaleorConfig()
-
-            response = client.create_product_attributes(config=config)
+            ) as client:
+                response = client.create_product_attributes(config=get_default_config())
 
             results = response["attributeBulkCreate"]["results"]
             self.stdout.write(f"Successfully created {len(results)} attributes in Saleor")
@@ -7,7 +7,7 @@ from django.core.management.base import BaseCommand
 from gql.transport.aiohttp import log as aiohttp_logger
 
 from platform_plugin_saleor.saleor_client.client import SaleorApiClient
-from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig
+from platform_plugin_saleor.saleor_client.config import get_default_config
 from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
 
 aiohttp_logger.setLevel(logging.WARNING)
@@ -30,12 +30,11 @@ class Command(BaseCommand):
         """
 
         try:
-            client = SaleorApiClient(
+            with SaleorApiClient(
                 base_url=settings.SALEOR_API_URL,
                 token=settings.SALEOR_API_TOKEN
-            )
-            config = EdxCourseOverviewSaleorConfig()
-            product_type = client.create_product_type(config=config)
+            ) as client:
+                product_type = client.create_product_type(config=get_default_config())
 
             if product_type:
                 self.stdout.write(self.style.SUCCESS(
@@ -0,0 +1,183 @@
+"""Local mapping of Open edX objects to their Saleor IDs.
+
+Course products, product variants and customer accounts are looked up in Saleor by
+external reference, SKU or email. The IDs found are stored locally as they are synced or
+used by the checkout, so later lookups are one indexed query instead of a round trip to
+Saleor. Mappings are written with bulk upserts, one query per call whatever the number of
+rows.
+"""
+
+from platform_plugin_saleor.models import SaleorCourseProduct, SaleorProductVariant, SaleorUser
+
+
+def get_course_product_ids(course_ids) -> dict:
+    """
+    Return the Saleor product ID of courses.
+
+    Args:
+        course_ids: The course IDs.
+
+    Returns:
+        dict: The product ID of each course ID with a known product.
+    """
+    return dict(
+        SaleorCourseProduct.objects.filter(
+            course_id__in=[str(course_id) for course_id in course_ids],
+        ).exclude(product_id="").values_list("course_id", "product_id")
+    )
+
+
+def save_course_products(course_products: dict):
+    """
+    Store the Saleor product, content hash and snapshot of courses, in a single query.
+
+    Args:
+        course_products (dict): Per course ID, a dict with the ``product_id``, the
+            ``content_hash`` and the ``snapshot`` of the product input pushed.
+    """
+    if not course_products:
+        return
+
+    SaleorCourseProduct.objects.bulk_create(
+        [
+            SaleorCourseProduct(course_id=course_id, **fields)
+            for course_id, fields in course_products.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["course_id"],
+        update_fields=["product_id", "content_hash", "snapshot", "updated_at"],
+    )
+
+
+def save_course_product_ids(product_ids: dict):
+    """
+    Store the Saleor product ID of courses, in a single query.
+
+    The content hash and snapshot of existing rows are kept. New rows get none, so the
+    next incremental sync pushes the full product input of those courses.
+
+    Args:
+        product_ids (dict): The Saleor product ID of each course ID.
+    """
+    if not product_ids:
+        return
+
+    SaleorCourseProduct.objects.bulk_create(
+        [
+            SaleorCourseProduct(course_id=course_id, product_id=product_id, content_hash="")
+            for course_id, product_id in product_ids.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["course_id"],
+        update_fields=["product_id", "updated_at"],
+    )
+
+
+def get_product_variant(sku: str) -> dict:
+    """
+    Return the stored Saleor product variant of a SKU.
+
+    Args:
+        sku (str): The SKU of the variant.
+
+    Returns:
+        dict or None: The variant ``id``, ``sku`` and ``name``, as returned by Saleor,
+        or None if the SKU is not mapped.
+    """
+    variant = SaleorProductVariant.objects.filter(sku=sku).values("variant_id", "sku", "name").first()
+
+    if variant is None:
+        return None
+
+    return {"id": variant["variant_id"], "sku": variant["sku"], "name": variant["name"]}
+
+
+def save_product_variants(variants):
+    """
+    Store Saleor product variants by SKU, in a single query.
+
+    Args:
+        variants: The variants as returned by Saleor, with ``id``, ``sku``, ``name``
+            and optionally ``product.externalReference``.
+    """
+    variants = [variant for variant in variants if variant and variant.get("sku")]
+
+    if not variants:
+        return
+
+    SaleorProductVariant.objects.bulk_create(
+        [
+            SaleorProductVariant(
+                sku=variant["sku"],
+                variant_id=variant["id"],
+                name=variant.get("name") or "",
+                course_id=(variant.get("product") or {}).get("externalReference") or "",
+            )
+            for variant in variants
+        ],
+        update_conflicts=True,
+        unique_fields=["sku"],
+        update_fields=["variant_id", "name", "course_id", "updated_at"],
+    )
+
+
+def delete_product_variant(sku: str) -> bool:
+    """
+    Forget the stored Saleor product variant of a SKU, e.g. when Saleor rejects it.
+
+    Args:
+        sku (str): The SKU of the variant.
+
+    Returns:
+        bool: True if a variant was stored.
+    """
+    deleted, _ = SaleorProductVariant.objects.filter(sku=sku).delete()
+    return bool(deleted)
+
+
+def get_saleor_user_id(user) -> str:
+    """
+    Return the stored Saleor user ID of an LMS user.
+
+    Args:
+        user (User): The LMS user.
+
+    Returns:
+        str or None: The Saleor user ID, or None if the user is not mapped.
+    """
+    return SaleorUser.objects.filter(user_id=user.pk).values_list("saleor_user_id", flat=True).first()
+
+
+def save_saleor_users(saleor_user_ids: dict):
+    """
+    Store the Saleor user ID of LMS users, in a single query.
+
+    Args:
+        saleor_user_ids (dict): The Saleor user ID of each LMS user ID.
+    """
+    if not saleor_user_ids:
+        return
+
+    SaleorUser.objects.bulk_create(
+        [
+            SaleorUser(user_id=user_id, saleor_user_id=saleor_user_id)
+            for user_id, saleor_user_id in saleor_user_ids.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=["saleor_user_id", "updated_at"],
+    )
+
+
+def delete_saleor_user(user) -> bool:
+    """
+    Forget the stored Saleor user ID of an LMS user, e.g. when Saleor rejects it.
+
+    Args:
+        user (User): The LMS user.
+
+    Returns:
+        bool: True if a Saleor user ID was stored.
+    """
+    deleted, _ = SaleorUser.objects.filter(user_id=user.pk).delete()
+    return bool(deleted)
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.20 on 2026-10-17 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('platform_plugin_saleor', '0001_sync_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SaleorCourseProduct',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.CharField(max_length=255, unique=True)),
+                ('content_hash', models.CharField(help_text='SHA-256 of the product input last pushed to Saleor.', max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.20 on 2026-10-17 18:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('platform_plugin_saleor', '0002_course_product_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SaleorProductVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sku', models.CharField(max_length=255, unique=True)),
+                ('variant_id', models.CharField(help_text='ID of the Saleor product variant.', max_length=255)),
+                ('name', models.CharField(blank=True, default='', max_length=255)),
+                ('course_id', models.CharField(blank=True, db_index=True, default='', max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='saleorcourseproduct',
+            name='product_id',
+            field=models.CharField(blank=True, default='', help_text='ID of the Saleor product.', max_length=255),
+        ),
+        migrations.CreateModel(
+            name='SaleorUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('saleor_user_id', models.CharField(help_text='ID of the Saleor user.', max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='saleor_user', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2026-10-17 19:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('platform_plugin_saleor', '0003_saleor_id_mappings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='saleorcourseproduct',
+            name='snapshot',
+            field=models.JSONField(blank=True, help_text='Product input last pushed to Saleor, to send only what changed next time.', null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.20 on 2026-10-17 19:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('platform_plugin_saleor', '0004_course_product_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SaleorSyncJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('status', models.CharField(choices=[('running', 'Running'), ('completed', 'Completed')], default='running', max_length=20)),
+                ('course_ids', models.JSONField(blank=True, help_text='IDs of the selected courses, null for every course.', null=True)),
+                ('cursor', models.CharField(blank=True, default='', help_text='ID of the last course processed. Courses are processed in ID order.', max_length=255)),
+                ('in_flight', models.PositiveIntegerField(default=0, help_text='Maximum number of courses sent to Saleor but not yet recorded.')),
+                ('processed', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SaleorSyncJobFailure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.CharField(max_length=255)),
+                ('error', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='failures', to='platform_plugin_saleor.saleorsyncjob')),
+            ],
+            options={
+                'unique_together': {('job', 'course_id')},
+            },
+        ),
+    ]
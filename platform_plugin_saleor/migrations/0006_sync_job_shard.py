@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2026-10-17 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('platform_plugin_saleor', '0005_sync_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='saleorsyncjob',
+            name='shard',
+            field=models.CharField(blank=True, default='', help_text='Shard of the courses synced by the job, as INDEX/COUNT. Empty for every shard.', max_length=20),
+        ),
+    ]
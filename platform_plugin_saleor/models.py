@@ -1,3 +1,150 @@
 """
 Database models for platform_plugin_saleor.
 """
+
+from django.conf import settings
+from django.db import models
+
+
+class SaleorSyncCheckpoint(models.Model):
+    """
+    Progress of an incremental sync of courses to Saleor.
+
+    .. no_pii:
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    synced_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Courses modified up to this date are synced to Saleor.",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.synced_until}"
+
+
+class SaleorCourseProduct(models.Model):
+    """
+    Saleor product of a course, as last pushed by the sync.
+
+    .. no_pii:
+    """
+
+    course_id = models.CharField(max_length=255, unique=True)
+    product_id = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="ID of the Saleor product.",
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the product input last pushed to Saleor.",
+    )
+    snapshot = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Product input last pushed to Saleor, to send only what changed next time.",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.course_id
+
+
+class SaleorProductVariant(models.Model):
+    """
+    Saleor product variant of a course mode, looked up by SKU.
+
+    .. no_pii:
+    """
+
+    sku = models.CharField(max_length=255, unique=True)
+    variant_id = models.CharField(max_length=255, help_text="ID of the Saleor product variant.")
+    name = models.CharField(max_length=255, blank=True, default="")
+    course_id = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.sku
+
+
+class SaleorUser(models.Model):
+    """
+    Saleor customer account of an LMS user.
+
+    .. no_pii:
+    """
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="saleor_user")
+    saleor_user_id = models.CharField(max_length=255, help_text="ID of the Saleor user.")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.saleor_user_id}"
+
+
+class SaleorSyncJob(models.Model):
+    """
+    Progress of a catalog sync run by ``saleor_create_course_products``, to resume it.
+
+    .. no_pii:
+    """
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    STATUS_CHOICES = [
+        (RUNNING, "Running"),
+        (COMPLETED, "Completed"),
+    ]
+
+    name = models.CharField(max_length=100, unique=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=RUNNING)
+    course_ids = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="IDs of the selected courses, null for every course.",
+    )
+    cursor = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="ID of the last course processed. Courses are processed in ID order.",
+    )
+    shard = models.CharField(
+        max_length=20,
+        blank=True,
+        default="",
+        help_text="Shard of the courses synced by the job, as INDEX/COUNT. Empty for every shard.",
+    )
+    in_flight = models.PositiveIntegerField(
+        default=0,
+        help_text="Maximum number of courses sent to Saleor but not yet recorded.",
+    )
+    processed = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.status}"
+
+
+class SaleorSyncJobFailure(models.Model):
+    """
+    Course that failed to sync in a SaleorSyncJob.
+
+    .. no_pii:
+    """
+
+    job = models.ForeignKey(SaleorSyncJob, on_delete=models.CASCADE, related_name="failures")
+    course_id = models.CharField(max_length=255)
+    error = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("job", "course_id")
+
+    def __str__(self):
+        return f"{self.job.name}: {self.course_id}"
@@ -0,0 +1,1131 @@
+"""Asynchronous Saleor API client for managing course products, product types, and attributes.
+
+This module provides the AsyncSaleorApiClient class, which interacts with the Saleor GraphQL API
+over a long-lived gql async session. Every operation is a coroutine, so callers running an event
+loop can issue many Saleor calls concurrently, e.g. with ``asyncio.gather``. The blocking
+SaleorApiClient is a thin wrapper around this class.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+
+from django.utils.text import slugify
+
+from platform_plugin_saleor.saleor_client.batch import DEFAULT_BATCH_SIZE, OperationResult, iter_batches
+from platform_plugin_saleor.saleor_client.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from platform_plugin_saleor.saleor_client.concurrency import AdaptiveLimiter
+from platform_plugin_saleor.saleor_client.config import SaleorConfig, get_default_config
+from platform_plugin_saleor.saleor_client.documents import get_document
+from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
+from platform_plugin_saleor.saleor_client.metadata import MetadataRegistry
+from platform_plugin_saleor.saleor_client.metrics import MetricsSink, OperationMetrics, current_operation_metrics
+from platform_plugin_saleor.saleor_client.mutations import (
+    ACCOUNT_REGISTER,
+    ATTACH_CHECKOUT_CUSTOMER,
+    CREATE_CHECKOUT,
+    CREATE_COURSE_PRODUCT,
+    CREATE_COURSE_PRODUCTS_BULK,
+    CREATE_PRODUCT_ATTRIBUTES,
+    CREATE_PRODUCT_TYPE,
+    CREATE_TOKEN,
+    FULLFILL_ORDER,
+    UPDATE_COURSE_PRODUCT,
+)
+from platform_plugin_saleor.saleor_client.queries import (
+    GET_PRODUCT_ATTRIBUTES,
+    GET_PRODUCT_BY_EXTERNAL_REFERENCE,
+    GET_PRODUCT_TYPES,
+    GET_PRODUCT_VARIANT,
+    GET_USER,
+    GET_WAREHOUSES,
+)
+from platform_plugin_saleor.saleor_client.retry import RetryPolicy
+from platform_plugin_saleor.saleor_client.transport import PooledClientSession, SaleorPoolConfig
+from platform_plugin_saleor.saleor_client.utils import (
+    extract_errors,
+    generate_saleor_product_attribute_data,
+    iter_edges_and_nodes,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class AsyncSaleorApiClient:
+    """Asynchronous client for interacting with the Saleor GraphQL API."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        timeout: int = None,
+        pool_config: SaleorPoolConfig = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        metadata: MetadataRegistry = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        metrics_sink: MetricsSink = None,
+        limiter: AdaptiveLimiter = None,
+    ):
+        """
+        Initialize the AsyncSaleorApiClient.
+
+        Args:
+            base_url (str): The Saleor API URL.
+            token (str): The Saleor API token.
+            timeout (int): Request timeout in seconds.
+            pool_config (SaleorPoolConfig, optional): Connection pool settings of the
+                long-lived session. If not provided, uses the SaleorPoolConfig defaults.
+            page_size (int): Number of nodes requested per page by list queries.
+            metadata (MetadataRegistry, optional): Registry caching product type, attribute
+                and warehouse IDs. If not provided, uses an in-process registry.
+            retry_policy (RetryPolicy, optional): Retry settings for transient failures.
+                If not provided, uses the RetryPolicy defaults.
+            circuit_breaker (CircuitBreaker, optional): Breaker failing calls fast while
+                Saleor is unavailable. If not provided, uses the breaker shared by every
+                client of the same URL.
+            metrics_sink (MetricsSink, optional): Destination of per-operation latency,
+                payload size, retry and error metrics. If not provided, nothing is measured.
+            limiter (AdaptiveLimiter, optional): Adaptive limit on the requests in flight.
+                If not provided, requests are only bounded by the connection pool.
+        """
+        self.base_url = base_url
+        self.token = token
+        self.page_size = page_size
+        self.metadata = metadata or MetadataRegistry()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(base_url)
+        self.metrics_sink = metrics_sink
+        self.limiter = limiter
+        self.session = PooledClientSession(
+            url=self.base_url,
+            headers={"Authorization": f"Bearer {self.token}"},
+            timeout=timeout,
+            pool_config=pool_config,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the session and release every pooled connection.
+        """
+        await self.session.close()
+
+    async def execute(self, query: str, variables: dict, retry: bool = None):
+        """
+        Execute a GraphQL query or mutation.
+
+        Transient failures are retried according to the client retry policy. Queries
+        are retried by default, mutations only if the policy or the caller opts in.
+
+        Args:
+            query (str): The GraphQL query or mutation string.
+            variables (dict): Variables to pass to the query or mutation.
+            retry (bool, optional): Force retries on or off for this call.
+
+        Returns:
+            dict: The response data from the Saleor API.
+
+        Raises:
+            GraphQLError: If the API response contains errors.
+        """
+        compiled = get_document(query)
+
+        if self.metrics_sink is None:
+            return self._check_errors(compiled, await self._send(compiled, variables, retry))
+
+        metrics = OperationMetrics(
+            operation_name=compiled.operation_name,
+            operation_type=compiled.operation_type,
+        )
+        # The transport counts the bytes of the request and response bodies in the metrics.
+        token = current_operation_metrics.set(metrics)
+
+        try:
+            response_data = self._check_errors(compiled, await self._send(compiled, variables, retry, metrics))
+        except Exception as exc:
+            metrics.finish(exc)
+            raise
+        else:
+            metrics.finish()
+        finally:
+            current_operation_metrics.reset(token)
+            self._record_metrics(metrics)
+
+        return response_data
+
+    @staticmethod
+    def _check_errors(compiled, response_data: dict) -> dict:
+        """
+        Raise the errors reported in the payload of an operation.
+
+        Mutation payloads are only inspected under the root field of the mutation. Queries
+        may select several root fields, so each of them is inspected, without walking the
+        nodes they return.
+        """
+        root_field = compiled.root_field if compiled.operation_type == "mutation" else None
+
+        if errors := extract_errors(response_data, root_field=root_field):
+            raise GraphQLError(
+                errors=errors,
+                response_data=response_data,
+            )
+
+        return response_data
+
+    def _record_metrics(self, metrics: OperationMetrics):
+        try:
+            self.metrics_sink.record(metrics)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to record Saleor metrics for %s.", metrics.operation_name)
+
+    async def execute_many(self, operations, retry: bool = None, batch_size: int = DEFAULT_BATCH_SIZE) -> list:
+        """
+        Execute several GraphQL queries or mutations, packed into batched requests.
+
+        Operations are sent ``batch_size`` at a time, one HTTP request per batch. Each
+        operation succeeds or fails on its own: GraphQL errors and mutation errors are
+        reported in its result instead of being raised. A batch containing a mutation is
+        only retried if the policy or the caller opts in, as with ``execute``.
+
+        Args:
+            operations: Iterable of ``(query, variables)`` tuples.
+            retry (bool, optional): Force retries on or off for these calls.
+            batch_size (int): Maximum number of operations per request.
+
+        Returns:
+            list: An OperationResult per operation, in order.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        results = []
+
+        for batch in iter_batches(operations, batch_size):
+            results.extend(await self._execute_batch(batch, retry))
+
+        return results
+
+    async def _execute_batch(self, batch: list, retry: bool = None) -> list:
+        compiled_batch = [get_document(query) for query, _ in batch]
+        payload = [
+            {
+                "query": query,
+                "variables": variables,
+                "operationName": compiled.operation_name,
+            }
+            for (query, variables), compiled in zip(batch, compiled_batch)
+        ]
+        operation_type = (
+            "mutation"
+            if any(compiled.operation_type == "mutation" for compiled in compiled_batch)
+            else "query"
+        )
+        metrics = None
+
+        if self.metrics_sink is not None:
+            metrics = OperationMetrics(operation_name="batch", operation_type=operation_type)
+
+        token = current_operation_metrics.set(metrics)
+
+        try:
+            responses = await self._send_with_retry(
+                operation_type,
+                f"batch of {len(batch)}",
+                lambda: self.session.execute_batch(payload),
+                retry,
+                metrics,
+            )
+        except Exception as exc:
+            if metrics:
+                metrics.finish(exc)
+            raise
+        else:
+            if metrics:
+                metrics.finish()
+        finally:
+            current_operation_metrics.reset(token)
+
+            if metrics:
+                self._record_metrics(metrics)
+
+        return [
+            self._get_operation_result(compiled, response)
+            for compiled, response in zip(compiled_batch, responses)
+        ]
+
+    def _get_operation_result(self, compiled, response: dict) -> OperationResult:
+        data = response.get("data")
+
+        if response.get("errors"):
+            return OperationResult(data, GraphQLError(errors=response["errors"], response_data=data))
+
+        try:
+            self._check_errors(compiled, data or {})
+        except GraphQLError as exc:
+            return OperationResult(data, exc)
+
+        return OperationResult(data)
+
+    async def _send(
+        self,
+        compiled,
+        variables: dict,
+        retry: bool = None,
+        metrics: OperationMetrics = None,
+    ) -> dict:
+        """
+        Send a parsed operation, retrying transient failures with backoff.
+        """
+        return await self._send_with_retry(
+            compiled.operation_type,
+            compiled.operation_name,
+            lambda: self.session.execute(compiled.document, variables),
+            retry,
+            metrics,
+        )
+
+    async def _send_with_retry(
+        self,
+        operation_type: str,
+        operation_name: str,
+        request,
+        retry: bool = None,
+        metrics: OperationMetrics = None,
+    ):
+        """
+        Await a request, retrying transient failures with backoff.
+
+        Every attempt goes through the circuit breaker, which counts the failures of Saleor,
+        e.g. a 500, and raises CircuitOpenError instead of calling Saleor while it is open.
+        Client and GraphQL errors neither count as failures nor as successes.
+        """
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        max_attempts = policy.max_attempts if policy.should_retry(operation_type, retry) else 1
+        attempt = 1
+
+        while True:
+            breaker.before_call()
+
+            try:
+                response_data = await self._attempt(request)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if not policy.is_server_failure(exc):
+                    breaker.release()
+                    raise
+
+                breaker.record_failure()
+
+                if not policy.is_transient(exc):
+                    raise
+
+                if attempt >= max_attempts:
+                    raise
+
+                delay = policy.get_delay(attempt, exc)
+                logger.warning(
+                    "Saleor %s %s failed (attempt %s of %s), retrying in %.2fs: %r",
+                    operation_type,
+                    operation_name,
+                    attempt,
+                    max_attempts,
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+                if metrics:
+                    metrics.retries += 1
+            else:
+                breaker.record_success()
+                return response_data
+
+    async def _attempt(self, request):
+        """
+        Await a single attempt of a request, within the adaptive limit if any.
+
+        The latency of the attempt, and whether it failed transiently, adjust the limit.
+        """
+        limiter = self.limiter
+
+        if limiter is None:
+            return await request()
+
+        await limiter.acquire()
+        started_at = time.monotonic()
+
+        try:
+            response_data = await request()
+        except asyncio.CancelledError:
+            limiter.release()
+            raise
+        except Exception as exc:
+            limiter.release(time.monotonic() - started_at, overloaded=self.retry_policy.is_transient(exc))
+            raise
+
+        limiter.release(time.monotonic() - started_at)
+
+        return response_data
+
+    def metadata_key(self, kind: str, name: str = "") -> str:
+        """
+        Build the metadata registry key of an entity of this Saleor instance.
+
+        Args:
+            kind (str): Kind of entity, e.g. 'product_type_id'.
+            name (str): Name of the entity, if any.
+
+        Returns:
+            str: The registry key.
+        """
+        return f"{self.base_url}|{kind}|{name}"
+
+    async def paginate(self, query: str, variables: dict = None, page_size: int = None):
+        """
+        Lazily iterate over every node of a paginated list query.
+
+        Pages are requested one at a time following ``pageInfo.endCursor``, so only a
+        single page is held in memory. The query must accept ``$limit`` and ``$after``
+        variables and select ``pageInfo { hasNextPage, endCursor }`` on its root field.
+
+        Args:
+            query (str): The GraphQL list query string.
+            variables (dict, optional): Extra variables to pass to the query.
+            page_size (int, optional): Number of nodes per page. Defaults to the client page size.
+
+        Yields:
+            dict: Each node of the connection, across all pages.
+
+        Raises:
+            GraphQLError: If the API response contains errors.
+        """
+        root_field = get_document(query).root_field
+        variables = {
+            **(variables or {}),
+            "limit": page_size or self.page_size,
+        }
+        after = None
+
+        while True:
+            response = await self.execute(query, {**variables, "after": after})
+            connection = response.get(root_field) or {}
+
+            for node in iter_edges_and_nodes(connection):
+                yield node
+
+            page_info = connection.get("pageInfo") or {}
+
+            if not page_info.get("hasNextPage"):
+                return
+
+            after = page_info.get("endCursor")
+
+    async def find_node(
+        self,
+        query: str,
+        field: str,
+        value,
+        variables: dict = None,
+        page_size: int = None,
+    ):
+        """
+        Return the first node of a paginated list query whose field matches a value.
+
+        Stops requesting pages as soon as the node is found.
+
+        Args:
+            query (str): The GraphQL list query string.
+            field (str): The node field to compare.
+            value: The value to look for.
+            variables (dict, optional): Extra variables to pass to the query.
+            page_size (int, optional): Number of nodes per page. Defaults to the client page size.
+
+        Returns:
+            dict or None: The matching node if found, otherwise None.
+        """
+        async with aclosing(self.paginate(query, variables, page_size)) as nodes:
+            async for node in nodes:
+                if node.get(field) == value:
+                    return node
+
+        return None
+
+    async def find_node_by_name(self, query: str, name: str):
+        """
+        Return the node of a list query with the given name, filtering on the Saleor side.
+
+        The entity is first looked up by the slug Saleor derives from its name, which
+        returns at most one node. Names whose slug differs from the Django slug (e.g.
+        non-ASCII names) fall back to Saleor's search filter. Either way only matching
+        nodes travel over the network, regardless of the catalog size.
+
+        Args:
+            query (str): A GraphQL list query accepting a ``$filter`` with ``slugs`` and ``search``.
+            name (str): The exact name to look for.
+
+        Returns:
+            dict or None: The matching node if found, otherwise None.
+        """
+        node = await self.find_node(
+            query, "name", name, {"filter": {"slugs": [slugify(name)]}}, page_size=1,
+        )
+
+        if node is None:
+            node = await self.find_node(query, "name", name, {"filter": {"search": name}})
+
+        return node
+
+    async def create_product_attributes(self, config: SaleorConfig = None):
+        """
+        Create product attributes in Saleor using the provided configuration.
+
+        Args:
+            config (SaleorConfig, optional): The configuration for product attributes.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+
+        Returns:
+            dict: The response data from the Saleor API.
+
+        Raises:
+            GraphQLError: If the API response contains errors.
+        """
+        config = config or get_default_config()
+
+        attributes_data = [
+            generate_saleor_product_attribute_data(
+                config.model,
+                attrb.model_attribute,
+                attrb.product_attribute,
+            )
+            for attrb in config.attributes_mapping
+        ]
+
+        variables = {"attributes": attributes_data}
+        query = CREATE_PRODUCT_ATTRIBUTES
+
+        response = await self.execute(query, variables)
+        await self.metadata.ainvalidate(self.metadata_key("attribute_ids"))
+
+        return response
+
+    async def create_product_type(self, config: SaleorConfig = None):
+        """
+        Create a product type in Saleor using the provided configuration.
+
+        Args:
+            config (SaleorConfig, optional): The configuration for the product type.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+
+        Returns:
+            dict: The created product type data.
+
+        Raises:
+            ValueError: If the product type already exists.
+            GraphQLError: If the API response contains errors.
+        """
+        config = config or get_default_config()
+        type_name = config.product_type_name
+
+        await self.metadata.ainvalidate(self.metadata_key("attribute_ids"))
+        attributes_ids, product_type_id = await asyncio.gather(
+            self.get_attribute_ids(),
+            self.get_product_type_id(type_name),
+        )
+
+        if product_type_id:
+            message = f"Product type '{type_name}' already exists."
+            logger.error(message)
+            raise ValueError(message)
+
+        variables = {
+            "input": {
+                "name": type_name,
+                "hasVariants": True,
+                "isShippingRequired": False,
+                "productAttributes": attributes_ids,
+            }
+        }
+
+        response = await self.execute(CREATE_PRODUCT_TYPE, variables)
+        product_type = response.get("productTypeCreate", {}).get(
+            "productType", {}
+        )
+
+        return product_type
+
+    async def create_course_product(self, course, config: SaleorConfig = None):
+        """
+        Create a course product in Saleor based on the given course instance.
+
+        Args:
+            course: The course object containing product data.
+            config (SaleorConfig, optional): The configuration for the course product.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+
+        Returns:
+            dict: The response data from the Saleor API.
+
+        Raises:
+            ValueError: If the product type does not exist.
+            GraphQLError: If the API response contains errors.
+        """
+        config = config or get_default_config()
+        product_type_id = await self.get_course_product_type_id(config)
+
+        variables = {
+            "input": self.get_course_product_input(course, product_type_id, config),
+        }
+
+        return await self.execute(CREATE_COURSE_PRODUCT, variables)
+
+    async def create_course_products_bulk(
+        self,
+        courses,
+        config: SaleorConfig = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict:
+        """
+        Create the products of many courses with Saleor's productBulkCreate.
+
+        Courses are sent ``batch_size`` at a time. Saleor rejects only the failed rows
+        of a batch, so every course succeeds or fails on its own. The courses are read
+        on the event loop, so pass already evaluated objects rather than a queryset.
+
+        Args:
+            courses: Iterable of course objects containing product data.
+            config (SaleorConfig, optional): The configuration for the course products.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+            batch_size (int): Maximum number of products per productBulkCreate call.
+
+        Returns:
+            dict: An OperationResult per course ID, in the order of the courses. Its data
+                is the created product.
+
+        Raises:
+            ValueError: If the product type does not exist or the batch size is not positive.
+        """
+        config = config or get_default_config()
+        product_type_id = await self.get_course_product_type_id(config)
+        serializer = config.product_serializer
+
+        return await self._create_products_in_batches(
+            courses,
+            batch_size,
+            lambda batch: [serializer.serialize(course, product_type_id) for course in batch],
+        )
+
+    async def create_course_product_rows_bulk(
+        self,
+        rows,
+        config: SaleorConfig = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict:
+        """
+        Create the products of many courses from ``values_list`` rows.
+
+        Columnar alternative to ``create_course_products_bulk``: the rows hold the values
+        of ``config.product_serializer.row_fields`` and each batch is serialized column by
+        column. The products sent to Saleor are the same.
+
+        Args:
+            rows: Iterable of ``values_list`` tuples, one per course.
+            config (SaleorConfig, optional): The configuration for the course products.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+            batch_size (int): Maximum number of products per productBulkCreate call.
+
+        Returns:
+            dict: An OperationResult per course ID, in the order of the rows. Its data
+                is the created product.
+
+        Raises:
+            ValueError: If the product type does not exist or the batch size is not positive.
+        """
+        config = config or get_default_config()
+        product_type_id = await self.get_course_product_type_id(config)
+        serializer = config.product_serializer
+
+        return await self._create_products_in_batches(
+            rows,
+            batch_size,
+            lambda batch: serializer.serialize_rows(batch, product_type_id),
+        )
+
+    async def upsert_course_products(
+        self,
+        courses,
+        config: SaleorConfig = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict:
+        """
+        Create the products of courses missing in Saleor and update the others.
+
+        Products are matched by external reference. For each batch, the existing
+        products are looked up in a single batched request, updated with batched
+        productUpdate mutations and the missing ones are created with productBulkCreate.
+
+        Args:
+            courses: Iterable of course objects containing product data. They are read on
+                the event loop, so pass already evaluated objects rather than a queryset.
+            config (SaleorConfig, optional): The configuration for the course products.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+            batch_size (int): Maximum number of courses per batch.
+
+        Returns:
+            dict: An OperationResult per course ID, in the order of the courses. Its data
+                is the created or updated product.
+
+        Raises:
+            ValueError: If the product type does not exist or the batch size is not positive.
+        """
+        config = config or get_default_config()
+        product_type_id = await self.get_course_product_type_id(config)
+        serializer = config.product_serializer
+
+        return await self._create_products_in_batches(
+            courses,
+            batch_size,
+            lambda batch: [serializer.serialize(course, product_type_id) for course in batch],
+            self._upsert_products,
+        )
+
+    async def upsert_course_product_rows(
+        self,
+        rows,
+        config: SaleorConfig = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict:
+        """
+        Create or update the products of courses from ``values_list`` rows.
+
+        Columnar alternative to ``upsert_course_products``, see
+        ``create_course_product_rows_bulk``.
+
+        Args:
+            rows: Iterable of ``values_list`` tuples, one per course.
+            config (SaleorConfig, optional): The configuration for the course products.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+            batch_size (int): Maximum number of courses per batch.
+
+        Returns:
+            dict: An OperationResult per course ID, in the order of the rows. Its data
+                is the created or updated product.
+
+        Raises:
+            ValueError: If the product type does not exist or the batch size is not positive.
+        """
+        config = config or get_default_config()
+        product_type_id = await self.get_course_product_type_id(config)
+        serializer = config.product_serializer
+
+        return await self._create_products_in_batches(
+            rows,
+            batch_size,
+            lambda batch: serializer.serialize_rows(batch, product_type_id),
+            self._upsert_products,
+        )
+
+    async def upsert_products(self, products, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+        """
+        Create or update products from already built product inputs.
+
+        Same as ``upsert_course_products``, for callers that build the inputs themselves,
+        e.g. with ``SaleorConfig.product_serializer``.
+
+        Args:
+            products: Iterable of product inputs, each with an ``externalReference``.
+            batch_size (int): Maximum number of products per batch.
+
+        Returns:
+            dict: An OperationResult per external reference, in the order of the products.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        return await self._create_products_in_batches(
+            products,
+            batch_size,
+            lambda batch: batch,
+            self._upsert_products,
+        )
+
+    async def _upsert_products(self, products: list) -> list:
+        """
+        Update the existing products, create the others and return an OperationResult per product.
+        """
+        if not products:
+            return []
+
+        lookups = await self.execute_many(
+            [
+                (GET_PRODUCT_BY_EXTERNAL_REFERENCE, {"externalReference": product["externalReference"]})
+                for product in products
+            ],
+            batch_size=len(products),
+        )
+        results = [None] * len(products)
+        existing = []
+        missing = []
+
+        for index, lookup in enumerate(lookups):
+            if not lookup.ok:
+                results[index] = lookup
+            elif (lookup.data or {}).get("product"):
+                existing.append(index)
+            else:
+                missing.append(index)
+
+        if existing:
+            updates = await self._update_products([products[index] for index in existing])
+
+            for index, update in zip(existing, updates):
+                results[index] = update
+
+        if missing:
+            created = await self._create_products_bulk([products[index] for index in missing])
+
+            for index, result in zip(missing, created):
+                results[index] = result
+
+        return results
+
+    async def update_products(self, products, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+        """
+        Update existing products with productUpdate, matched by external reference.
+
+        Only the fields present in each input are changed, and only the attributes listed
+        in its ``attributes`` are, so an input can carry just what changed since the last
+        update.
+
+        Args:
+            products: Iterable of full or partial product inputs, each with an
+                ``externalReference``.
+            batch_size (int): Maximum number of products per batch.
+
+        Returns:
+            dict: An OperationResult per external reference, in the order of the products.
+                Its data is the updated product.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        return await self._create_products_in_batches(
+            products,
+            batch_size,
+            lambda batch: batch,
+            self._update_products,
+        )
+
+    async def _update_products(self, products: list) -> list:
+        """
+        Send a batched productUpdate per product and return an OperationResult per product.
+        """
+        if not products:
+            return []
+
+        updates = await self.execute_many(
+            [
+                (
+                    UPDATE_COURSE_PRODUCT,
+                    {
+                        "externalReference": product["externalReference"],
+                        # The product type of a product cannot be changed.
+                        "input": {key: value for key, value in product.items() if key != "productType"},
+                    },
+                )
+                for product in products
+            ],
+            batch_size=len(products),
+        )
+
+        return [
+            OperationResult(((update.data or {}).get("productUpdate") or {}).get("product"), update.error)
+            for update in updates
+        ]
+
+    async def _create_products_in_batches(
+        self,
+        items,
+        batch_size: int,
+        build_products,
+        send_products=None,
+    ) -> dict:
+        """
+        Build and send the products of items, a productBulkCreate per batch by default.
+        """
+        send_products = send_products or self._create_products_bulk
+        results = {}
+
+        for batch in iter_batches(items, batch_size):
+            products = build_products(batch)
+            batch_results = await send_products(products)
+
+            for product, result in zip(products, batch_results):
+                results[product["externalReference"]] = result
+
+        return results
+
+    async def _create_products_bulk(self, products: list) -> list:
+        """
+        Send a single productBulkCreate and return an OperationResult per product.
+        """
+        item_errors = {}
+        batch_errors = []
+
+        try:
+            response = await self.execute(CREATE_COURSE_PRODUCTS_BULK, {"products": products})
+        except GraphQLError as exc:
+            response = exc.response_data or {}
+            item_errors = exc.item_errors
+            batch_errors = [error for error in exc.errors if "index" not in error]
+
+        bulk_results = (response.get("productBulkCreate") or {}).get("results") or []
+        results = []
+
+        for index, product_input in enumerate(products):
+            bulk_result = (bulk_results[index] if index < len(bulk_results) else None) or {}
+            product = bulk_result.get("product")
+            errors = item_errors.get(index) or batch_errors
+
+            if not errors and not product:
+                errors = [{"message": f"No product created for {product_input['externalReference']}."}]
+
+            if errors:
+                results.append(OperationResult(product, GraphQLError(errors=errors, response_data=bulk_result)))
+            else:
+                results.append(OperationResult(product))
+
+        return results
+
+    async def get_course_product_type_id(self, config: SaleorConfig = None) -> str:
+        """
+        Retrieve the ID of the product type of course products.
+
+        Args:
+            config (SaleorConfig, optional): The configuration for the course products.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+
+        Returns:
+            str: The ID of the product type.
+
+        Raises:
+            ValueError: If the product type does not exist.
+        """
+        config = config or get_default_config()
+        product_type_id = await self.get_product_type_id(config.product_type_name)
+
+        if not product_type_id:
+            message = f"Product type '{config.product_type_name}' not found."
+            logger.error(message)
+            raise ValueError(message)
+
+        return product_type_id
+
+    def get_course_product_input(self, course, product_type_id: str, config: SaleorConfig = None) -> dict:
+        """
+        Build the Saleor product input of a course, mapping its attributes.
+
+        The attribute formatters are compiled once per configuration, see
+        ``SaleorConfig.product_serializer``.
+
+        Args:
+            course: The course object containing product data.
+            product_type_id (str): The ID of the course product type.
+            config (SaleorConfig, optional): The configuration for the course product.
+                If not provided, uses EdxCourseOverviewSaleorConfig.
+
+        Returns:
+            dict: The input accepted by productCreate and productBulkCreate.
+        """
+        config = config or get_default_config()
+
+        return config.product_serializer.serialize(course, product_type_id)
+
+    async def get_attribute_ids(self):
+        """
+        Retrieve all product attribute IDs from Saleor.
+
+        The IDs are cached in the metadata registry.
+
+        Returns:
+            list: A list of attribute IDs.
+        """
+        return await self.metadata.get_or_load(
+            self.metadata_key("attribute_ids"),
+            self._fetch_attribute_ids,
+        )
+
+    async def _fetch_attribute_ids(self):
+        attribute_ids = [
+            attr.get("id")
+            async for attr in self.paginate(GET_PRODUCT_ATTRIBUTES)
+            if attr.get("id")
+        ]
+
+        return attribute_ids
+
+    async def get_product_type_id(self, product_type_name: str):
+        """
+        Retrieve the ID of a product type by its name.
+
+        The ID is cached in the metadata registry once found.
+
+        Args:
+            product_type_name (str): The name of the product type.
+
+        Returns:
+            str or None: The ID of the product type if found, otherwise None.
+        """
+        async def fetch_product_type_id():
+            product_type = await self.find_node_by_name(GET_PRODUCT_TYPES, product_type_name)
+            return product_type.get("id") if product_type else None
+
+        return await self.metadata.get_or_load(
+            self.metadata_key("product_type_id", product_type_name),
+            fetch_product_type_id,
+        )
+
+    async def get_product_variant(self, sku: str) -> dict:
+        """
+        TO-DO
+        """
+        variables = {
+            "sku": sku,
+        }
+        return await self.execute(GET_PRODUCT_VARIANT, variables)
+
+    async def get_user_by_email(self, email) -> dict:
+        """
+        TO-DO
+        """
+        variables = {
+            "email": email,
+        }
+        return await self.execute(GET_USER, variables)
+
+    async def create_checkout(self, email: str, product_variants: list) -> dict:
+        """
+        TO-DO
+        """
+        lines = [{"quantity": 1, "variantId": variant["id"]} for variant in product_variants]
+        variables = {
+            "input": {
+                "email": email,
+                "lines": lines,
+            }
+        }
+        return await self.execute(CREATE_CHECKOUT, variables)
+
+    async def attach_customer(self, customer_id: str, checkout_id: str) -> dict:
+        """
+        TO-DO
+        """
+        variables = {
+            "id": checkout_id,
+            "customerId": customer_id,
+        }
+        return await self.execute(ATTACH_CHECKOUT_CUSTOMER, variables)
+
+    async def account_register(self, first_name: str, last_name: str, email: str, password: str) -> dict:
+        """
+        TO-DO
+        """
+        variables = {
+            "input": {
+                "firstName": first_name,
+                "lastName": last_name,
+                "email": email,
+                "password": password
+
+            }
+        }
+        return await self.execute(ACCOUNT_REGISTER, variables)
+
+    async def create_token(self, email: str, password: str) -> dict:
+        """
+        TO-DO
+        """
+        variables = {
+            "email": email,
+            "password": password
+        }
+        return await self.execute(CREATE_TOKEN, variables)
+
+    async def get_warehouse_by_name(self, warehouse_name: str = "Default Warehouse"):
+        """
+        Retrieve the warehouse data by its name.
+
+        The warehouse is cached in the metadata registry once found.
+
+        Args:
+            warehouse_name (str): The name of the warehouse to search for.
+
+        Returns:
+            dict or None: The warehouse data if found, otherwise None.
+        """
+        return await self.metadata.get_or_load(
+            self.metadata_key("warehouse", warehouse_name),
+            lambda: self.find_node_by_name(GET_WAREHOUSES, warehouse_name),
+        )
+
+    async def fulfill_order(
+        self,
+        order_id: str,
+        warehouse_id: str,
+        lines: list,
+        notify_customer: bool = False,
+    ):
+        """
+        Fulfill an order in Saleor.
+
+        Args:
+            order_id (str): The ID of the order to fulfill.
+            warehouse_id (str): The ID of the warehouse to use for fulfillment.
+            lines (list): A list of line items to fulfill.
+            notify_customer (bool): Whether to notify the customer.
+
+        Returns:
+            dict: The response data from the Saleor API.
+
+        Raises:
+            GraphQLError: If the API response contains errors.
+        """
+        formatted_lines = []
+
+        for line in lines:
+            formatted_line = {
+                "orderLineId": line.get("id"),
+                "stocks": [
+                    {
+                        "quantity": line.get("quantity", 1),
+                        "warehouse": warehouse_id,
+                    }
+                ],
+            }
+            formatted_lines.append(formatted_line)
+
+        variables = {
+            "input": {
+                "lines": formatted_lines,
+                "notifyCustomer": notify_customer,
+                "allowStockToBeExceeded": True,
+            },
+            "order": order_id,
+        }
+
+        response_data = await self.execute(FULLFILL_ORDER, variables)
+
+        return response_data.get("orderFulfill")
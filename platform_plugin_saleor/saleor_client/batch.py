@@ -0,0 +1,55 @@
+"""Batching of Saleor GraphQL operations.
+
+Saleor accepts a JSON list of operations in a single HTTP request and answers with one
+result per operation. ``AsyncSaleorApiClient.execute_many`` packs operations into such
+requests, so bulk flows pay one round trip per batch instead of one per operation. Each
+operation succeeds or fails on its own, which is reported by an OperationResult.
+"""
+
+from dataclasses import dataclass
+from itertools import islice
+
+from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
+
+DEFAULT_BATCH_SIZE = 50
+
+
+@dataclass
+class OperationResult():
+    """
+    Outcome of one operation of a batch.
+
+    Args:
+        data (dict): The response data of the operation, if any.
+        error (GraphQLError): The errors reported for the operation, if any.
+    """
+    data: dict = None
+    error: GraphQLError = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+
+def iter_batches(items, batch_size: int):
+    """
+    Split an iterable into consecutive batches, consuming it lazily.
+
+    Args:
+        items: The items to split.
+        batch_size (int): Maximum number of items per batch.
+
+    Yields:
+        list: Each batch, in order.
+
+    Raises:
+        ValueError: If the batch size is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError("The batch size must be a positive integer.")
+
+    iterator = iter(items)
+
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
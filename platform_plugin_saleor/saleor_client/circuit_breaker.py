@@ -0,0 +1,146 @@
+"""Circuit breaker for Saleor API endpoints.
+
+When Saleor is slow or down, every call would otherwise hold a worker until the transport
+timeout. The breaker counts server failures per endpoint within a sliding window and,
+once a threshold is reached, opens: calls fail immediately with CircuitOpenError. After a
+recovery timeout a single trial call is let through (half-open); its outcome closes the
+circuit again or re-opens it.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+from platform_plugin_saleor.saleor_client.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Sliding-window circuit breaker with closed, open and half-open states.
+
+    The breaker is thread-safe, so a single instance can be shared by every client
+    talking to the same endpoint.
+    """
+
+    def __init__(
+        self,
+        name: str = "saleor",
+        failure_threshold: int = 5,
+        window: float = 30.0,
+        recovery_timeout: float = 30.0,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name (str): Name used in logs and errors, usually the endpoint URL.
+            failure_threshold (int): Failures within the window that open the circuit.
+            window (float): Length in seconds of the sliding failure window.
+            recovery_timeout (float): Seconds the circuit stays open before a trial call.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self._failures = deque()
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Check whether a call may go through.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial call in flight.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+
+            retry_in = self._opened_at + self.recovery_timeout - time.monotonic()
+
+            if self.state == OPEN and retry_in <= 0:
+                logger.info("Circuit breaker %s is half-open, sending a trial call.", self.name)
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+            raise CircuitOpenError(self.name, max(retry_in, 0.0))
+
+    def record_success(self):
+        """
+        Record a successful call, closing the circuit if it was the half-open trial.
+
+        Successes reported while the circuit is open come from calls sent before it opened,
+        so they are ignored.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                return
+
+            if self.state == HALF_OPEN:
+                logger.info("Circuit breaker %s is closed again.", self.name)
+
+            self.state = CLOSED
+            self._failures.clear()
+            self._trial_in_flight = False
+
+    def release(self):
+        """Let another trial call through when a half-open trial was cancelled or inconclusive."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a server failure, opening the circuit if needed."""
+        with self._lock:
+            now = time.monotonic()
+            self._failures.append(now)
+
+            while self._failures and self._failures[0] < now - self.window:
+                self._failures.popleft()
+
+            if self.state == HALF_OPEN or len(self._failures) >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(
+                        "Circuit breaker %s is open for %ss after %s failures.",
+                        self.name,
+                        self.recovery_timeout,
+                        len(self._failures),
+                    )
+
+                self.state = OPEN
+                self._opened_at = now
+                self._trial_in_flight = False
+
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: str, **kwargs) -> CircuitBreaker:
+    """
+    Return the circuit breaker shared by every client of an endpoint.
+
+    Args:
+        endpoint (str): The Saleor API URL.
+        **kwargs: CircuitBreaker settings, only used when the breaker is created.
+
+    Returns:
+        CircuitBreaker: The breaker of the endpoint.
+    """
+    with _circuit_breakers_lock:
+        if endpoint not in _circuit_breakers:
+            _circuit_breakers[endpoint] = CircuitBreaker(name=endpoint, **kwargs)
+
+        return _circuit_breakers[endpoint]
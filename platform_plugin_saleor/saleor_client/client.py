@@ -1,53 +1,49 @@
 """Saleor API client for managing course products, product types, and attributes.
 
-This module provides the SaleorApiClient class, which interacts with the Saleor GraphQL API
-to create and manage product attributes, product types, and course products. It also includes
-utility methods for querying product types and attributes.
+This module provides the SaleorApiClient class, a blocking client for the Saleor GraphQL API.
+It is a thin wrapper around AsyncSaleorApiClient: every coroutine method of the async client
+is exposed here as a regular method that runs on a long-lived background event loop, so both
+clients always offer the same operations.
 """
 
-import json
+import concurrent.futures
+import functools
+import inspect
 import logging
+import os
 
-from gql import Client, gql
-from gql.transport.aiohttp import AIOHTTPTransport
-
-from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig, SaleorConfig
-from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
-from platform_plugin_saleor.saleor_client.mutations import (
-    ACCOUNT_REGISTER,
-    ATTACH_CHECKOUT_CUSTOMER,
-    CREATE_CHECKOUT,
-    CREATE_COURSE_PRODUCT,
-    CREATE_PRODUCT_ATTRIBUTES,
-    CREATE_PRODUCT_TYPE,
-    CREATE_TOKEN,
-    FULLFILL_ORDER,
-)
-from platform_plugin_saleor.saleor_client.queries import (
-    GET_PRODUCT_ATTRIBUTES,
-    GET_PRODUCT_TYPES,
-    GET_PRODUCT_VARIANT,
-    GET_USER,
-    GET_WAREHOUSES,
-)
-from platform_plugin_saleor.saleor_client.utils import (
-    ATTRIBUTE_TYPES_MAP,
-    clean_edges_and_nodes,
-    convert_to_camel_case,
-    create_rich_text,
-    find_errors,
-    format_attribute_value,
-    generate_saleor_product_attribute_data,
-    get_model_field_type,
-)
+from platform_plugin_saleor.saleor_client.async_client import DEFAULT_PAGE_SIZE, AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.circuit_breaker import CircuitBreaker
+from platform_plugin_saleor.saleor_client.concurrency import AdaptiveLimiter
+from platform_plugin_saleor.saleor_client.metadata import MetadataRegistry
+from platform_plugin_saleor.saleor_client.metrics import MetricsSink
+from platform_plugin_saleor.saleor_client.retry import RetryPolicy
+from platform_plugin_saleor.saleor_client.transport import EventLoopThread, SaleorPoolConfig
 
 logger = logging.getLogger(__name__)
 
 
 class SaleorApiClient:
-    """Client for interacting with the Saleor GraphQL API."""
+    """
+    Client for interacting with the Saleor GraphQL API.
 
-    def __init__(self, base_url: str, token: str, timeout: int = None):
+    Methods such as ``create_course_product``, ``get_product_variant`` or ``fulfill_order``
+    are resolved from AsyncSaleorApiClient and block until the Saleor response is received.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        timeout: int = None,
+        pool_config: SaleorPoolConfig = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        metadata: MetadataRegistry = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        metrics_sink: MetricsSink = None,
+        limiter: AdaptiveLimiter = None,
+    ):
         """
         Initialize the SaleorApiClient.
 
@@ -55,351 +51,136 @@ class SaleorApiClient:
             base_url (str): The Saleor API URL.
             token (str): The Saleor API token.
             timeout (int): Request timeout in seconds.
+            pool_config (SaleorPoolConfig, optional): Connection pool settings of the
+                long-lived session. If not provided, uses the SaleorPoolConfig defaults.
+                Call ``close`` to release the pool.
+            page_size (int): Number of nodes requested per page by list queries.
+            metadata (MetadataRegistry, optional): Registry caching product type, attribute
+                and warehouse IDs. If not provided, uses an in-process registry.
+            retry_policy (RetryPolicy, optional): Retry settings for transient failures.
+                If not provided, uses the RetryPolicy defaults.
+            circuit_breaker (CircuitBreaker, optional): Breaker failing calls fast while
+                Saleor is unavailable. If not provided, uses the breaker shared by every
+                client of the same URL.
+            metrics_sink (MetricsSink, optional): Destination of per-operation latency,
+                payload size, retry and error metrics. If not provided, nothing is measured.
+            limiter (AdaptiveLimiter, optional): Adaptive limit on the requests in flight.
+                If not provided, requests are only bounded by the connection pool.
         """
         self.base_url = base_url
         self.token = token
-
-        transport = AIOHTTPTransport(
-            url=self.base_url,
-            headers={"Authorization": f"Bearer {self.token}"},
+        self.pool_config = pool_config
+        self.async_client = AsyncSaleorApiClient(
+            base_url=base_url,
+            token=token,
             timeout=timeout,
+            pool_config=pool_config,
+            page_size=page_size,
+            metadata=metadata,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            metrics_sink=metrics_sink,
+            limiter=limiter,
         )
-        self.client = Client(
-            transport=transport,
-            fetch_schema_from_transport=False,
-        )
+        self._pid = os.getpid()
+        self._loop_thread = EventLoopThread()
 
-    def execute(self, query: str, variables: dict):
+    def __getattr__(self, name: str):
         """
-        Execute a GraphQL query or mutation.
-
-        Args:
-            query (str): The GraphQL query or mutation string.
-            variables (dict): Variables to pass to the query or mutation.
+        Expose the coroutine methods of the async client as blocking methods.
 
-        Returns:
-            dict: The response data from the Saleor API.
-
-        Raises:
-            GraphQLError: If the API response contains errors.
+        Async generator methods, such as ``paginate``, are exposed as regular generators
+        that fetch the next item from the background loop on demand.
         """
-        response_data = self.client.execute(
-            gql(query),
-            variable_values=variables,
-        )
+        if name.startswith("_") or "async_client" not in self.__dict__:
+            raise AttributeError(name)
 
-        if errors := find_errors(response_data):
-            raise GraphQLError(
-                errors=errors,
-                response_data=response_data,
-            )
+        attribute = getattr(self.async_client, name)
 
-        return response_data
+        if inspect.isasyncgenfunction(attribute):
+            @functools.wraps(attribute)
+            def blocking_generator(*args, **kwargs):
+                return self._iterate(attribute(*args, **kwargs))
 
-    def create_product_attributes(self, config: SaleorConfig = None):
-        """
-        Create product attributes in Saleor using the provided configuration.
+            return blocking_generator
 
-        Args:
-            config (SaleorConfig, optional): The configuration for product attributes.
-                If not provided, uses EdxCourseOverviewSaleorConfig.
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
 
-        Returns:
-            dict: The response data from the Saleor API.
-
-        Raises:
-            GraphQLError: If the API response contains errors.
-        """
-        config = config or EdxCourseOverviewSaleorConfig()
+        @functools.wraps(attribute)
+        def blocking_method(*args, **kwargs):
+            return self.run(attribute(*args, **kwargs))
 
-        attributes_data = [
-            generate_saleor_product_attribute_data(
-                config.model,
-                attrb.model_attribute,
-                attrb.product_attribute,
-            )
-            for attrb in config.attributes_mapping
-        ]
+        return blocking_method
 
-        variables = {"attributes": attributes_data}
-        query = CREATE_PRODUCT_ATTRIBUTES
+    def __enter__(self):
+        return self
 
-        return self.execute(query, variables)
+    def __exit__(self, *args):
+        self.close()
 
-    def create_product_type(self, config: SaleorConfig = None):
+    def run(self, coro):
         """
-        Create a product type in Saleor using the provided configuration.
+        Run a coroutine of the async client on the background loop and wait for it.
 
-        Args:
-            config (SaleorConfig, optional): The configuration for the product type.
-                If not provided, uses EdxCourseOverviewSaleorConfig.
-
-        Returns:
-            dict: The created product type data.
-
-        Raises:
-            ValueError: If the product type already exists.
-            GraphQLError: If the API response contains errors.
-        """
-        config = config or EdxCourseOverviewSaleorConfig()
-        type_name = config.product_type_name
-
-        attributes_ids = self.get_attribute_ids()
-
-        if self.get_product_type_id(type_name):
-            message = f"Product type '{type_name}' already exists."
-            logger.error(message)
-            raise ValueError(message)
-
-        variables = {
-            "input": {
-                "name": type_name,
-                "hasVariants": True,
-                "isShippingRequired": False,
-                "productAttributes": attributes_ids,
-            }
-        }
-
-        response = self.execute(CREATE_PRODUCT_TYPE, variables)
-        product_type = response.get("productTypeCreate", {}).get(
-            "productType", {}
-        )
-
-        return product_type
-
-    def create_course_product(self, course, config: SaleorConfig = None):
-        """
-        Create a course product in Saleor based on the given course instance.
+        A forked worker cannot reuse the parent's event loop thread, so the loop and
+        the session are recreated the first time the client is used after a fork.
 
         Args:
-            course: The course object containing product data.
-            config (SaleorConfig, optional): The configuration for the course product.
-                If not provided, uses EdxCourseOverviewSaleorConfig.
+            coro: The coroutine to run.
 
         Returns:
-            dict: The response data from the Saleor API.
-
-        Raises:
-            ValueError: If the product type does not exist.
-            GraphQLError: If the API response contains errors.
-        """
-        config = config or EdxCourseOverviewSaleorConfig()
-        product_type_id = self.get_product_type_id(config.product_type_name)
-
-        if not product_type_id:
-            message = f"Product type '{config.product_type_name}' not found."
-            logger.error(message)
-            raise ValueError(message)
-
-        query_attributes = []
-
-        for attrb in config.attributes_mapping:
-            model_attribute = attrb.model_attribute
-            model_attribute_value = getattr(course, model_attribute, None)
-            model_attribute_type = get_model_field_type(
-                config.model, model_attribute
-            )
-
-            product_input_type = ATTRIBUTE_TYPES_MAP.get(
-                model_attribute_type, "PLAIN_TEXT"
-            )
-            product_input_key = convert_to_camel_case(
-                product_input_type.lower()
-            )
-
-            product_attribute_value = format_attribute_value(
-                product_input_key, model_attribute_value
-            )
-
-            attribute_input = {
-                "externalReference": model_attribute,
-                **product_attribute_value,
-            }
-
-            query_attributes.append(attribute_input)
-
-        description = create_rich_text(course.short_description)
-
-        variables = {
-            "input": {
-                "productType": product_type_id,
-                "name": str(course.display_name),
-                "description": json.dumps(description),
-                "attributes": query_attributes,
-                "externalReference": str(course.id),
-            }
-        }
-
-        return self.execute(CREATE_COURSE_PRODUCT, variables)
-
-    def get_attribute_ids(self):
+            Any: The value returned by the coroutine.
         """
-        Retrieve all product attribute IDs from Saleor.
+        self._check_fork()
+        return self._loop_thread.run(coro)
 
-        Returns:
-            list: A list of attribute IDs.
+    def submit(self, coro) -> concurrent.futures.Future:
         """
-        variables = {"limit": 100}
-        response = self.execute(GET_PRODUCT_ATTRIBUTES, variables)
-
-        attributes = clean_edges_and_nodes(response.get("attributes", {}))
-        attribute_ids = [
-            attr.get("id") for attr in attributes if attr.get("id")
-        ]
+        Schedule a coroutine of the async client on the background loop.
 
-        return attribute_ids
-
-    def get_product_type_id(self, product_type_name: str):
-        """
-        Retrieve the ID of a product type by its name.
+        Unlike ``run``, the caller is not blocked, so several Saleor calls can be in
+        flight at once, e.g. ``client.submit(client.async_client.get_product_variant(sku))``.
 
         Args:
-            product_type_name (str): The name of the product type.
+            coro: The coroutine to run.
 
         Returns:
-            str or None: The ID of the product type if found, otherwise None.
-        """
-        variables = {"limit": 100}
-        response = self.execute(GET_PRODUCT_TYPES, variables)
-        product_types = clean_edges_and_nodes(response.get("productTypes", {}))
-
-        for product_type in product_types:
-            if product_type.get("name") == product_type_name:
-                return product_type.get("id")
-
-        return None
-
-    def get_product_variant(self, sku: str) -> dict:
-        """
-        TO-DO
-        """
-        variables = {
-            "sku": sku,
-        }
-        return self.execute(GET_PRODUCT_VARIANT, variables)
-
-    def get_user_by_email(self, email) -> dict:
-        """
-        TO-DO
+            concurrent.futures.Future: The future of the coroutine result.
         """
-        variables = {
-            "email": email,
-        }
-        return self.execute(GET_USER, variables)
+        self._check_fork()
+        return self._loop_thread.submit(coro)
 
-    def create_checkout(self, email: str, product_variants: list) -> dict:
-        """
-        TO-DO
-        """
-        lines = [{"quantity": 1, "variantId": variant["id"]} for variant in product_variants]
-        variables = {
-            "input": {
-                "email": email,
-                "lines": lines,
-            }
-        }
-        return self.execute(CREATE_CHECKOUT, variables)
-
-    def attach_customer(self, customer_id: str, checkout_id: str) -> dict:
-        """
-        TO-DO
-        """
-        variables = {
-            "id": checkout_id,
-            "customerId": customer_id,
-        }
-        return self.execute(ATTACH_CHECKOUT_CUSTOMER, variables)
+    def _check_fork(self):
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._loop_thread = EventLoopThread()
+            self.async_client.session.discard()
 
-    def account_register(self, first_name: str, last_name: str, email: str, password: str) -> dict:
-        """
-        TO-DO
+    def _iterate(self, async_generator):
         """
-        variables = {
-            "input": {
-                "firstName": first_name,
-                "lastName": last_name,
-                "email": email,
-                "password": password
-
-            }
-        }
-        return self.execute(ACCOUNT_REGISTER, variables)
-
-    def create_token(self, email: str, password: str) -> dict:
+        Drive an async generator from the background loop, one item at a time.
         """
-        TO-DO
-        """
-        variables = {
-            "email": email,
-            "password": password
-        }
-        return self.execute(CREATE_TOKEN, variables)
-
-    def get_warehouse_by_name(self, warehouse_name: str = "Default Warehouse"):
-        """
-        Retrieve the warehouse data by its name.
+        async def next_item():
+            return await anext(async_generator)
 
-        Args:
-            warehouse_name (str): The name of the warehouse to search for.
+        try:
+            while True:
+                try:
+                    yield self.run(next_item())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(async_generator.aclose())
 
-        Returns:
-            dict or None: The warehouse data if found, otherwise None.
+    def close(self):
         """
-        variables = {"limit": 100}
-        response = self.execute(GET_WAREHOUSES, variables)
-        warehouses = clean_edges_and_nodes(response.get("warehouses", {}))
-
-        for warehouse in warehouses:
-            if warehouse.get("name") == warehouse_name:
-                return warehouse
-
-        return None
+        Close the session and stop the background event loop.
 
-    def fulfill_order(
-        self,
-        order_id: str,
-        warehouse_id: str,
-        lines: list,
-        notify_customer: bool = False,
-    ):
+        Safe to call several times.
         """
-        Fulfill an order in Saleor.
-
-        Args:
-            order_id (str): The ID of the order to fulfill.
-            warehouse_id (str): The ID of the warehouse to use for fulfillment.
-            lines (list): A list of line items to fulfill.
-            notify_customer (bool): Whether to notify the customer.
+        if os.getpid() != self._pid or not self._loop_thread.is_running:
+            return
 
-        Returns:
-            dict: The response data from the Saleor API.
-
-        Raises:
-            GraphQLError: If the API response contains errors.
-        """
-        formatted_lines = []
-
-        for line in lines:
-            formatted_line = {
-                "orderLineId": line.get("id"),
-                "stocks": [
-                    {
-                        "quantity": line.get("quantity", 1),
-                        "warehouse": warehouse_id,
-                    }
-                ],
-            }
-            formatted_lines.append(formatted_line)
-
-        variables = {
-            "input": {
-                "lines": formatted_lines,
-                "notifyCustomer": notify_customer,
-                "allowStockToBeExceeded": True,
-            },
-            "order": order_id,
-        }
-
-        response_data = self.execute(FULLFILL_ORDER, variables)
-
-        return response_data.get("orderFulfill")
+        self._loop_thread.run(self.async_client.close())
+        self._loop_thread.stop()
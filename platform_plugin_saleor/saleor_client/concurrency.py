@@ -0,0 +1,110 @@
+"""Adaptive concurrency limit for Saleor API calls.
+
+A fixed number of in-flight requests is either too timid when Saleor is idle or overloads
+it during peak hours. AdaptiveLimiter follows an AIMD scheme, as TCP congestion control
+does: the limit grows by one request per round of healthy responses and is halved when a
+request times out, is rate limited (429) or fails with a 5xx, or when latency rises above
+a target. Bulk jobs then run as fast as Saleor allows without manual tuning.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveLimiter:
+    """
+    Additive-increase, multiplicative-decrease limit on concurrent Saleor requests.
+
+    The limiter is not thread-safe: it must only be used from the event loop of the
+    client it is given to.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_target: float = 2.0,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit (int): Number of requests allowed in flight at first.
+            min_limit (int): The limit never goes below this value.
+            max_limit (int): The limit never goes above this value.
+            latency_target (float): Seconds above which a response counts as a sign of
+                overload, like an error.
+            decrease_factor (float): Factor applied to the limit on overload.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._last_decrease_at = 0.0
+        self._waiters = deque()
+
+    @property
+    def limit(self) -> int:
+        """Number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    async def acquire(self):
+        """
+        Wait until a request may be sent.
+        """
+        if not self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted right before the cancellation: give it back.
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float = None, overloaded: bool = False):
+        """
+        Free the slot of a finished request and adjust the limit to its outcome.
+
+        Only one decrease is applied per congestion event: requests sent before the
+        last decrease do not decrease the limit again.
+
+        Args:
+            latency (float, optional): Seconds the request took. If not provided, e.g.
+                for a cancelled request, the limit is left unchanged.
+            overloaded (bool): Whether the request failed in a way that signals overload.
+        """
+        self.in_flight -= 1
+
+        if latency is not None:
+            now = time.monotonic()
+
+            if overloaded or latency > self.latency_target:
+                if now - latency >= self._last_decrease_at:
+                    self._last_decrease_at = now
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    logger.info("Saleor concurrency limit decreased to %s.", self.limit)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
@@ -1,10 +1,13 @@
 """Configuration module for mapping Django models to Saleor product types."""
 
 from dataclasses import dataclass
+from functools import cache, cached_property
 from typing import Any, List
 
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
 
+from platform_plugin_saleor.saleor_client.serializers import ProductInputSerializer
+
 
 @dataclass
 class ModelToSaleorAttribute():
@@ -33,6 +36,32 @@ class SaleorConfig():
     product_type_name: str
     attributes_mapping: List[ModelToSaleorAttribute]
 
+    @cached_property
+    def product_serializer(self) -> ProductInputSerializer:
+        """
+        The product input serializer of this configuration, compiled on first use.
+
+        Changes to ``attributes_mapping`` made afterwards are not picked up.
+        """
+        return ProductInputSerializer(self)
+
+    def get_model_fields(self) -> List[str]:
+        """
+        Return the concrete model fields read by the attributes mapping.
+
+        Useful to load only those columns, e.g. with ``QuerySet.only``.
+
+        Returns:
+            List[str]: The field names, in mapping order.
+        """
+        concrete_fields = {field.name for field in self.model._meta.concrete_fields}
+
+        return [
+            attrb.model_attribute
+            for attrb in self.attributes_mapping
+            if attrb.model_attribute in concrete_fields
+        ]
+
 
 class EdxCourseOverviewSaleorConfig(SaleorConfig):
     """
@@ -62,3 +91,16 @@ class EdxCourseOverviewSaleorConfig(SaleorConfig):
                 ModelToSaleorAttribute("language", "Language"),
             ]
         )
+
+
+@cache
+def get_default_config() -> EdxCourseOverviewSaleorConfig:
+    """
+    Return the configuration used when none is given, shared by the whole process.
+
+    Its product serializer is compiled on first use only, instead of once per call.
+
+    Returns:
+        EdxCourseOverviewSaleorConfig: The configuration of the course products.
+    """
+    return EdxCourseOverviewSaleorConfig()
@@ -0,0 +1,118 @@
+"""Registry of pre-parsed GraphQL documents for the Saleor client.
+
+Parsing a GraphQL string into a document is pure overhead once the string is known, and
+the client sends the same constants from ``queries.py`` and ``mutations.py`` over and over.
+The registry parses every constant once, when the app is ready, and the client looks the
+parsed document up by its query string on each call.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from gql import gql
+from graphql import DocumentNode, OperationDefinitionNode
+
+from platform_plugin_saleor.saleor_client import mutations, queries
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_MODULES = (queries, mutations)
+
+DOCUMENTS = {}
+
+
+@dataclass(frozen=True)
+class CompiledDocument():
+    """
+    A parsed GraphQL document and the details of its operation.
+
+    Args:
+        name (str): Name of the constant holding the document, or None for ad hoc queries.
+        document (DocumentNode): The parsed document, ready to be sent by gql.
+        operation_type (str): 'query', 'mutation' or 'subscription'.
+        operation_name (str): Name of the operation, or None for anonymous operations.
+        root_field (str): Response key of the first root field selected by the operation,
+            its alias if it has one.
+    """
+    name: str
+    document: DocumentNode
+    operation_type: str
+    operation_name: str
+    root_field: str
+
+
+def compile_document(query: str, name: str = None) -> CompiledDocument:
+    """
+    Parse a GraphQL string and extract the details of its operation.
+
+    Args:
+        query (str): The GraphQL query, mutation or subscription string.
+        name (str, optional): Name of the constant holding the string.
+
+    Returns:
+        CompiledDocument: The parsed document.
+    """
+    document = gql(query)
+    operation = next(
+        definition for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    )
+    root_selection = operation.selection_set.selections[0]
+    root_key = getattr(root_selection, "alias", None) or getattr(root_selection, "name", None)
+
+    return CompiledDocument(
+        name=name,
+        document=document,
+        operation_type=operation.operation.value,
+        operation_name=operation.name.value if operation.name else None,
+        root_field=getattr(root_key, "value", None),
+    )
+
+
+def compile_documents() -> dict:
+    """
+    Parse every GraphQL constant of the queries and mutations modules.
+
+    Calling it again is a no-op, so it can run both at import and at app ready.
+
+    Returns:
+        dict: The registry, mapping each query string to its CompiledDocument.
+    """
+    if DOCUMENTS:
+        return DOCUMENTS
+
+    for module in DOCUMENT_MODULES:
+        for name, value in vars(module).items():
+            if name.isupper() and isinstance(value, str):
+                DOCUMENTS[value] = compile_document(value, name=name)
+
+    logger.debug("Compiled %s Saleor GraphQL documents.", len(DOCUMENTS))
+
+    return DOCUMENTS
+
+
+@lru_cache(maxsize=256)
+def _compile_ad_hoc_document(query: str) -> CompiledDocument:
+    return compile_document(query)
+
+
+def get_document(query: str) -> CompiledDocument:
+    """
+    Return the parsed document for a GraphQL string.
+
+    Registered constants are served from the registry. Other strings are parsed once
+    and kept in a bounded cache.
+
+    Args:
+        query (str): The GraphQL query or mutation string.
+
+    Returns:
+        CompiledDocument: The parsed document.
+    """
+    compiled = (DOCUMENTS or compile_documents()).get(query)
+
+    if compiled is None:
+        compiled = _compile_ad_hoc_document(query)
+
+    return compiled
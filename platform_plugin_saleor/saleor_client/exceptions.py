@@ -1,7 +1,8 @@
 """Exceptions for Saleor GraphQL client."""
 
-import json
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
+
+from platform_plugin_saleor.saleor_client import json_backend
 
 
 class GraphQLError(Exception):
@@ -17,15 +18,42 @@ class GraphQLError(Exception):
         self.errors = errors
         self.response_data = response_data
 
+    @property
+    def item_errors(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Errors of the failed items of a bulk mutation, keyed by item index.
+        """
+        item_errors = {}
+
+        for error in self.errors:
+            if "index" in error:
+                item_errors.setdefault(error["index"], []).append(error)
+
+        return item_errors
+
     def __str__(self):
         errors_str = (
-            f"GraphQL errors: {json.dumps(self.errors, indent=2)}"
+            f"GraphQL errors: {json_backend.dumps(self.errors, indent=True, default=str)}"
             if self.errors
             else ""
         )
         response_data_str = (
-            f"Response data: {json.dumps(self.response_data, indent=2)}"
+            f"Response data: {json_backend.dumps(self.response_data, indent=True, default=str)}"
             if self.response_data
             else ""
         )
         return f"{errors_str}{response_data_str}"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised without calling Saleor while the circuit breaker of the endpoint is open
+    """
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(endpoint, retry_in)
+
+    def __str__(self):
+        return f"Saleor API {self.endpoint} is unavailable, retry in {self.retry_in:.1f}s."
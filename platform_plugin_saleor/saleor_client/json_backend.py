@@ -0,0 +1,60 @@
+"""JSON encoding and decoding of Saleor payloads.
+
+orjson is used when it is installed (``pip install platform-plugin-saleor[fast-json]``),
+otherwise the standard library json module. The standard library is set up to write the
+same strings as orjson, compact and with raw UTF-8, so product descriptions and content
+hashes do not change with the backend. The Saleor client, the webhook views and the HTTP
+transport all go through ``dumps`` and ``loads``.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+
+def dumps(obj, indent: bool = False, sort_keys: bool = False, default=None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: The object to serialize.
+        indent (bool): Indent the output with two spaces.
+        sort_keys (bool): Sort dictionary keys, for a stable output.
+        default: Function called for objects that cannot be serialized otherwise.
+
+    Returns:
+        str: The JSON document.
+    """
+    if orjson:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=default,
+    )
+
+
+def loads(data):
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data (str or bytes): The JSON document.
+
+    Returns:
+        Any: The deserialized object.
+    """
+    if orjson:
+        return orjson.loads(data)
+
+    return json.loads(data)
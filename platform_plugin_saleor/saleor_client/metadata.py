@@ -0,0 +1,172 @@
+"""TTL registry for Saleor metadata such as product type, attribute and warehouse IDs.
+
+These IDs almost never change, yet they are needed by nearly every catalog and fulfillment
+operation. The registry keeps them in an in-process LRU with a time to live and, optionally,
+in a Django cache shared by every worker, so each one costs a Saleor round trip once per TTL.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataRegistry:
+    """
+    In-process LRU cache with TTL, optionally backed by a Django cache.
+
+    Missing values (``None``) are never cached, so an entity created after a failed
+    lookup is found on the next call.
+    """
+
+    def __init__(
+        self,
+        ttl: int = 3600,
+        max_entries: int = 256,
+        cache_alias: str = None,
+        key_prefix: str = "saleor_metadata",
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            ttl (int): Seconds a value is kept before it is loaded again from Saleor.
+            max_entries (int): Maximum number of values kept in process.
+            cache_alias (str, optional): Alias of the Django cache shared between processes.
+                If not provided, values are only cached in process.
+            key_prefix (str): Prefix of the keys stored in the Django cache.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        """The Django cache backing the registry, or None."""
+        return caches[self.cache_alias] if self.cache_alias else None
+
+    def _cache_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{quote(key, safe='')}"
+
+    def get(self, key: str):
+        """
+        Return the in-process value of a key if it has not expired.
+
+        Args:
+            key (str): The metadata key.
+
+        Returns:
+            Any: The cached value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        """
+        Store a value in process, evicting the least recently used one when full.
+
+        Args:
+            key (str): The metadata key.
+            value: The value to store.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_load(self, key: str, loader):
+        """
+        Return the value of a key, loading it from Saleor on a miss.
+
+        Args:
+            key (str): The metadata key.
+            loader: Coroutine function, called without arguments, that fetches the value.
+
+        Returns:
+            Any: The value, or None if the loader did not find it.
+        """
+        value = self.get(key)
+
+        if value is not None:
+            return value
+
+        cache = self.cache
+
+        if cache is not None:
+            value = await cache.aget(self._cache_key(key))
+
+        if value is None:
+            value = await loader()
+
+            if value is None:
+                return None
+
+            if cache is not None:
+                await cache.aset(self._cache_key(key), value, self.ttl)
+
+        self.set(key, value)
+
+        return value
+
+    def _drop(self, key: str = None) -> list:
+        with self._lock:
+            if key is None:
+                keys = list(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key]
+                self._entries.pop(key, None)
+
+        logger.debug("Invalidated Saleor metadata keys: %s", keys)
+
+        return [self._cache_key(k) for k in keys]
+
+    def invalidate(self, key: str = None):
+        """
+        Drop a key, or every key, so the next lookup goes back to Saleor.
+
+        Without a key, only the keys held in process are deleted from the Django cache.
+        Keys stored there by other processes, or evicted from this one, stay until their
+        TTL expires, as do the in-process entries of other processes in either case.
+
+        Args:
+            key (str, optional): The metadata key to drop.
+        """
+        cache_keys = self._drop(key)
+
+        if self.cache is not None and cache_keys:
+            self.cache.delete_many(cache_keys)
+
+    async def ainvalidate(self, key: str = None):
+        """
+        Asynchronous version of ``invalidate``, for use from the async client.
+
+        Args:
+            key (str, optional): The metadata key to drop.
+        """
+        cache_keys = self._drop(key)
+
+        if self.cache is not None and cache_keys:
+            await self.cache.adelete_many(cache_keys)
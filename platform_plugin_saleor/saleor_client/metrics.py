@@ -0,0 +1,197 @@
+"""Per-operation instrumentation of Saleor API calls.
+
+AsyncSaleorApiClient records, for every GraphQL operation it executes, the operation name,
+its duration, the request and response sizes, the number of retries and the error raised,
+if any. Records are handed to a pluggable metrics sink: log lines, a statsd-like client or
+an in-memory histogram for tests and ad hoc profiling.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Metrics of the operation being executed by the current task, whose request and response
+# bodies are counted by the transport as it sends and receives them.
+current_operation_metrics = ContextVar("current_operation_metrics", default=None)
+
+
+@dataclass
+class OperationMetrics():
+    """
+    Measurements of a single Saleor GraphQL operation.
+
+    Args:
+        operation_name (str): Name of the GraphQL operation.
+        operation_type (str): 'query' or 'mutation'.
+        request_bytes (int): Size of the request bodies sent, retries included.
+        response_bytes (int): Size of the response bodies received, retries included.
+        duration (float): Seconds spent in the call, retries and backoff included.
+        retries (int): Number of attempts after the first one.
+        error (str): Class name of the exception raised, or None on success.
+    """
+    operation_name: str
+    operation_type: str
+    request_bytes: int = 0
+    response_bytes: int = 0
+    duration: float = 0.0
+    retries: int = 0
+    error: str = None
+    started_at: float = field(default_factory=time.perf_counter, repr=False)
+
+    def finish(self, error: Exception = None):
+        """
+        Record the outcome of the operation.
+
+        Args:
+            error (Exception, optional): The exception raised, if any.
+        """
+        self.duration = time.perf_counter() - self.started_at
+        self.error = type(error).__name__ if error is not None else None
+
+
+class MetricsSink:
+    """
+    Base class of the destinations of Saleor operation metrics.
+    """
+
+    def record(self, metrics: OperationMetrics):
+        """
+        Store or forward the metrics of an operation.
+
+        Args:
+            metrics (OperationMetrics): The measurements of the operation.
+        """
+        raise NotImplementedError
+
+
+class LoggingMetricsSink(MetricsSink):
+    """
+    Write one log line per Saleor operation.
+    """
+
+    def __init__(self, level: int = logging.INFO):
+        self.level = level
+
+    def record(self, metrics: OperationMetrics):
+        """Log the metrics of an operation."""
+        logger.log(
+            self.level,
+            "Saleor %s %s took %.1fms (request %sB, response %sB, retries %s, error %s)",
+            metrics.operation_type,
+            metrics.operation_name,
+            metrics.duration * 1000,
+            metrics.request_bytes,
+            metrics.response_bytes,
+            metrics.retries,
+            metrics.error,
+        )
+
+
+class StatsdMetricsSink(MetricsSink):
+    """
+    Forward metrics to a statsd-like client exposing ``timing``, ``incr`` and ``gauge``.
+    """
+
+    def __init__(self, client, prefix: str = "saleor"):
+        """
+        Initialize the sink.
+
+        Args:
+            client: The statsd-like client.
+            prefix (str): Prefix of every metric name.
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def record(self, metrics: OperationMetrics):
+        """Send the timing, sizes and counters of an operation to the statsd client."""
+        name = f"{self.prefix}.{metrics.operation_name}"
+
+        self.client.timing(f"{name}.duration", metrics.duration * 1000)
+        self.client.gauge(f"{name}.request_bytes", metrics.request_bytes)
+        self.client.gauge(f"{name}.response_bytes", metrics.response_bytes)
+        self.client.incr(f"{name}.calls")
+
+        if metrics.retries:
+            self.client.incr(f"{name}.retries", metrics.retries)
+
+        if metrics.error:
+            self.client.incr(f"{name}.errors")
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Keep every record in memory and summarize them as per-operation histograms.
+    """
+
+    def __init__(self):
+        self.records = defaultdict(list)
+
+    def record(self, metrics: OperationMetrics):
+        """Keep the metrics of an operation for the histograms and summary."""
+        self.records[metrics.operation_name].append(metrics)
+
+    def histogram(self, operation_name: str, attribute: str = "duration") -> list:
+        """
+        Return the sorted values of a measurement for an operation.
+
+        Args:
+            operation_name (str): Name of the GraphQL operation.
+            attribute (str): The OperationMetrics attribute to collect.
+
+        Returns:
+            list: The sorted values.
+        """
+        return sorted(getattr(metrics, attribute) for metrics in self.records.get(operation_name, ()))
+
+    def percentile(self, operation_name: str, percent: float, attribute: str = "duration"):
+        """
+        Return a percentile of a measurement for an operation.
+
+        Args:
+            operation_name (str): Name of the GraphQL operation.
+            percent (float): The percentile, between 0 and 100.
+            attribute (str): The OperationMetrics attribute to collect.
+
+        Returns:
+            float or None: The value at the percentile, or None without records.
+        """
+        values = self.histogram(operation_name, attribute)
+
+        if not values:
+            return None
+
+        index = min(len(values) - 1, int(len(values) * percent / 100))
+        return values[index]
+
+    def summary(self) -> dict:
+        """
+        Summarize the records of every operation, slowest total time first.
+
+        Returns:
+            dict: Per operation: calls, errors, retries, p50/p95/max duration and total bytes.
+        """
+        summary = {}
+
+        for operation_name, records in self.records.items():
+            summary[operation_name] = {
+                "calls": len(records),
+                "errors": sum(1 for metrics in records if metrics.error),
+                "retries": sum(metrics.retries for metrics in records),
+                "total_duration": sum(metrics.duration for metrics in records),
+                "p50_duration": self.percentile(operation_name, 50),
+                "p95_duration": self.percentile(operation_name, 95),
+                "max_duration": self.percentile(operation_name, 100),
+                "request_bytes": sum(metrics.request_bytes for metrics in records),
+                "response_bytes": sum(metrics.response_bytes for metrics in records),
+            }
+
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["total_duration"]))
+
+    def clear(self):
+        """Drop every record."""
+        self.records.clear()
@@ -46,6 +46,38 @@ mutation CreateCourseProduct(
 }
 """
 
+CREATE_COURSE_PRODUCTS_BULK = """
+mutation CreateCourseProductsBulk(
+    $products: [ProductBulkCreateInput!]!
+) {
+    #Take a look at ProductBulkCreateInput in Saleor GraphQL API
+    #https://docs.saleor.io/api-reference/products/inputs/product-bulk-create-input
+
+    productBulkCreate(products: $products, errorPolicy: REJECT_FAILED_ROWS) {
+        count
+        results {
+            product { id, externalReference }
+            errors { path, message, code }
+        }
+        errors { path, message, code }
+    }
+}
+"""
+
+UPDATE_COURSE_PRODUCT = """
+mutation UpdateCourseProduct(
+    $externalReference: String, $input: ProductInput!
+) {
+    #Take a look at ProductInput in Saleor GraphQL API
+    #https://docs.saleor.io/api-reference/products/inputs/product-input
+
+    productUpdate(externalReference: $externalReference, input: $input) {
+        product { id, externalReference }
+        errors { message, code, field, values }
+    }
+}
+"""
+
 CREATE_CHECKOUT = """
 mutation CreateCheckout(
     $input: CheckoutCreateInput!
@@ -2,25 +2,27 @@
 
 GET_PRODUCT_ATTRIBUTES = """
 query getAttributes(
-    $limit: Int
+    $limit: Int, $after: String
 ) {
-    attributes(first: $limit) {
+    attributes(first: $limit, after: $after) {
         edges {
             node { id, name }
         }
+        pageInfo { hasNextPage, endCursor }
     }
 }
 """
 
 GET_PRODUCT_TYPES = """
 query getProductTypes(
-    $limit: Int
+    $limit: Int, $after: String, $filter: ProductTypeFilterInput
 ) {
-    productTypes(first: $limit) {
+    productTypes(first: $limit, after: $after, filter: $filter) {
         edges {
             node { id, name }
         }
-  }
+        pageInfo { hasNextPage, endCursor }
+    }
 }
 """
 
@@ -57,6 +59,16 @@ query getProductVariant($sku: String){
         id
         sku
         name
+        product { id, externalReference }
+    }
+}
+"""
+
+GET_PRODUCT_BY_EXTERNAL_REFERENCE = """
+query getProductByExternalReference($externalReference: String){
+    product(externalReference: $externalReference) {
+        id
+        externalReference
     }
 }
 """
@@ -73,12 +85,13 @@ query getUser($email: String){
 
 GET_WAREHOUSES = """
 query getWarehouses(
-    $limit: Int
+    $limit: Int, $after: String, $filter: WarehouseFilterInput
 ) {
-    warehouses(first: $limit) {
+    warehouses(first: $limit, after: $after, filter: $filter) {
         edges {
             node { id, name }
         }
+        pageInfo { hasNextPage, endCursor }
     }
 }
 """
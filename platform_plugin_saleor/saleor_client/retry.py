@@ -0,0 +1,134 @@
+"""Retry policy for transient Saleor API failures.
+
+Transient failures (502/503/504 from a proxy, 429 rate limiting, reset connections and
+timeouts) are retried with exponential backoff and full jitter. A ``Retry-After`` header
+sent by Saleor takes precedence over the computed backoff.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+from gql.transport.exceptions import TransportServerError
+
+
+def get_retry_after(exc: Exception):
+    """
+    Return the delay requested by the ``Retry-After`` header of a failed response.
+
+    gql raises TransportServerError from the aiohttp ClientResponseError, which keeps
+    the response headers.
+
+    Args:
+        exc (Exception): The exception raised by the transport.
+
+    Returns:
+        float or None: Seconds to wait, or None if the header is missing or invalid.
+    """
+    headers = getattr(exc.__cause__, "headers", None) or {}
+    value = headers.get("Retry-After")
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryPolicy():
+    """
+    Retry settings for Saleor API calls.
+
+    Queries are always safe to repeat and are retried by default. Mutations are only
+    retried when ``retry_mutations`` is set or when the caller opts in for a call.
+
+    Args:
+        max_attempts (int): Total number of attempts, including the first one.
+        backoff_base (float): Delay in seconds of the first retry, doubled on each attempt.
+        backoff_max (float): Maximum delay in seconds between attempts, also applied to Retry-After.
+        retry_mutations (bool): Whether mutations are retried by default.
+        retry_statuses (tuple): HTTP status codes considered transient.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    retry_mutations: bool = False
+    retry_statuses: tuple = (429, 502, 503, 504)
+
+    def should_retry(self, operation_type: str, retry: bool = None) -> bool:
+        """
+        Whether an operation may be retried at all.
+
+        Args:
+            operation_type (str): 'query' or 'mutation'.
+            retry (bool, optional): Explicit choice of the caller, overriding the policy.
+
+        Returns:
+            bool: True if transient failures of the operation can be retried.
+        """
+        if retry is not None:
+            return retry
+
+        return operation_type == "query" or self.retry_mutations
+
+    def is_transient(self, exc: Exception) -> bool:
+        """
+        Whether an exception raised by the transport is worth retrying.
+
+        Args:
+            exc (Exception): The exception raised by the transport.
+
+        Returns:
+            bool: True for transient HTTP statuses, connection errors and timeouts.
+        """
+        if isinstance(exc, TransportServerError):
+            return exc.code in self.retry_statuses
+
+        return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    def is_server_failure(self, exc: Exception) -> bool:
+        """
+        Whether an exception raised by the transport shows Saleor failing, transient or not.
+
+        Args:
+            exc (Exception): The exception raised by the transport.
+
+        Returns:
+            bool: True for transient failures and 5xx HTTP statuses. Other 4xx statuses and
+            GraphQL errors are the caller's fault and return False.
+        """
+        if isinstance(exc, TransportServerError) and (exc.code is None or exc.code >= 500):
+            return True
+
+        return self.is_transient(exc)
+
+    def get_delay(self, attempt: int, exc: Exception) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 1.
+            exc (Exception): The exception raised by that attempt.
+
+        Returns:
+            float: Seconds to wait before retrying.
+        """
+        retry_after = get_retry_after(exc)
+
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
@@ -0,0 +1,184 @@
+"""Compiled serializer of Saleor product inputs.
+
+Which Saleor input type an attribute maps to, and how its value is formatted, only depends
+on the model field behind it, so it is the same for every course. ProductInputSerializer
+resolves it once per SaleorConfig, and building a product input is then a flat loop of
+bound formatters over the course attributes.
+
+For bulk syncs, ``serialize_rows`` builds the same inputs from ``values_list`` rows column
+by column, formatting each distinct value of a column only once.
+"""
+
+from platform_plugin_saleor.saleor_client import json_backend
+from platform_plugin_saleor.saleor_client.utils import (
+    ATTRIBUTE_TYPES_MAP,
+    convert_to_camel_case,
+    create_rich_text,
+    get_attribute_formatter,
+    get_model_field_type,
+)
+
+# Types whose equal values always format the same way. Equal datetimes may be in
+# different time zones and equal decimals may have different exponents, so they are
+# formatted one by one.
+DISTINCT_VALUE_TYPES = (str, bool, int, type(None))
+
+
+def map_distinct(function, values) -> list:
+    """
+    Apply a function to a sequence of values, calling it once per distinct value.
+
+    Only values of ``DISTINCT_VALUE_TYPES`` are deduplicated, and equal values share the
+    same result object.
+
+    Args:
+        function: The function to apply.
+        values: The values.
+
+    Returns:
+        list: The result for each value, in order.
+    """
+    results = {}
+    mapped = []
+
+    for value in values:
+        if type(value) not in DISTINCT_VALUE_TYPES:  # pylint: disable=unidiomatic-typecheck
+            mapped.append(function(value))
+            continue
+
+        key = (type(value), value)
+        result = results.get(key)
+
+        if result is None:
+            result = results[key] = function(value)
+
+        mapped.append(result)
+
+    return mapped
+
+
+class ProductInputSerializer:
+    """
+    Build the Saleor product input of model instances for a SaleorConfig.
+
+    Use ``SaleorConfig.product_serializer``, which compiles the serializer once per config.
+    """
+
+    def __init__(self, config):
+        """
+        Compile the attributes mapping of a configuration.
+
+        Args:
+            config (SaleorConfig): The configuration of the product type.
+
+        Raises:
+            ValueError: If a mapped attribute is not a field of the model.
+        """
+        self.config = config
+        self.attributes = tuple(
+            (attrb.model_attribute, self._get_formatter(config.model, attrb.model_attribute))
+            for attrb in config.attributes_mapping
+        )
+
+    @property
+    def row_fields(self) -> tuple:
+        """
+        Fields to pass to ``values_list`` to get the rows accepted by ``serialize_rows``.
+        """
+        return ("id", "display_name", "short_description") + tuple(
+            model_attribute for model_attribute, _ in self.attributes
+        )
+
+    @staticmethod
+    def _get_formatter(model, model_attribute: str):
+        model_attribute_type = get_model_field_type(model, model_attribute)
+        product_input_type = ATTRIBUTE_TYPES_MAP.get(model_attribute_type, "PLAIN_TEXT")
+
+        return get_attribute_formatter(convert_to_camel_case(product_input_type.lower()))
+
+    def get_attributes(self, instance) -> list:
+        """
+        Format the mapped attributes of an instance.
+
+        Args:
+            instance: The model instance, e.g. a course.
+
+        Returns:
+            list: The AttributeValueInput of each mapped attribute.
+        """
+        return [
+            {
+                "externalReference": model_attribute,
+                **formatter(getattr(instance, model_attribute, None)),
+            }
+            for model_attribute, formatter in self.attributes
+        ]
+
+    def serialize(self, course, product_type_id: str) -> dict:
+        """
+        Build the product input of a course.
+
+        Args:
+            course: The course object containing product data.
+            product_type_id (str): The ID of the product type.
+
+        Returns:
+            dict: The input accepted by productCreate and productBulkCreate.
+        """
+        return {
+            "productType": product_type_id,
+            "name": str(course.display_name),
+            "description": json_backend.dumps(create_rich_text(course.short_description)),
+            "attributes": self.get_attributes(course),
+            "externalReference": str(course.id),
+        }
+
+    def serialize_rows(self, rows, product_type_id: str) -> list:
+        """
+        Build the product inputs of courses from ``values_list`` rows, column by column.
+
+        The inputs are equal to the ones built by ``serialize``. Attribute inputs of
+        equal values are shared between products, so the inputs must not be modified.
+
+        Args:
+            rows: Tuples of the values of ``row_fields``, one per course.
+            product_type_id (str): The ID of the product type.
+
+        Returns:
+            list: The input of each course, in order.
+        """
+        rows = list(rows)
+
+        if not rows:
+            return []
+
+        columns = list(zip(*rows))
+        course_ids, display_names, short_descriptions = columns[:3]
+
+        attribute_columns = [
+            map_distinct(
+                lambda value, model_attribute=model_attribute, formatter=formatter: {
+                    "externalReference": model_attribute,
+                    **formatter(value),
+                },
+                column,
+            )
+            for (model_attribute, formatter), column in zip(self.attributes, columns[3:])
+        ]
+        descriptions = map_distinct(
+            lambda text: json_backend.dumps(create_rich_text(text)),
+            short_descriptions,
+        )
+
+        return [
+            {
+                "productType": product_type_id,
+                "name": str(display_name),
+                "description": description,
+                "attributes": list(attributes),
+                "externalReference": str(course_id),
+            }
+            for course_id, display_name, description, attributes in zip(
+                course_ids, display_names, descriptions, zip(*attribute_columns),
+            )
+        ]
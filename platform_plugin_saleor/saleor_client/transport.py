@@ -0,0 +1,324 @@
+"""Long-lived, connection-pooled transport for the Saleor GraphQL API.
+
+The synchronous ``gql.Client.execute`` opens (and closes) a new aiohttp session for
+every call, which means a new TCP and TLS handshake per GraphQL operation. The classes
+in this module keep a single gql session, backed by a keep-alive connection pool, open
+on a dedicated event loop so consecutive calls reuse the same connections.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from dataclasses import dataclass
+
+import aiohttp
+from gql import Client
+from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportProtocolError, TransportServerError
+
+from platform_plugin_saleor.saleor_client import json_backend
+from platform_plugin_saleor.saleor_client.metrics import current_operation_metrics
+
+logger = logging.getLogger(__name__)
+
+
+async def _count_request_bytes(session, context, params):  # pylint: disable=unused-argument
+    if (metrics := current_operation_metrics.get()) is not None:
+        metrics.request_bytes += len(params.chunk)
+
+
+async def _count_response_bytes(session, context, params):  # pylint: disable=unused-argument
+    if (metrics := current_operation_metrics.get()) is not None:
+        metrics.response_bytes += len(params.chunk)
+
+
+def create_metrics_trace_config() -> aiohttp.TraceConfig:
+    """
+    Create the aiohttp trace config counting the body bytes of each Saleor operation.
+
+    The bytes sent and received are added to the metrics of the operation executed by
+    the current task, if any, as aiohttp writes and reads them, so payloads are never
+    encoded again just to be measured.
+
+    Returns:
+        aiohttp.TraceConfig: The trace config.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_chunk_sent.append(_count_request_bytes)
+    trace_config.on_response_chunk_received.append(_count_response_bytes)
+
+    return trace_config
+
+
+@dataclass
+class SaleorPoolConfig():
+    """
+    Connection pool settings for the pooled Saleor transport.
+
+    Args:
+        pool_size (int): Maximum number of simultaneous connections, 0 means unlimited.
+        limit_per_host (int): Maximum number of simultaneous connections per host, 0 means unlimited.
+        keepalive_timeout (float): Seconds an idle connection is kept open to be reused.
+    """
+    pool_size: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 30.0
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Create the aiohttp connector holding the connection pool.
+
+        The connector is bound to the running event loop, so this must be called from
+        a coroutine running on the loop that will use it.
+
+        Returns:
+            aiohttp.TCPConnector: The pooled keep-alive connector.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+
+class SaleorClientResponse(aiohttp.ClientResponse):
+    """
+    aiohttp response decoding JSON bodies with the configured JSON backend.
+    """
+
+    async def json(self, *, encoding=None, loads=json_backend.loads, content_type="application/json"):
+        """Decode the JSON body of the response, with ``json_backend.loads`` by default."""
+        return await super().json(encoding=encoding, loads=loads, content_type=content_type)
+
+
+class EventLoopThread:
+    """
+    Run an asyncio event loop forever in a daemon thread.
+
+    Coroutines can be submitted from any thread with ``run``, which blocks the caller
+    until the coroutine finishes, or with ``submit``, which returns a future. Keeping the
+    loop alive is what allows aiohttp connections to be reused between synchronous calls.
+    """
+
+    def __init__(self, name: str = "saleor-client-loop"):
+        self.name = name
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread has been started and is still alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the loop thread if it is not running yet."""
+        with self._lock:
+            if self.is_running:
+                return
+
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run_forever,
+                name=self.name,
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro):
+        """
+        Run a coroutine on the loop thread and wait for its result.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            Any: The value returned by the coroutine.
+
+        Raises:
+            RuntimeError: If called from the loop thread itself, which would deadlock.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the Saleor client loop from inside the loop. "
+                "Use the async client instead."
+            )
+
+        return self.submit(coro).result()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop thread without waiting for it.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            concurrent.futures.Future: The future of the coroutine result.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Stop the loop, wait for the thread to exit and close the loop."""
+        with self._lock:
+            if not self.is_running:
+                return
+
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self.loop = None
+            self._thread = None
+
+
+class PooledClientSession:
+    """
+    A gql client session that stays connected across calls.
+
+    The aiohttp session and its connection pool are created lazily on the event loop
+    of the first call and reused until ``close`` is awaited.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict = None,
+        timeout: int = None,
+        pool_config: SaleorPoolConfig = None,
+    ):
+        """
+        Initialize the pooled session.
+
+        Args:
+            url (str): The GraphQL endpoint URL.
+            headers (dict, optional): HTTP headers sent with every request.
+            timeout (int, optional): Request timeout in seconds.
+            pool_config (SaleorPoolConfig, optional): Connection pool settings.
+                If not provided, uses the SaleorPoolConfig defaults.
+        """
+        self.url = url
+        self.headers = headers
+        self.timeout = timeout
+        self.pool_config = pool_config or SaleorPoolConfig()
+        self._client = None
+        self._session = None
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the underlying aiohttp session is open."""
+        return self._session is not None
+
+    async def connect(self):
+        """
+        Open the gql session if it is not open yet.
+
+        Returns:
+            AsyncClientSession: The connected gql session.
+        """
+        if self._session is not None:
+            return self._session
+
+        async with self._connect_lock:
+            if self._session is None:
+                logger.debug("Opening pooled Saleor session to %s", self.url)
+                transport = AIOHTTPTransport(
+                    url=self.url,
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    json_serialize=json_backend.dumps,
+                    client_session_args={
+                        "connector": self.pool_config.create_connector(),
+                        "response_class": SaleorClientResponse,
+                        "trace_configs": [create_metrics_trace_config()],
+                    },
+                )
+                self._client = Client(
+                    transport=transport,
+                    fetch_schema_from_transport=False,
+                )
+                self._session = await self._client.connect_async()
+
+        return self._session
+
+    async def execute(self, document, variables: dict = None) -> dict:
+        """
+        Execute a parsed GraphQL document over the pooled session.
+
+        Args:
+            document: The parsed GraphQL document.
+            variables (dict, optional): Variables to pass to the operation.
+
+        Returns:
+            dict: The response data.
+        """
+        session = await self.connect()
+        return await session.execute(document, variable_values=variables)
+
+    async def execute_batch(self, operations: list) -> list:
+        """
+        Send several GraphQL operations in a single HTTP request.
+
+        The operations are posted as a JSON list, which Saleor answers with one result
+        per operation, in the same order.
+
+        Args:
+            operations (list): Dicts with the ``query``, ``variables`` and
+                ``operationName`` of each operation.
+
+        Returns:
+            list: The result of each operation, a dict with ``data`` and/or ``errors``.
+
+        Raises:
+            TransportServerError: If Saleor answers with an HTTP error status.
+            TransportProtocolError: If the answer is not one result per operation.
+        """
+        await self.connect()
+        transport = self._client.transport
+
+        async with transport.session.post(self.url, ssl=transport.ssl, json=operations) as resp:
+            try:
+                results = await resp.json(content_type=None)
+            except ValueError:
+                results = None
+
+            if not isinstance(results, list) or len(results) != len(operations):
+                try:
+                    resp.raise_for_status()
+                except aiohttp.ClientResponseError as exc:
+                    raise TransportServerError(str(exc), exc.status) from exc
+
+                raise TransportProtocolError(
+                    f"Server did not return one result per batched operation: {await resp.text()}"
+                )
+
+        return results
+
+    async def close(self):
+        """Close the aiohttp session and release every pooled connection."""
+        if self._session is None:
+            return
+
+        logger.debug("Closing pooled Saleor session to %s", self.url)
+        client = self._client
+        self._client = None
+        self._session = None
+        await client.close_async()
+
+    def discard(self):
+        """
+        Forget the current session without closing it.
+
+        Used after a fork, when the session belongs to an event loop that only exists
+        in the parent process.
+        """
+        self._client = None
+        self._session = None
+        self._connect_lock = asyncio.Lock()
@@ -1,6 +1,7 @@
 """Utility functions for Saleor GraphQL client."""
 
 from datetime import datetime
+from typing import Iterator
 
 ATTRIBUTE_TYPES_MAP = {
     'TextField': 'PLAIN_TEXT',
@@ -62,6 +63,21 @@ def get_model_field_type(model_cls, field_name: str) -> str:
         ) from exc
 
 
+def iter_edges_and_nodes(response: dict) -> Iterator[dict]:
+    """
+    Lazily yield the nodes of a GraphQL response with an 'edges' structure.
+
+    Args:
+        response: GraphQL response dictionary containing an 'edges' key.
+
+    Yields:
+        dict: Each non-empty node of the response.
+    """
+    for edge in response.get("edges", []):
+        if node := edge.get("node", {}):
+            yield node
+
+
 def clean_edges_and_nodes(response: dict) -> list[dict]:
     """
     Extract and return the list of nodes from a GraphQL response with an 'edges' structure.
@@ -72,14 +88,7 @@ def clean_edges_and_nodes(response: dict) -> list[dict]:
     Returns:
         list[dict]: List of node dictionaries extracted from the response.
     """
-    cleaned_data = []
-    edges = response.get("edges", [])
-
-    for edge in edges:
-        if node := edge.get("node", {}):
-            cleaned_data.append(node)
-
-    return cleaned_data
+    return list(iter_edges_and_nodes(response))
 
 
 def convert_to_camel_case(snake_str: str) -> str:
@@ -110,6 +119,51 @@ def create_rich_text(text: str = "No description"):
     return {"blocks": [{"type": "paragraph", "data": {"text": text}}]}
 
 
+def format_boolean_attribute(value) -> dict:
+    """Format a value for a BOOLEAN Saleor attribute."""
+    return {'boolean': bool(value)}
+
+
+def format_date_time_attribute(value) -> dict:
+    """Format a value for a DATE_TIME Saleor attribute."""
+    if value and isinstance(value, datetime):
+        return {'dateTime': value.isoformat()}
+
+    return {'dateTime': None}
+
+
+def format_numeric_attribute(value) -> dict:
+    """Format a value for a NUMERIC Saleor attribute."""
+    return {'numeric': str(value) if value is not None else '0'}
+
+
+def format_plain_text_attribute(value) -> dict:
+    """Format a value for a PLAIN_TEXT Saleor attribute, the fallback of every other type."""
+    return {'plainText': str(value) if value is not None else ''}
+
+
+ATTRIBUTE_FORMATTERS = {
+    'boolean': format_boolean_attribute,
+    'dateTime': format_date_time_attribute,
+    'numeric': format_numeric_attribute,
+    'plainText': format_plain_text_attribute,
+}
+
+
+def get_attribute_formatter(product_input_key: str):
+    """
+    Return the function formatting values for a Saleor product attribute input type.
+
+    Args:
+        product_input_key (str): Attribute input type ('boolean', 'dateTime', 'numeric', 'plainText').
+
+    Returns:
+        Callable: Function taking a value and returning the formatted value dictionary.
+            Unknown input types are formatted as plain text.
+    """
+    return ATTRIBUTE_FORMATTERS.get(product_input_key, format_plain_text_attribute)
+
+
 def format_attribute_value(product_input_key: str, value) -> dict:
     """
     Format a value for a Saleor product attribute based on its input type.
@@ -121,17 +175,7 @@ def format_attribute_value(product_input_key: str, value) -> dict:
     Returns:
         dict: Dictionary with the formatted value for the given input type.
     """
-    if product_input_key == 'boolean':
-        return {'boolean': bool(value)}
-    elif product_input_key == 'dateTime':
-        if value and isinstance(value, datetime):
-            return {'dateTime': value.isoformat()}
-        else:
-            return {'dateTime': None}
-    elif product_input_key == 'numeric':
-        return {'numeric': str(value) if value is not None else '0'}
-    else:
-        return {'plainText': str(value) if value is not None else ''}
+    return get_attribute_formatter(product_input_key)(value)
 
 
 def find_errors(response_data: dict):
@@ -156,3 +200,39 @@ def find_errors(response_data: dict):
             if errors := find_errors(item):
                 return errors
     return None
+
+
+def extract_errors(response_data: dict, root_field: str = None) -> list[dict]:
+    """
+    Collect the errors of a response by looking only where Saleor puts them.
+
+    Saleor mutation payloads expose their errors at ``<rootField>.errors`` and bulk
+    mutations also report per-item errors at ``<rootField>.results[*].errors``. Item
+    errors are returned with the ``index`` of the failed item added to them. Nothing
+    else in the response is walked.
+
+    Args:
+        response_data: The response data of the operation.
+        root_field: Root field of the mutation, e.g. 'productCreate'. If not provided,
+            every top-level field of the response is checked.
+
+    Returns:
+        list[dict]: The errors found, empty if the operation succeeded.
+    """
+    errors = []
+    root_fields = (root_field,) if root_field else response_data.keys()
+
+    for field in root_fields:
+        payload = response_data.get(field)
+
+        if not isinstance(payload, dict):
+            continue
+
+        if payload_errors := payload.get("errors"):
+            errors.extend(payload_errors)
+
+        for index, result in enumerate(payload.get("results") or ()):
+            if result and (item_errors := result.get("errors")):
+                errors.extend({**error, "index": index} for error in item_errors)
+
+    return errors
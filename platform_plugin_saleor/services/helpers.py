@@ -1,28 +1,65 @@
 """
 TO-DO
 """
+import atexit
 from functools import cache
 
 from common.djangoapps.student.models.user import anonymous_id_for_user  # pylint: disable=import-error
 from django.conf import settings
+from django.utils.module_loading import import_string
 
+from platform_plugin_saleor import mappings
+from platform_plugin_saleor.saleor_client.circuit_breaker import get_circuit_breaker
 from platform_plugin_saleor.saleor_client.client import SaleorApiClient
+from platform_plugin_saleor.saleor_client.metadata import MetadataRegistry
+from platform_plugin_saleor.saleor_client.retry import RetryPolicy
+from platform_plugin_saleor.saleor_client.transport import SaleorPoolConfig
 
 
-def get_saleor_api_client_instance():
+@cache
+def generate_api_client(base_url: str, token: str) -> SaleorApiClient:
     """
-    TO-DO
+    Create the pooled Saleor API client for the given credentials.
+
+    The client is cached for the lifetime of the process, so its connection pool is
+    shared by every request served by the worker, and closed when the process exits.
     """
-    @cache
-    def generate_api_client(base_url: str, token: str):
-        """
-        TO-DO
-        """
-        return SaleorApiClient(
-            base_url=base_url,
-            token=token,
-        )
+    client = SaleorApiClient(
+        base_url=base_url,
+        token=token,
+        timeout=settings.SALEOR_API_TIMEOUT,
+        pool_config=SaleorPoolConfig(
+            pool_size=settings.SALEOR_API_POOL_SIZE,
+            limit_per_host=settings.SALEOR_API_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.SALEOR_API_KEEPALIVE_TIMEOUT,
+        ),
+        page_size=settings.SALEOR_API_PAGE_SIZE,
+        metadata=MetadataRegistry(
+            ttl=settings.SALEOR_METADATA_TTL,
+            cache_alias=settings.SALEOR_METADATA_CACHE,
+        ),
+        retry_policy=RetryPolicy(
+            max_attempts=settings.SALEOR_API_RETRY_ATTEMPTS,
+            backoff_base=settings.SALEOR_API_RETRY_BACKOFF,
+            retry_mutations=settings.SALEOR_API_RETRY_MUTATIONS,
+        ),
+        circuit_breaker=get_circuit_breaker(
+            base_url,
+            failure_threshold=settings.SALEOR_CIRCUIT_FAILURE_THRESHOLD,
+            window=settings.SALEOR_CIRCUIT_WINDOW,
+            recovery_timeout=settings.SALEOR_CIRCUIT_RECOVERY_TIMEOUT,
+        ),
+        metrics_sink=import_string(settings.SALEOR_METRICS_SINK)() if settings.SALEOR_METRICS_SINK else None,
+    )
+    atexit.register(client.close)
+
+    return client
+
 
+def get_saleor_api_client_instance() -> SaleorApiClient:
+    """
+    Return the shared Saleor API client for the configured URL and token.
+    """
     return generate_api_client(
         base_url=settings.SALEOR_API_URL,
         token=settings.SALEOR_API_TOKEN,
@@ -31,8 +68,15 @@ def get_saleor_api_client_instance():
 
 def get_or_create_saleor_user(user) -> dict:
     """
-    TO-DO
+    Return the Saleor user of an LMS user, registering it if needed.
+
+    The Saleor user ID is stored locally, so Saleor is only queried the first time.
     """
+    saleor_user_id = mappings.get_saleor_user_id(user)
+
+    if saleor_user_id:
+        return {"id": saleor_user_id, "email": user.email}
+
     client = get_saleor_api_client_instance()
     saleor_user = client.get_user_by_email(user.email)["user"]
 
@@ -44,6 +88,9 @@ def get_or_create_saleor_user(user) -> dict:
             password=generate_password(user=user),
         )["accountRegister"]["user"]
 
+    if saleor_user:
+        mappings.save_saleor_users({user.pk: saleor_user["id"]})
+
     return saleor_user
 
 
@@ -64,9 +111,21 @@ def create_user_checkout(saleor_user: dict, product_variants) -> dict:
 
 def get_product_variant(sku: str) -> dict:
     """
-    TO-DO
+    Return the Saleor product variant of a SKU.
+
+    The variant is stored locally, so Saleor is only queried the first time.
     """
-    return get_saleor_api_client_instance().get_product_variant(sku=sku)["productVariant"]
+    product_variant = mappings.get_product_variant(sku)
+
+    if product_variant:
+        return product_variant
+
+    product_variant = get_saleor_api_client_instance().get_product_variant(sku=sku)["productVariant"]
+
+    if product_variant:
+        mappings.save_product_variants([product_variant])
+
+    return product_variant
 
 
 def generate_password(user):
@@ -1,10 +1,16 @@
 """
 TO-DO
 """
+import logging
+import math
+from functools import wraps
+
 from django.conf import settings
 from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
 
+from platform_plugin_saleor.mappings import delete_product_variant, delete_saleor_user
+from platform_plugin_saleor.saleor_client.exceptions import CircuitOpenError, GraphQLError
 from platform_plugin_saleor.services.helpers import (
     create_user_checkout,
     generate_password,
@@ -13,7 +19,27 @@ from platform_plugin_saleor.services.helpers import (
     get_saleor_api_client_instance,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def saleor_unavailable_response(view_func):
+    """
+    Answer with a 503 right away when the Saleor circuit breaker is open.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view_func(request, *args, **kwargs)
+        except CircuitOpenError as e:
+            logger.warning(f"Saleor unavailable for {request.path}: {e}")
+            response = HttpResponse("The store is temporarily unavailable.", status=503)
+            response["Retry-After"] = str(math.ceil(e.retry_in))
+            return response
+
+    return wrapper
+
 
+@saleor_unavailable_response
 def checkout(request):
     """
     Basic view that creates a Saleor checkout record and redirects to the storefront checkout page.
@@ -25,7 +51,21 @@ def checkout(request):
     if not product_variant or not saleor_user:
         raise Http404
 
-    checkout_response = create_user_checkout(saleor_user=saleor_user, product_variants=[product_variant])
+    try:
+        checkout_response = create_user_checkout(saleor_user=saleor_user, product_variants=[product_variant])
+    except GraphQLError:
+        # The stored variant or Saleor user may have been deleted or recreated in Saleor:
+        # forget them and retry once with the ones Saleor returns now.
+        if not (delete_product_variant(skus[0]) | delete_saleor_user(request.user)):
+            raise
+
+        product_variant = get_product_variant(sku=skus[0])
+        saleor_user = get_or_create_saleor_user(request.user)
+
+        if not product_variant or not saleor_user:
+            raise Http404
+
+        checkout_response = create_user_checkout(saleor_user=saleor_user, product_variants=[product_variant])
 
     # Hard coded value, this will be replace after defining the openedx storefront implementation.
     response = redirect(f"http://local.overhang.io:18055/checkout?checkout={checkout_response['id']}")
@@ -33,6 +73,7 @@ def checkout(request):
     return response
 
 
+@saleor_unavailable_response
 def authenticate(request):
     """
     TO-DO
@@ -10,3 +10,33 @@ def plugin_settings(settings):
         "platform_plugin_saleor.webhooks.fulfillment.pipeline.enroll_user_in_courses",
         "platform_plugin_saleor.webhooks.fulfillment.pipeline.update_order_fulfillment",
     ]
+
+    # Connection pool used by the long-lived Saleor API client shared by the views and webhooks.
+    settings.SALEOR_API_TIMEOUT = None
+    settings.SALEOR_API_POOL_SIZE = 100
+    settings.SALEOR_API_POOL_LIMIT_PER_HOST = 0
+    settings.SALEOR_API_KEEPALIVE_TIMEOUT = 30
+    # Number of nodes requested per page when the client walks a paginated list query.
+    settings.SALEOR_API_PAGE_SIZE = 100
+    # Product type, attribute and warehouse IDs are cached for this many seconds. Set the cache
+    # alias to share them between workers through a Django cache, or None to keep them in process.
+    settings.SALEOR_METADATA_TTL = 3600
+    settings.SALEOR_METADATA_CACHE = None
+    # Transient failures (429, 502, 503, 504, connection errors) are retried with exponential
+    # backoff. Queries are always retried, mutations only when SALEOR_API_RETRY_MUTATIONS is set.
+    settings.SALEOR_API_RETRY_ATTEMPTS = 3
+    settings.SALEOR_API_RETRY_BACKOFF = 0.5
+    settings.SALEOR_API_RETRY_MUTATIONS = False
+    # After this many server failures within the window (seconds), calls to Saleor fail fast
+    # for the recovery timeout (seconds) before a single trial call is let through.
+    settings.SALEOR_CIRCUIT_FAILURE_THRESHOLD = 5
+    settings.SALEOR_CIRCUIT_WINDOW = 30
+    settings.SALEOR_CIRCUIT_RECOVERY_TIMEOUT = 30
+    # Dotted path of a MetricsSink class receiving per-operation latency, payload size, retry and
+    # error metrics, e.g. "platform_plugin_saleor.saleor_client.metrics.LoggingMetricsSink".
+    settings.SALEOR_METRICS_SINK = None
+    # Push course edits to Saleor from a Celery task shortly after the CourseOverview is saved.
+    # The sync runs this many seconds after the first save, and the saves made until then are
+    # folded into it.
+    settings.SALEOR_COURSE_SYNC_ON_SAVE = False
+    settings.SALEOR_COURSE_SYNC_DELAY = 30
@@ -0,0 +1,87 @@
+"""Deterministic sharding of courses between independent sync processes.
+
+``saleor_create_course_products --shard i/N`` only syncs the courses whose key hashes to
+shard ``i`` of ``N``. The hash is stable across processes and machines, unlike the
+built-in ``hash``, so N processes started with shards ``0/N`` to ``N-1/N`` sync disjoint
+slices of the catalog that together cover it, without any coordination.
+
+The hash is computed in Python, as SQL has no portable equivalent, so each process still
+reads and hashes the key of every course of the catalog. Sharding splits the Saleor calls
+and the serialization between processes, which is where a catalog sync spends its time,
+not the CourseOverview query.
+"""
+
+import hashlib
+
+
+def parse_shard(value: str) -> tuple:
+    """
+    Parse a shard given as ``index/count``.
+
+    Args:
+        value (str): The shard, e.g. ``0/4``. Indexes start at 0.
+
+    Returns:
+        tuple: The shard index and the shard count.
+
+    Raises:
+        ValueError: If the value is not a valid shard.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as e:
+        raise ValueError(f"Invalid shard '{value}', expected INDEX/COUNT, e.g. 0/4.") from e
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{value}', the index must be between 0 and COUNT - 1.")
+
+    return index, count
+
+
+def format_shard(shard: tuple) -> str:
+    """
+    Return a shard as ``index/count``, or an empty string if there is no shard.
+    """
+    return f"{shard[0]}/{shard[1]}" if shard else ""
+
+
+def get_shard_index(course_id, shard_count: int) -> int:
+    """
+    Return the shard of a course.
+
+    Args:
+        course_id: The course key or its string.
+        shard_count (int): The number of shards.
+
+    Returns:
+        int: The shard index, between 0 and ``shard_count - 1``.
+    """
+    digest = hashlib.sha1(str(course_id).encode("utf-8"), usedforsecurity=False).digest()
+
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def filter_shard(courses, shard: tuple, get_course_id=lambda course: course.id):
+    """
+    Lazily keep the courses of a shard.
+
+    Every course of ``courses`` is read to hash its key, including the courses of the
+    other shards.
+
+    Args:
+        courses: Iterable of courses, e.g. model instances or ``values_list`` rows.
+        shard (tuple): The shard index and count. If None, every course is kept.
+        get_course_id (Callable): Return the course key of an item.
+
+    Yields:
+        The courses of the shard, in order.
+    """
+    if not shard:
+        yield from courses
+        return
+
+    index, count = shard
+
+    for course in courses:
+        if get_shard_index(get_course_id(course), count) == index:
+            yield course
@@ -0,0 +1,20 @@
+"""Signal handlers of platform_plugin_saleor."""
+
+from django.conf import settings
+from django.db import transaction
+
+from platform_plugin_saleor.tasks import schedule_course_product_sync
+
+
+def sync_course_product_on_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Schedule the Saleor product sync of a saved CourseOverview.
+
+    The sync is scheduled once the transaction commits, and only if
+    ``SALEOR_COURSE_SYNC_ON_SAVE`` is enabled.
+    """
+    if not settings.SALEOR_COURSE_SYNC_ON_SAVE:
+        return
+
+    course_id = str(instance.id)
+    transaction.on_commit(lambda: schedule_course_product_sync(course_id))
@@ -0,0 +1,446 @@
+"""Incremental sync of Open edX courses to Saleor products.
+
+Only the courses whose ``CourseOverview.modified`` is newer than a stored checkpoint are
+sent to Saleor, where their products are created or updated by external reference. The
+checkpoint is advanced atomically after each batch, and never past a course that failed,
+so a nightly sync touches the courses changed since the previous run and nothing else.
+
+Many course saves do not change anything sent to Saleor. A hash of the product input last
+pushed is kept per course, and courses whose input hashes the same are skipped without
+any Saleor call. The Saleor product ID is stored with the hash, see ``platform_plugin_saleor.mappings``.
+
+The input last pushed is kept as well, and products that already exist in Saleor are
+updated with only the fields and attributes that changed since.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.db import transaction
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.mappings import save_course_products
+from platform_plugin_saleor.models import SaleorCourseProduct, SaleorSyncCheckpoint
+from platform_plugin_saleor.saleor_client.batch import DEFAULT_BATCH_SIZE, iter_batches
+from platform_plugin_saleor.saleor_client.config import SaleorConfig, get_default_config
+from platform_plugin_saleor.sharding import filter_shard
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = "course_products"
+
+
+@dataclass
+class SyncReport():
+    """
+    Outcome of an incremental sync.
+
+    Args:
+        checkpoint (str): Name of the checkpoint, None for a sync of given courses.
+        since (datetime): Checkpoint value before the sync, None on the first sync.
+        synced_until (datetime): Checkpoint value after the sync.
+        results (dict): An OperationResult per course ID pushed to Saleor.
+        skipped (list): IDs of the courses whose product input did not change.
+    """
+    checkpoint: str = None
+    since: datetime = None
+    synced_until: datetime = None
+    results: dict = field(default_factory=dict)
+    skipped: list = field(default_factory=list)
+
+    @property
+    def failed(self) -> list:
+        """IDs of the courses that could not be synced."""
+        return [course_id for course_id, result in self.results.items() if not result.ok]
+
+
+def get_content_hash(product_input: dict) -> str:
+    """
+    Return a stable hash of a product input.
+
+    The input is encoded canonically with the standard library, whatever JSON backend is
+    installed, so every process computes the same hash for the same input.
+
+    Args:
+        product_input (dict): The product input sent to Saleor.
+
+    Returns:
+        str: The hexadecimal SHA-256 of the input, serialized with sorted keys.
+    """
+    encoded = json.dumps(product_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def get_unchanged_course_ids(content_hashes: dict) -> set:
+    """
+    Return the courses whose product input matches the one last pushed to Saleor.
+
+    Args:
+        content_hashes (dict): The content hash of each course ID.
+
+    Returns:
+        set: The IDs of the unchanged courses.
+    """
+    # Courses synced before product IDs were stored are pushed once more to map them.
+    stored_hashes = SaleorCourseProduct.objects.filter(
+        course_id__in=content_hashes,
+    ).exclude(product_id="").values_list("course_id", "content_hash")
+
+    return {
+        course_id for course_id, content_hash in stored_hashes
+        if content_hashes[course_id] == content_hash
+    }
+
+
+def get_snapshots(course_ids) -> dict:
+    """
+    Return the product input last pushed to Saleor for courses with a known product.
+
+    Args:
+        course_ids: The course IDs.
+
+    Returns:
+        dict: A ``(product_id, snapshot)`` tuple per course ID.
+    """
+    stored_products = SaleorCourseProduct.objects.filter(
+        course_id__in=list(course_ids),
+        snapshot__isnull=False,
+    ).exclude(product_id="").values_list("course_id", "product_id", "snapshot")
+
+    return {course_id: (product_id, snapshot) for course_id, product_id, snapshot in stored_products}
+
+
+def get_product_changes(snapshot: dict, product: dict) -> dict:
+    """
+    Return what changed in a product input since a snapshot.
+
+    Args:
+        snapshot (dict): The product input last pushed to Saleor.
+        product (dict): The new product input.
+
+    Returns:
+        dict: The fields that differ and, under ``attributes``, only the attributes that
+            differ. Empty if nothing changed. The product type, which cannot be updated,
+            and the external reference are never included.
+    """
+    changes = {
+        key: value for key, value in product.items()
+        if key not in ("productType", "externalReference", "attributes") and snapshot.get(key) != value
+    }
+    previous_attributes = {
+        attribute.get("externalReference"): attribute
+        for attribute in snapshot.get("attributes") or []
+    }
+    attributes = [
+        attribute for attribute in product.get("attributes") or []
+        if previous_attributes.get(attribute["externalReference"]) != attribute
+    ]
+
+    if attributes:
+        changes["attributes"] = attributes
+
+    return changes
+
+
+def push_products(client, products: dict, partial_updates: dict, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Send product inputs to Saleor, only their changes for those with a partial update.
+
+    A partial update that fails, e.g. because the product was deleted in Saleor, is
+    retried with the full input, which creates the product if needed.
+
+    Args:
+        client (SaleorApiClient): The Saleor API client.
+        products (dict): The full product input of each course ID.
+        partial_updates (dict): The partial input of the course IDs whose product exists.
+        batch_size (int): Maximum number of products per batch.
+
+    Returns:
+        dict: An OperationResult per course ID, in the order of the products.
+    """
+    results = client.update_products(list(partial_updates.values()), batch_size=batch_size) if partial_updates else {}
+    full_updates = [
+        product for course_id, product in products.items()
+        if course_id not in results or not results[course_id].ok
+    ]
+
+    if full_updates:
+        results.update(client.upsert_products(full_updates, batch_size=batch_size))
+
+    return {course_id: results[course_id] for course_id in products}
+
+
+def sync_products(client, products: dict, batch_size: int = DEFAULT_BATCH_SIZE, force: bool = False) -> tuple:
+    """
+    Push the product inputs of courses that changed since they were last pushed.
+
+    Inputs identical to the last push are skipped and the products already in Saleor
+    only get the fields that changed, unless ``force`` is set. The content hash, product
+    ID and snapshot of the products pushed are stored.
+
+    Args:
+        client (SaleorApiClient): The Saleor API client.
+        products (dict): The full product input of each course ID.
+        batch_size (int): Maximum number of products per batch.
+        force (bool): Push the full input of every course, even if it did not change.
+
+    Returns:
+        tuple: An OperationResult per course ID pushed, and the list of the course IDs skipped.
+    """
+    content_hashes = {
+        course_id: get_content_hash(product)
+        for course_id, product in products.items()
+    }
+    unchanged = set() if force else get_unchanged_course_ids(content_hashes)
+    changed = {course_id: product for course_id, product in products.items() if course_id not in unchanged}
+    product_ids = {}
+    partial_updates = {}
+
+    for course_id, (product_id, snapshot) in ({} if force else get_snapshots(changed)).items():
+        product_ids[course_id] = product_id
+
+        if changes := get_product_changes(snapshot, changed[course_id]):
+            partial_updates[course_id] = {"externalReference": course_id, **changes}
+        else:
+            unchanged.add(course_id)
+            del changed[course_id]
+
+    results = push_products(client, changed, partial_updates, batch_size) if changed else {}
+
+    # Courses pushed, and courses whose input changed in nothing Saleor can update.
+    pushed_product_ids = {
+        course_id: product_id for course_id, product_id in product_ids.items() if course_id not in changed
+    }
+    pushed_product_ids.update(
+        (course_id, (result.data or {}).get("id") or product_ids.get(course_id, ""))
+        for course_id, result in results.items() if result.ok
+    )
+    save_course_products({
+        course_id: {
+            "product_id": product_id,
+            "content_hash": content_hashes[course_id],
+            "snapshot": products[course_id],
+        }
+        for course_id, product_id in pushed_product_ids.items()
+    })
+
+    return results, [course_id for course_id in products if course_id in unchanged]
+
+
+def get_courses(config: SaleorConfig = None):
+    """
+    Return the courses, loading only the fields their product input needs.
+
+    Args:
+        config (SaleorConfig, optional): The configuration of the course products.
+            If not provided, uses EdxCourseOverviewSaleorConfig.
+
+    Returns:
+        QuerySet: The courses.
+    """
+    config = config or get_default_config()
+
+    return CourseOverview.objects.only(
+        *config.get_model_fields(), "display_name", "short_description", "modified",
+    )
+
+
+def get_modified_courses(since: datetime = None, config: SaleorConfig = None):
+    """
+    Return the courses modified after a date, oldest modification first.
+
+    Args:
+        since (datetime, optional): Only courses modified after this date are returned.
+            If not provided, every course is returned.
+        config (SaleorConfig, optional): The configuration of the course products, whose
+            mapped fields are the only ones loaded. If not provided, uses
+            EdxCourseOverviewSaleorConfig.
+
+    Returns:
+        QuerySet: The courses.
+    """
+    courses = get_courses(config)
+
+    if since is not None:
+        courses = courses.filter(modified__gt=since)
+
+    return courses.order_by("modified", "id")
+
+
+def advance_checkpoint(name: str, synced_until: datetime) -> bool:
+    """
+    Move a checkpoint forward, never backward.
+
+    The checkpoint row is locked while it is updated, so concurrent syncs cannot move
+    it back.
+
+    Args:
+        name (str): Name of the checkpoint.
+        synced_until (datetime): The new checkpoint value.
+
+    Returns:
+        bool: True if the checkpoint moved.
+    """
+    if synced_until is None:
+        return False
+
+    with transaction.atomic():
+        checkpoint, _ = SaleorSyncCheckpoint.objects.select_for_update().get_or_create(name=name)
+
+        if checkpoint.synced_until is not None and checkpoint.synced_until >= synced_until:
+            return False
+
+        checkpoint.synced_until = synced_until
+        checkpoint.save(update_fields=["synced_until", "updated_at"])
+
+    return True
+
+
+def sync_modified_courses(
+    client,
+    config: SaleorConfig = None,
+    checkpoint: str = DEFAULT_CHECKPOINT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = 1000,
+    force: bool = False,
+    on_results=None,
+    shard: tuple = None,
+) -> SyncReport:
+    """
+    Upsert the products of the courses modified since the checkpoint.
+
+    Courses are processed in modification order. Those whose product input did not
+    change since the last push are skipped, and the products already in Saleor only get
+    the fields that changed, unless ``force`` is set. The checkpoint is
+    advanced after each batch up to the last modification date whose courses all
+    succeeded, so a failed course, and any course modified at the same time, is synced
+    again next time.
+
+    Args:
+        client (SaleorApiClient): The Saleor API client.
+        config (SaleorConfig, optional): The configuration for the course products.
+            If not provided, uses EdxCourseOverviewSaleorConfig.
+        checkpoint (str): Name of the checkpoint.
+        batch_size (int): Maximum number of courses per batch.
+        chunk_size (int): Number of courses fetched from the database at a time.
+        force (bool): Push the full input of every modified course, even if it did not change.
+        on_results (Callable, optional): Called with the results of each batch pushed to Saleor.
+        shard (tuple, optional): The shard index and count of the courses to sync. Each
+            shard needs its own checkpoint.
+
+    Returns:
+        SyncReport: The outcome of the sync.
+
+    Raises:
+        ValueError: If the course product type does not exist.
+    """
+    config = config or get_default_config()
+    since = SaleorSyncCheckpoint.objects.get_or_create(name=checkpoint)[0].synced_until
+    report = SyncReport(checkpoint=checkpoint, since=since, synced_until=since)
+    courses = filter_shard(get_modified_courses(since, config).iterator(chunk_size=chunk_size), shard)
+    serializer = config.product_serializer
+    product_type_id = None
+
+    # Modification date of the courses being processed, and the latest one whose
+    # courses all succeeded. The checkpoint stops advancing at the first failure.
+    current_modified = since
+    failed = False
+
+    for batch in iter_batches(courses, batch_size):
+        product_type_id = product_type_id or client.get_course_product_type_id(config)
+        products = {
+            str(course.id): serializer.serialize(course, product_type_id)
+            for course in batch
+        }
+        results, unchanged = sync_products(client, products, batch_size, force)
+        report.results.update(results)
+        report.skipped.extend(unchanged)
+
+        for course in batch:
+            if failed:
+                break
+
+            if course.modified != current_modified:
+                report.synced_until = current_modified
+                current_modified = course.modified
+
+            result = results.get(str(course.id))
+            failed = result is not None and not result.ok
+
+        advance_checkpoint(checkpoint, report.synced_until)
+
+        if on_results and results:
+            on_results(results)
+
+    if not failed:
+        report.synced_until = current_modified
+        advance_checkpoint(checkpoint, report.synced_until)
+
+    logger.info(
+        "Synced %s courses to Saleor (%s failed, %s unchanged), checkpoint %s advanced from %s to %s.",
+        len(report.results),
+        len(report.failed),
+        len(report.skipped),
+        checkpoint,
+        since,
+        report.synced_until,
+    )
+
+    return report
+
+
+def sync_courses(
+    client,
+    course_ids,
+    config: SaleorConfig = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    force: bool = False,
+) -> SyncReport:
+    """
+    Upsert the products of the given courses, without moving any checkpoint.
+
+    Like ``sync_modified_courses``, courses whose product input did not change since
+    the last push are skipped and existing products only get the fields that changed.
+
+    Args:
+        client (SaleorApiClient): The Saleor API client.
+        course_ids: The IDs of the courses. Missing courses are ignored.
+        config (SaleorConfig, optional): The configuration for the course products.
+            If not provided, uses EdxCourseOverviewSaleorConfig.
+        batch_size (int): Maximum number of courses per batch.
+        force (bool): Push the full input of every course, even if it did not change.
+
+    Returns:
+        SyncReport: The outcome of the sync.
+
+    Raises:
+        ValueError: If the course product type does not exist.
+    """
+    config = config or get_default_config()
+    report = SyncReport()
+    courses = get_courses(config).filter(id__in=[str(course_id) for course_id in course_ids]).order_by("id")
+    serializer = config.product_serializer
+    product_type_id = None
+
+    for batch in iter_batches(courses.iterator(), batch_size):
+        product_type_id = product_type_id or client.get_course_product_type_id(config)
+        products = {
+            str(course.id): serializer.serialize(course, product_type_id)
+            for course in batch
+        }
+        results, unchanged = sync_products(client, products, batch_size, force)
+        report.results.update(results)
+        report.skipped.extend(unchanged)
+
+    logger.info(
+        "Synced %s courses to Saleor (%s failed, %s unchanged).",
+        len(report.results),
+        len(report.failed),
+        len(report.skipped),
+    )
+
+    return report
@@ -0,0 +1,68 @@
+"""Celery tasks of platform_plugin_saleor.
+
+A course is usually saved several times in a row while it is edited or published. The
+product sync of a course is throttled: the first save schedules a task after
+``SALEOR_COURSE_SYNC_DELAY`` seconds and the saves that follow until it runs are folded
+into it, since the task reads the course when it runs. Unlike a debounce, later saves do
+not push the task back, so a course saved continuously still syncs once per delay.
+"""
+
+import logging
+
+from celery import shared_task  # pylint: disable=import-error
+from django.conf import settings
+from django.core.cache import cache
+
+from platform_plugin_saleor.services.helpers import get_saleor_api_client_instance
+from platform_plugin_saleor.sync import sync_courses
+
+logger = logging.getLogger(__name__)
+
+
+def get_course_sync_key(course_id: str) -> str:
+    """
+    Return the cache key marking a pending product sync of a course.
+    """
+    return f"platform_plugin_saleor:course_sync:{course_id}"
+
+
+def schedule_course_product_sync(course_id: str) -> bool:
+    """
+    Schedule the product sync of a course, unless one is already pending.
+
+    Args:
+        course_id (str): The ID of the course.
+
+    Returns:
+        bool: True if a task was scheduled, False if the save is folded into a pending one.
+    """
+    delay = settings.SALEOR_COURSE_SYNC_DELAY
+
+    # The key outlives the delay so a lost task does not block the course for long.
+    if not cache.add(get_course_sync_key(course_id), True, timeout=delay * 2 + 60):
+        return False
+
+    sync_course_product.apply_async(args=(course_id,), countdown=delay)
+    return True
+
+
+@shared_task
+def sync_course_product(course_id: str):
+    """
+    Create or update the Saleor product of a course.
+
+    The pending mark is cleared first, so a save made while the task runs schedules a
+    new sync.
+
+    Args:
+        course_id (str): The ID of the course.
+    """
+    cache.delete(get_course_sync_key(course_id))
+    report = sync_courses(get_saleor_api_client_instance(), [course_id])
+
+    for failed_course_id in report.failed:
+        logger.warning(
+            "Saleor product sync of course %s failed: %s",
+            failed_course_id,
+            report.results[failed_course_id].error,
+        )
@@ -11,7 +11,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from opaque_keys.edx.keys import CourseKey  # pylint: disable=import-error
 
-from platform_plugin_saleor.saleor_client.client import SaleorApiClient
+from platform_plugin_saleor.services.helpers import get_saleor_api_client_instance
 
 User = get_user_model()
 
@@ -157,10 +157,7 @@ def update_order_fulfillment(order, order_lines, *args, **kwargs):
     Returns:
         dict: Indicating success or failure with details.
     """
-    client = SaleorApiClient(
-        base_url=settings.SALEOR_API_URL,
-        token=settings.SALEOR_API_TOKEN,
-    )
+    client = get_saleor_api_client_instance()
 
     order_id = order.get("id")
     warehouse = client.get_warehouse_by_name()
@@ -1,6 +1,5 @@
 """Views for Saleor app integration."""
 
-import json
 import logging
 
 from django.conf import settings
@@ -8,6 +7,7 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 
 from platform_plugin_saleor.manifest import get_app_manifest
+from platform_plugin_saleor.saleor_client import json_backend
 from platform_plugin_saleor.webhooks.fulfillment.pipeline import run_fulfillment_pipeline
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,7 @@ def register_saleor_app_token(request):
     Returns:
         JsonResponse: A JSON response indicating the token was successfully received.
     """
-    payload = json.loads(request.body.decode("utf-8"))
+    payload = json_backend.loads(request.body)
     token = payload.get("auth_token")
     settings.SALEOR_API_TOKEN = token
 
@@ -69,7 +69,7 @@ def fulfill_order(request):
         JsonResponse: A JSON response indicating success or failure.
     """
 
-    payload = json.loads(request.body)
+    payload = json_backend.loads(request.body)
     order = payload.get("order", {})
 
     result = run_fulfillment_pipeline(order=order)
@@ -33,6 +33,7 @@ INSTALLED_APPS = (
     'django.contrib.messages',
     'django.contrib.sessions',
     'platform_plugin_saleor',
+    'test_utils.course_overviews',
 )
 
 LOCALE_PATHS = [
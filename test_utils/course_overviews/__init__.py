@@ -0,0 +1,6 @@
+"""
+Test double of the Open edX ``course_overviews`` app.
+
+Only the CourseOverview fields read by the plugin are defined. ``tests/conftest.py``
+installs its models module under the Open edX import path.
+"""
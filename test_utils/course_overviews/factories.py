@@ -0,0 +1,38 @@
+"""
+Synthetic courses of the test double of the ``course_overviews`` app.
+"""
+
+from datetime import datetime, timedelta
+
+from test_utils.course_overviews.models import CourseOverview
+
+
+def build_courses(count: int) -> list:
+    """
+    Build unsaved courses with a realistic mix of values.
+
+    Organizations, images, dates and languages repeat across courses as in a real
+    catalog, and some fields are empty or non-ASCII.
+
+    Args:
+        count (int): Number of courses.
+
+    Returns:
+        list: The courses, in ID order.
+    """
+    return [
+        CourseOverview(
+            id=f"course-v1:Org{index % 20}+C{index:05d}+2024",
+            display_name=f"Cours n°{index}" if index % 7 == 0 else f"Course {index}",
+            short_description="Learn the basics. " * 10 if index % 4 else "",
+            banner_image_url="/asset-v1:banner.png",
+            course_image_url=f"/asset-v1:course-{index % 50}.png",
+            start=datetime(2024, 1, 1) + timedelta(days=index % 365),
+            end=None if index % 2 else datetime(2025, 1, 1),
+            self_paced=bool(index % 3),
+            eligible_for_financial_aid=bool(index % 5),
+            org=f"Org{index % 20}",
+            language="en" if index % 5 else None,
+        )
+        for index in range(count)
+    ]
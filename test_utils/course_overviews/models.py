@@ -0,0 +1,34 @@
+"""
+CourseOverview model of the test double of the ``course_overviews`` app.
+"""
+
+from django.db import models
+
+
+class CourseOverview(models.Model):
+    """
+    The CourseOverview fields read by the plugin.
+
+    .. no_pii:
+    """
+
+    id = models.CharField(max_length=255, primary_key=True)
+    display_name = models.TextField(null=True)
+    short_description = models.TextField(null=True)
+    banner_image_url = models.TextField(default="")
+    course_image_url = models.TextField(default="")
+    start = models.DateTimeField(null=True)
+    end = models.DateTimeField(null=True)
+    enrollment_start = models.DateTimeField(null=True)
+    enrollment_end = models.DateTimeField(null=True)
+    self_paced = models.BooleanField(default=False)
+    eligible_for_financial_aid = models.BooleanField(default=True)
+    org = models.TextField(default="")
+    language = models.TextField(null=True)
+    modified = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "course_overviews"
+
+    def __str__(self):
+        return self.id
@@ -0,0 +1,204 @@
+"""
+In-memory test double of the Saleor API client.
+"""
+
+import asyncio
+import concurrent.futures
+
+from platform_plugin_saleor.saleor_client.batch import OperationResult
+from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
+
+PRODUCT_TYPE_ID = "UHJvZHVjdFR5cGU6MQ=="
+
+
+class FakeSaleorApiClient:
+    """
+    Stand-in for SaleorApiClient, keeping the products of Saleor in memory.
+
+    Products are keyed by external reference, and creating one that already exists fails
+    like Saleor does. Every call is recorded in ``calls`` as the operation name and the
+    external references sent.
+
+    Submitted coroutines only run when their result is requested, so that the futures in
+    flight at once are counted in ``max_in_flight``.
+
+    Args:
+        failing (set): External references whose products Saleor rejects.
+        crash_after (int): Number of calls to ``submit`` after which the process is
+            killed, once the last one reached Saleor.
+        batch_errors (dict): Exceptions raised by the calls sending a given external
+            reference, failing its whole batch.
+    """
+
+    def __init__(self, failing=(), crash_after=None, batch_errors=None):
+        self.products = {}
+        self.calls = []
+        self.failing = set(failing)
+        self.crash_after = crash_after
+        self.batch_errors = dict(batch_errors or {})
+        self.in_flight = set()
+        self.max_in_flight = 0
+        self.async_client = FakeAsyncSaleorClient(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """
+        Return the future of a coroutine of the async client, run once its result is requested.
+        """
+        future = FakeFuture(self, coro)
+        self.in_flight.add(future)
+        self.max_in_flight = max(self.max_in_flight, len(self.in_flight))
+
+        if self.crash_after is not None:
+            self.crash_after -= 1
+
+            if self.crash_after < 0:
+                future.run()
+                raise KeyboardInterrupt
+
+        return future
+
+    def get_course_product_type_id(self, config=None):  # pylint: disable=unused-argument
+        """
+        Return the ID of the course product type.
+        """
+        return PRODUCT_TYPE_ID
+
+    def create_products(self, products) -> dict:
+        """
+        Create products, failing for those that already exist.
+        """
+        self._record_call("create", products)
+
+        return {
+            product["externalReference"]: self._save_product(product, exists=False)
+            for product in products
+        }
+
+    def update_products(self, products, batch_size=None) -> dict:  # pylint: disable=unused-argument
+        """
+        Update existing products with the fields of their input.
+        """
+        self._record_call("update", products)
+
+        return {
+            product["externalReference"]: self._save_product(product, exists=True)
+            for product in products
+        }
+
+    def upsert_products(self, products, batch_size=None) -> dict:  # pylint: disable=unused-argument
+        """
+        Create the missing products and update the others.
+        """
+        self._record_call("upsert", products)
+
+        return {
+            product["externalReference"]: self._save_product(product)
+            for product in products
+        }
+
+    def _record_call(self, operation, products):
+        """
+        Record a call, then raise the batch error of any of its products.
+        """
+        external_references = [product["externalReference"] for product in products]
+        self.calls.append((operation, external_references))
+
+        for external_reference in external_references:
+            if external_reference in self.batch_errors:
+                raise self.batch_errors[external_reference]
+
+    def _save_product(self, product, exists=None) -> OperationResult:
+        """
+        Store a product input and return the OperationResult Saleor would.
+        """
+        external_reference = product["externalReference"]
+
+        if external_reference in self.failing:
+            return OperationResult(error=GraphQLError([{"code": "INVALID", "field": "name"}]))
+
+        if exists is not None and exists != (external_reference in self.products):
+            code = "NOT_FOUND" if exists else "UNIQUE"
+            return OperationResult(error=GraphQLError([{"code": code, "field": "externalReference"}]))
+
+        saved = self.products.setdefault(external_reference, {"id": f"product-{external_reference}"})
+        saved.update(product)
+
+        return OperationResult({"id": saved["id"], "externalReference": external_reference})
+
+
+class FakeFuture(concurrent.futures.Future):
+    """
+    Future of a coroutine submitted to FakeSaleorApiClient, run when its result is requested.
+    """
+
+    def __init__(self, client, coro):
+        super().__init__()
+        self.client = client
+        self.coro = coro
+
+    def run(self):
+        """
+        Run the coroutine, unless the future is already done, and store its outcome.
+        """
+        if self.done():
+            return
+
+        self.client.in_flight.discard(self)
+
+        try:
+            self.set_result(asyncio.run(self.coro))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.set_exception(e)
+
+    def result(self, timeout=None):
+        """
+        Run the coroutine if needed, then return its result.
+        """
+        self.run()
+        return super().result(timeout)
+
+    def cancel(self):
+        """
+        Cancel the future, closing its coroutine if it did not run.
+        """
+        cancelled = super().cancel()
+
+        if cancelled:
+            self.client.in_flight.discard(self)
+            self.coro.close()
+
+        return cancelled
+
+
+class FakeAsyncSaleorClient:
+    """
+    The async client of FakeSaleorApiClient, for the methods that send courses.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create_course_products_bulk(self, courses, config, batch_size=None):  # pylint: disable=unused-argument
+        """
+        Create the products of courses.
+        """
+        return self.client.create_products(self._serialize(courses, config))
+
+    async def upsert_course_products(self, courses, config, batch_size=None):  # pylint: disable=unused-argument
+        """
+        Create or update the products of courses.
+        """
+        return self.client.upsert_products(self._serialize(courses, config))
+
+    @staticmethod
+    def _serialize(courses, config) -> list:
+        """
+        Build the product inputs of courses.
+        """
+        return [config.product_serializer.serialize(course, PRODUCT_TYPE_ID) for course in courses]
@@ -0,0 +1,14 @@
+"""
+Test double of the Open edX ``student`` user helpers read by the plugin.
+
+``tests/conftest.py`` installs this module under the Open edX import path.
+"""
+
+import hashlib
+
+
+def anonymous_id_for_user(user, course_id):
+    """
+    Return a stable anonymous ID of a user, like Open edX does.
+    """
+    return hashlib.md5(f"{user.id}:{course_id}".encode()).hexdigest()
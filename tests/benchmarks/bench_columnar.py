@@ -0,0 +1,86 @@
+"""
+Benchmark of building product inputs per row and column by column.
+
+Builds the products of 10,000 synthetic courses in batches, from model instances with
+``serialize`` and from ``values_list`` rows with ``serialize_rows``, and prints the best
+time and the peak allocations of each. Not collected by the test suite, run it with::
+
+    python -m pytest tests/benchmarks/bench_columnar.py -s --no-cov
+"""
+
+import time
+import tracemalloc
+
+import pytest
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.saleor_client.batch import iter_batches
+from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig
+from test_utils.course_overviews.factories import build_courses
+
+COURSES = 10000
+BATCH_SIZE = 50
+ROUNDS = 5
+
+
+def measure(build) -> tuple:
+    """
+    Return the best time of a build, in seconds, and its peak allocations, in bytes.
+    """
+    timings = []
+
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak
+
+
+@pytest.mark.django_db
+def test_columnar_benchmark():
+    """
+    Compare the per-row and columnar builds, from memory and from the database.
+    """
+    CourseOverview.objects.bulk_create(build_courses(COURSES), batch_size=1000)
+    config = EdxCourseOverviewSaleorConfig()
+    serializer = config.product_serializer
+    fields = (*config.get_model_fields(), "display_name", "short_description")
+    courses = list(CourseOverview.objects.only(*fields).order_by("id"))
+    rows = list(CourseOverview.objects.values_list(*serializer.row_fields).order_by("id"))
+
+    assert serializer.serialize_rows(rows, "product-type") == [
+        serializer.serialize(course, "product-type") for course in courses
+    ]
+
+    builds = {
+        "per row": lambda: [
+            [serializer.serialize(course, "product-type") for course in batch]
+            for batch in iter_batches(courses, BATCH_SIZE)
+        ],
+        "columnar": lambda: [
+            serializer.serialize_rows(batch, "product-type")
+            for batch in iter_batches(rows, BATCH_SIZE)
+        ],
+        "per row, from the database": lambda: [
+            [serializer.serialize(course, "product-type") for course in batch]
+            for batch in iter_batches(CourseOverview.objects.only(*fields).iterator(chunk_size=1000), BATCH_SIZE)
+        ],
+        "columnar, from the database": lambda: [
+            serializer.serialize_rows(batch, "product-type")
+            for batch in iter_batches(
+                CourseOverview.objects.values_list(*serializer.row_fields).iterator(chunk_size=1000), BATCH_SIZE,
+            )
+        ],
+    }
+
+    print(f"\nProduct inputs of {COURSES} courses, in batches of {BATCH_SIZE}:")
+
+    for name, build in builds.items():
+        best, peak = measure(build)
+        print(f"  {name}: {best * 1000:.0f} ms, peak {peak / 1e6:.1f} MB")
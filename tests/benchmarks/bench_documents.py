@@ -0,0 +1,43 @@
+"""
+Benchmark of parsing GraphQL documents per request and reusing pre-parsed ones.
+
+Sends every query and mutation constant through ``gql()``, as the client did on each
+call, and through the registry of compiled documents. Not collected by the test suite,
+run it with::
+
+    python -m pytest tests/benchmarks/bench_documents.py -s --no-cov
+"""
+
+import time
+
+from gql import gql
+
+from platform_plugin_saleor.saleor_client.documents import compile_documents, get_document
+
+ROUNDS = 200
+
+
+def measure(lookup, queries) -> float:
+    """
+    Return the time of a lookup per query, in microseconds.
+    """
+    started_at = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        for query in queries:
+            lookup(query)
+
+    return (time.perf_counter() - started_at) / (ROUNDS * len(queries)) * 1e6
+
+
+def test_documents_benchmark():
+    """
+    Compare parsing each document per call with the registry lookup.
+    """
+    queries = list(compile_documents())
+
+    assert all(get_document(query).document == gql(query) for query in queries)
+
+    print(f"\nDocuments of {len(queries)} Saleor operations, {ROUNDS} rounds:")
+    print(f"  gql() per call: {measure(gql, queries):.1f} µs per call")
+    print(f"  registry lookup: {measure(get_document, queries):.2f} µs per call")
@@ -0,0 +1,95 @@
+"""
+Benchmark of extracting mutation errors from their known roots and walking the response.
+
+Compares ``extract_errors``, which only looks at ``<rootField>.errors`` and
+``<rootField>.results[*].errors``, with the recursive ``find_errors`` walk on bulk
+mutation responses. Not collected by the test suite, run it with::
+
+    python -m pytest tests/benchmarks/bench_errors.py -s --no-cov
+"""
+
+import timeit
+
+from platform_plugin_saleor.saleor_client.utils import extract_errors, find_errors
+
+NUMBER = 2000
+PRODUCTS = 100
+
+
+def get_product_bulk_response(failed_index: int = None) -> dict:
+    """
+    Return a productBulkCreate response, with an error for one product if given.
+    """
+    return {
+        "productBulkCreate": {
+            "count": PRODUCTS - (failed_index is not None),
+            "results": [
+                {
+                    "product": None if index == failed_index else {
+                        "id": f"UHJvZHVjdDo{index}",
+                        "externalReference": f"course-v1:edX+C{index}+2024",
+                    },
+                    "errors": [{"path": "name", "message": "Invalid.", "code": "INVALID"}]
+                    if index == failed_index else [],
+                }
+                for index in range(PRODUCTS)
+            ],
+            "errors": [],
+        },
+    }
+
+
+def get_attribute_bulk_response() -> dict:
+    """
+    Return a successful attributeBulkCreate response with attribute values.
+    """
+    return {
+        "attributeBulkCreate": {
+            "count": 20,
+            "results": [
+                {
+                    "attribute": {
+                        "id": f"QXR0cmlidXRlOj{index}",
+                        "name": f"Attribute {index}",
+                        "choices": {
+                            "edges": [{"node": {"id": f"V{value}", "name": f"Value {value}"}} for value in range(20)],
+                        },
+                    },
+                    "errors": [],
+                }
+                for index in range(20)
+            ],
+            "errors": [],
+        },
+    }
+
+
+def measure(function, response, **kwargs) -> float:
+    """
+    Return the best time of a call, in microseconds.
+    """
+    return min(timeit.repeat(lambda: function(response, **kwargs), number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def test_errors_benchmark():
+    """
+    Compare the targeted extraction with the recursive walk.
+    """
+    responses = {
+        f"productBulkCreate, {PRODUCTS} products, no errors": ("productBulkCreate", get_product_bulk_response()),
+        f"productBulkCreate, {PRODUCTS} products, last one failed": (
+            "productBulkCreate",
+            get_product_bulk_response(failed_index=PRODUCTS - 1),
+        ),
+        "attributeBulkCreate, 20 attributes, no errors": ("attributeBulkCreate", get_attribute_bulk_response()),
+    }
+
+    print("\nError extraction:")
+
+    for name, (root_field, response) in responses.items():
+        assert bool(extract_errors(response, root_field=root_field)) == bool(find_errors(response))
+
+        print(
+            f"  {name}: find_errors {measure(find_errors, response):.1f} µs, "
+            f"extract_errors {measure(extract_errors, response, root_field=root_field):.1f} µs"
+        )
@@ -0,0 +1,121 @@
+"""
+Benchmark of the JSON backends on realistic Saleor payloads.
+
+Encodes and decodes an order webhook body and a page of products with ``json_backend``,
+once on its stdlib fallback and once on orjson. Needs orjson
+(``pip install platform-plugin-saleor[fast-json]``). Not collected by the test suite,
+run it with::
+
+    python -m pytest tests/benchmarks/bench_json.py -s --no-cov
+"""
+
+import timeit
+from unittest import mock
+
+import pytest
+
+from platform_plugin_saleor.saleor_client import json_backend
+from platform_plugin_saleor.saleor_client.utils import create_rich_text
+
+pytest.importorskip("orjson")
+
+ROUNDS = 5
+
+
+def get_order_webhook() -> dict:
+    """
+    Return the body of an order webhook with 20 course lines.
+    """
+    return {
+        "order": {
+            "id": "T3JkZXI6MQ==",
+            "number": "1001",
+            "userEmail": "learner@example.com",
+            "lines": [
+                {
+                    "id": f"T3JkZXJMaW5lOj{index}",
+                    "productSku": f"course-v1:edX+C{index}+2024",
+                    "variant": {
+                        "id": f"UHJvZHVjdFZhcmlhbnQ6{index}",
+                        "sku": f"course-v1:edX+C{index}+2024-verified",
+                        "name": "verified",
+                        "product": {
+                            "id": f"UHJvZHVjdDo{index}",
+                            "name": f"Cours n°{index}",
+                            "externalReference": f"course-v1:edX+C{index}+2024",
+                        },
+                    },
+                    "quantity": 1,
+                    "unitPrice": {"gross": {"amount": 49.0, "currency": "USD"}},
+                }
+                for index in range(20)
+            ],
+            "metadata": [{"key": f"key-{index}", "value": "v" * 40} for index in range(10)],
+        },
+    }
+
+
+def get_products_page() -> dict:
+    """
+    Return a page of 100 products with their description and attributes.
+    """
+    description = json_backend.dumps(create_rich_text("Learn the basics. " * 30))
+
+    return {
+        "data": {
+            "products": {
+                "pageInfo": {"hasNextPage": True, "endCursor": "WyJjb3Vyc2UtOTkiXQ=="},
+                "edges": [
+                    {
+                        "node": {
+                            "id": f"UHJvZHVjdDo{index}",
+                            "name": f"Course {index}",
+                            "slug": f"course-{index}",
+                            "description": description,
+                            "attributes": [
+                                {"attribute": {"slug": slug}, "values": [{"name": f"{slug}-{index}"}]}
+                                for slug in ("org", "start", "end", "pacing", "language", "effort")
+                            ],
+                        },
+                    }
+                    for index in range(100)
+                ],
+            },
+        },
+    }
+
+
+def measure(function, argument, number) -> float:
+    """
+    Return the best time of a call, in microseconds.
+    """
+    return min(timeit.repeat(lambda: function(argument), number=number, repeat=ROUNDS)) / number * 1e6
+
+
+def test_json_benchmark():
+    """
+    Compare the standard library and orjson on encoding and decoding.
+    """
+    payloads = {
+        "order webhook": (get_order_webhook(), 2000),
+        "products page": (get_products_page(), 200),
+    }
+
+    print("\nJSON backends:")
+
+    for name, (payload, number) in payloads.items():
+        with mock.patch.object(json_backend, "orjson", None):
+            encoded = json_backend.dumps(payload)
+            body = encoded.encode("utf-8")
+            timings = {
+                "stdlib dumps": measure(json_backend.dumps, payload, number),
+                "stdlib loads": measure(json_backend.loads, body, number),
+            }
+
+        assert json_backend.dumps(payload) == encoded
+
+        timings["orjson dumps"] = measure(json_backend.dumps, payload, number)
+        timings["orjson loads"] = measure(json_backend.loads, body, number)
+        print(f"  {name}, {len(body)} bytes: " + ", ".join(
+            f"{operation} {timing:.1f} µs" for operation, timing in timings.items()
+        ))
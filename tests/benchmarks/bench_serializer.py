@@ -0,0 +1,95 @@
+"""
+Benchmark of building product inputs with the compiled serializer.
+
+Builds the products of 10,000 synthetic courses with per-row field lookups, as
+``create_course_product`` did before the serializer was compiled, with a configuration
+created per call and with the shared default configuration. Not collected by the test
+suite, run it with::
+
+    python -m pytest tests/benchmarks/bench_serializer.py -s --no-cov
+"""
+
+import time
+
+from platform_plugin_saleor.saleor_client import json_backend
+from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig, get_default_config
+from platform_plugin_saleor.saleor_client.utils import (
+    ATTRIBUTE_TYPES_MAP,
+    convert_to_camel_case,
+    create_rich_text,
+    format_attribute_value,
+    get_model_field_type,
+)
+from test_utils.course_overviews.factories import build_courses
+
+COURSES = 10000
+ROUNDS = 5
+
+
+def serialize_with_lookups(course, product_type_id, config):
+    """
+    Build the product input of a course, resolving each attribute type per course.
+    """
+    attributes = []
+
+    for attrb in config.attributes_mapping:
+        model_attribute_type = get_model_field_type(config.model, attrb.model_attribute)
+        product_input_type = ATTRIBUTE_TYPES_MAP.get(model_attribute_type, "PLAIN_TEXT")
+        attributes.append({
+            "externalReference": attrb.model_attribute,
+            **format_attribute_value(
+                convert_to_camel_case(product_input_type.lower()),
+                getattr(course, attrb.model_attribute, None),
+            ),
+        })
+
+    return {
+        "productType": product_type_id,
+        "name": str(course.display_name),
+        "description": json_backend.dumps(create_rich_text(course.short_description)),
+        "attributes": attributes,
+        "externalReference": str(course.id),
+    }
+
+
+def measure(build) -> float:
+    """
+    Return the best time of a build, in seconds.
+    """
+    timings = []
+
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings)
+
+
+def test_serializer_benchmark():
+    """
+    Compare per-row lookups with the compiled serializer.
+    """
+    courses = build_courses(COURSES)
+    config = get_default_config()
+    serializer = config.product_serializer
+
+    assert [serialize_with_lookups(course, "product-type", config) for course in courses] == [
+        serializer.serialize(course, "product-type") for course in courses
+    ]
+
+    builds = {
+        "per-row lookups": lambda: [serialize_with_lookups(course, "product-type", config) for course in courses],
+        "serializer compiled per call": lambda: [
+            EdxCourseOverviewSaleorConfig().product_serializer.serialize(course, "product-type")
+            for course in courses
+        ],
+        "default config serializer": lambda: [
+            get_default_config().product_serializer.serialize(course, "product-type") for course in courses
+        ],
+    }
+
+    print(f"\nProduct inputs of {COURSES} courses:")
+
+    for name, build in builds.items():
+        print(f"  {name}: {measure(build) * 1000:.0f} ms")
@@ -0,0 +1,24 @@
+"""
+Pytest configuration of the plugin tests.
+
+The plugin imports CourseOverview and user helpers from Open edX, which is not installed
+here, so the test doubles of ``test_utils`` are installed under their import paths.
+"""
+
+import sys
+from types import ModuleType
+
+from test_utils import student
+from test_utils.course_overviews import models as course_overview_models
+
+OPENEDX_MODULES = {
+    "openedx.core.djangoapps.content.course_overviews.models": course_overview_models,
+    "common.djangoapps.student.models.user": student,
+}
+
+for module_path, module in OPENEDX_MODULES.items():
+    for index in range(1, module_path.count(".") + 1):
+        package = ".".join(module_path.split(".")[:index])
+        sys.modules.setdefault(package, ModuleType(package))
+
+    sys.modules.setdefault(module_path, module)
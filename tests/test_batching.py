@@ -0,0 +1,137 @@
+"""
+Tests for batched GraphQL requests to Saleor.
+"""
+
+import asyncio
+from unittest import mock
+
+import aiohttp
+import pytest
+from gql.transport.exceptions import TransportProtocolError, TransportServerError
+
+from platform_plugin_saleor.saleor_client.async_client import AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.circuit_breaker import CircuitBreaker
+from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
+from platform_plugin_saleor.saleor_client.mutations import CREATE_COURSE_PRODUCT
+from platform_plugin_saleor.saleor_client.queries import GET_PRODUCT_TYPES
+from platform_plugin_saleor.saleor_client.transport import PooledClientSession
+
+OPERATIONS = [
+    {"query": "query A { shop { name } }", "variables": {}, "operationName": "A"},
+    {"query": "query B { shop { name } }", "variables": {}, "operationName": "B"},
+]
+
+
+def post(session, results=None, status=200):
+    """
+    Send the operations in a batch, Saleor answering with the given JSON results.
+
+    Returns:
+        list: The results returned by the session.
+    """
+    response = mock.Mock(status=status)
+    response.json = mock.AsyncMock(return_value=results)
+    response.text = mock.AsyncMock(return_value=repr(results))
+
+    if results is ValueError:
+        response.json.side_effect = ValueError("Invalid JSON")
+
+    if status >= 400:
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            mock.Mock(), (), status=status, message="Error",
+        )
+
+    transport = mock.Mock(ssl=None)
+    transport.session.post.return_value.__aenter__ = mock.AsyncMock(return_value=response)
+    transport.session.post.return_value.__aexit__ = mock.AsyncMock(return_value=False)
+    session._client = mock.Mock(transport=transport)  # pylint: disable=protected-access
+
+    with mock.patch.object(session, "connect"):
+        return asyncio.run(session.execute_batch(OPERATIONS))
+
+
+def test_batch_is_posted_as_a_json_list():
+    """
+    The operations are posted at once, and Saleor answers with a result per operation.
+    """
+    session = PooledClientSession("http://saleor.test/graphql/")
+    results = [{"data": {"shop": {"name": "A"}}}, {"errors": [{"message": "Denied"}]}]
+
+    assert post(session, results) == results
+    session._client.transport.session.post.assert_called_once_with(  # pylint: disable=protected-access
+        "http://saleor.test/graphql/", ssl=None, json=OPERATIONS,
+    )
+
+
+@pytest.mark.parametrize("results", [
+    [{"data": {}}],
+    {"data": {}},
+    None,
+])
+def test_answer_without_a_result_per_operation_is_a_protocol_error(results):
+    """
+    A successful answer that does not match the batch is rejected.
+    """
+    with pytest.raises(TransportProtocolError, match="one result per batched operation"):
+        post(PooledClientSession("http://saleor.test/graphql/"), results)
+
+
+@pytest.mark.parametrize("results", [{"errors": [{"message": "Bad request"}]}, ValueError])
+def test_error_status_is_a_server_error(results):
+    """
+    An HTTP error answered with an error object or an invalid body keeps its status.
+    """
+    with pytest.raises(TransportServerError) as exc_info:
+        post(PooledClientSession("http://saleor.test/graphql/"), results, status=502)
+
+    assert exc_info.value.code == 502
+
+
+def test_each_operation_succeeds_or_fails_on_its_own():
+    """
+    GraphQL errors and mutation errors fail their own operation, not the batch.
+    """
+    client = AsyncSaleorApiClient("http://saleor.test/graphql/", "token", circuit_breaker=CircuitBreaker())
+    product_created = {"productCreate": {"product": {"id": "UHJvZHVjdDox"}, "errors": []}}
+    product_invalid = {"productCreate": {"product": None, "errors": [{"code": "INVALID", "field": "name"}]}}
+    client.session.execute_batch = mock.AsyncMock(side_effect=[
+        [
+            {"data": {"productTypes": {"edges": []}}},
+            {"data": None, "errors": [{"message": "Permission denied"}]},
+        ],
+        [{"data": product_created}, {"data": product_invalid}],
+    ])
+
+    results = asyncio.run(client.execute_many(
+        [
+            (GET_PRODUCT_TYPES, {"filter": {}}),
+            (GET_PRODUCT_TYPES, {"filter": {}}),
+            (CREATE_COURSE_PRODUCT, {"input": {"name": "A"}}),
+            (CREATE_COURSE_PRODUCT, {"input": {"name": ""}}),
+        ],
+        batch_size=2,
+    ))
+
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert results[0].data == {"productTypes": {"edges": []}}
+    assert isinstance(results[1].error, GraphQLError)
+    assert results[1].error.errors == [{"message": "Permission denied"}]
+    assert results[2].data == product_created
+    assert results[3].error.errors == [{"code": "INVALID", "field": "name"}]
+
+    batches = [call.args[0] for call in client.session.execute_batch.call_args_list]
+    assert [[operation["operationName"] for operation in batch] for batch in batches] == [
+        ["getProductTypes", "getProductTypes"],
+        ["CreateCourseProduct", "CreateCourseProduct"],
+    ]
+
+
+def test_failed_batch_request_raises():
+    """
+    A batch whose request fails raises, as none of its operations has a result.
+    """
+    client = AsyncSaleorApiClient("http://saleor.test/graphql/", "token", circuit_breaker=CircuitBreaker())
+    client.session.execute_batch = mock.AsyncMock(side_effect=TransportProtocolError("Not a list"))
+
+    with pytest.raises(TransportProtocolError):
+        asyncio.run(client.execute_many([(GET_PRODUCT_TYPES, {})]))
@@ -0,0 +1,144 @@
+"""
+Tests for the Saleor circuit breaker.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+from platform_plugin_saleor.saleor_client.async_client import AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from platform_plugin_saleor.saleor_client.exceptions import CircuitOpenError
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    """
+    Patch the monotonic clock of the circuit breaker.
+    """
+    with mock.patch("platform_plugin_saleor.saleor_client.circuit_breaker.time.monotonic", return_value=100.0) as clock:
+        yield clock
+
+
+def test_failures_open_the_circuit(clock):  # pylint: disable=unused-argument
+    """
+    The circuit opens once the failure threshold is reached and then fails fast.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_while_open_is_ignored(clock):  # pylint: disable=unused-argument
+    """
+    A straggler success reported while the circuit is open does not close it.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    breaker.record_success()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_trial_success_closes_the_circuit(clock):
+    """
+    After the recovery timeout, a single trial call goes through and its success closes the circuit.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.return_value = 111.0
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_half_open_trial_failure_reopens_the_circuit(clock):
+    """
+    A failed trial call opens the circuit again for a full recovery timeout.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.return_value = 111.0
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def send(breaker, exc):
+    """
+    Send a mutation failing with an exception through a client using the breaker.
+
+    Returns:
+        mock.AsyncMock: The request, to count its calls.
+    """
+    client = AsyncSaleorApiClient("http://saleor.test/graphql/", "token", circuit_breaker=breaker)
+    request = mock.AsyncMock(side_effect=exc)
+
+    with pytest.raises(type(exc)):
+        asyncio.run(client._send_with_retry("mutation", "productCreate", request))  # pylint: disable=protected-access
+
+    return request
+
+
+def test_server_errors_open_the_circuit(clock):  # pylint: disable=unused-argument
+    """
+    A 500 is not retried, but counts as a failure of Saleor.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    assert send(breaker, TransportServerError("500 Server Error", 500)).call_count == 1
+    send(breaker, TransportServerError("500 Server Error", 500))
+
+    assert breaker.state == OPEN
+    request = send(breaker, CircuitOpenError("saleor", 10))
+    assert not request.called
+
+
+@pytest.mark.parametrize("exc", [
+    TransportServerError("400 Bad Request", 400),
+    TransportQueryError("Permission denied"),
+])
+def test_client_errors_are_neutral(clock, exc):
+    """
+    Client and GraphQL errors neither count as failures nor close a half-open circuit.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    breaker.record_failure()
+
+    send(breaker, exc)
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.return_value = 111.0
+    send(breaker, exc)
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
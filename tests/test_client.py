@@ -0,0 +1,221 @@
+"""
+Tests for the blocking Saleor API client and its background event loop.
+"""
+
+import asyncio
+import threading
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+
+from platform_plugin_saleor.saleor_client.client import SaleorApiClient
+from platform_plugin_saleor.saleor_client.transport import EventLoopThread
+
+
+@pytest.fixture(name="loop_thread")
+def fixture_loop_thread():
+    """
+    Return an event loop thread, stopped after the test.
+    """
+    loop_thread = EventLoopThread(name="test-loop")
+    yield loop_thread
+    loop_thread.stop()
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    """
+    Return a Saleor API client, closed after the test.
+    """
+    client = SaleorApiClient(base_url="http://saleor.test/graphql/", token="token")
+    yield client
+    client.close()
+
+
+async def get_thread_name():
+    """
+    Return the name of the thread running the coroutine.
+    """
+    return threading.current_thread().name
+
+
+async def get_loop():
+    """
+    Return the event loop running the coroutine.
+    """
+    return asyncio.get_running_loop()
+
+
+def test_loop_thread_runs_coroutines(loop_thread):
+    """
+    Coroutines run on the loop thread, started on first use, blocking or not.
+    """
+    assert not loop_thread.is_running
+
+    assert loop_thread.run(get_thread_name()) == "test-loop"
+    assert loop_thread.submit(get_thread_name()).result() == "test-loop"
+    assert loop_thread.is_running
+
+
+def test_loop_thread_cannot_block_on_itself(loop_thread):
+    """
+    Blocking on the loop from a coroutine running on it fails instead of deadlocking.
+    """
+    async def run_nested():
+        loop_thread.run(get_thread_name())
+
+    with pytest.raises(RuntimeError, match="Use the async client instead"):
+        loop_thread.run(run_nested())
+
+
+def test_loop_thread_stops(loop_thread):
+    """
+    Stopping joins the thread and closes the loop, and can be done several times.
+    """
+    loop_thread.run(get_thread_name())
+    loop = loop_thread.loop
+
+    loop_thread.stop()
+    loop_thread.stop()
+
+    assert not loop_thread.is_running
+    assert loop.is_closed()
+    assert loop_thread.run(get_thread_name()) == "test-loop"
+
+
+def test_client_reuses_its_loop(client):
+    """
+    Every call of a client runs on the same background loop.
+    """
+    assert client.run(get_thread_name()) == "saleor-client-loop"
+    assert client.run(get_loop()) is client.submit(get_loop()).result()
+
+
+def test_close_is_idempotent(client):
+    """
+    Closing releases the session and stops the loop once, later calls do nothing.
+    """
+    client.close()
+    client.run(get_thread_name())
+
+    with mock.patch.object(client.async_client.session, "close") as close_session:
+        client.close()
+        client.close()
+
+    close_session.assert_awaited_once()
+    assert not client._loop_thread.is_running  # pylint: disable=protected-access
+
+
+def test_client_is_recreated_after_fork(client):
+    """
+    A forked process gets its own loop and session, and does not close the parent's.
+    """
+    client.run(get_thread_name())
+    parent_loop_thread = client._loop_thread  # pylint: disable=protected-access
+
+    with mock.patch("platform_plugin_saleor.saleor_client.client.os.getpid", return_value=-1):
+        with mock.patch.object(client.async_client.session, "discard") as discard:
+            assert client.run(get_thread_name()) == "saleor-client-loop"
+
+        assert client._loop_thread is not parent_loop_thread  # pylint: disable=protected-access
+        discard.assert_called_once_with()
+
+    with mock.patch.object(client.async_client, "close") as close:
+        client.close()
+
+    close.assert_not_called()
+    assert parent_loop_thread.is_running
+
+    parent_loop_thread.stop()
+    client._loop_thread.stop()  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("command, method", [
+    ("saleor_create_product_type", "create_product_type"),
+    ("saleor_create_product_attributes", "create_product_attributes"),
+])
+def test_commands_close_their_client(settings, command, method):
+    """
+    The setup commands release the connection pool of their client when they are done.
+    """
+    settings.SALEOR_API_URL = "http://saleor.test/graphql/"
+    settings.SALEOR_API_TOKEN = "token"
+
+    with mock.patch(f"platform_plugin_saleor.management.commands.{command}.SaleorApiClient") as client_class:
+        client = client_class.return_value.__enter__.return_value
+        getattr(client, method).return_value = {"attributeBulkCreate": {"results": []}}
+
+        call_command(command, stdout=StringIO())
+
+    getattr(client, method).assert_called_once()
+    client_class.return_value.__exit__.assert_called_once()
+
+
+def test_coroutine_methods_are_blocking(client):
+    """
+    Coroutine methods of the async client run on the background loop and return their result.
+    """
+    async def get_warehouse_id(name, default=None):  # pylint: disable=unused-argument
+        return f"{name} on {threading.current_thread().name}"
+
+    client.async_client.get_warehouse_id = get_warehouse_id
+
+    assert client.get_warehouse_id("Main") == "Main on saleor-client-loop"
+    assert client.get_warehouse_id.__name__ == "get_warehouse_id"
+
+
+def test_other_attributes_are_not_wrapped(client):
+    """
+    Plain attributes of the async client are returned as is, private ones are not exposed.
+    """
+    assert client.page_size == client.async_client.page_size
+    assert client.metadata_key("attribute_ids") == client.async_client.metadata_key("attribute_ids")
+
+    with pytest.raises(AttributeError):
+        client._send  # pylint: disable=pointless-statement,protected-access
+
+    with pytest.raises(AttributeError):
+        client.missing  # pylint: disable=pointless-statement
+
+
+def test_async_generators_are_iterated_on_demand(client):
+    """
+    Async generator methods become generators fetching each item from the loop when asked.
+    """
+    produced = []
+
+    async def paginate(query, variables=None, page_size=None):  # pylint: disable=unused-argument
+        for name in ("A", "B", "C"):
+            produced.append(name)
+            yield {"name": name}
+
+    client.async_client.paginate = paginate
+    nodes = client.paginate("query")
+
+    assert next(nodes) == {"name": "A"}
+    assert produced == ["A"]
+    assert [node["name"] for node in nodes] == ["B", "C"]
+
+
+def test_async_generator_is_closed_on_early_exit(client):
+    """
+    Stopping the iteration early closes the async generator on the loop.
+    """
+    closed = []
+
+    async def paginate(query, variables=None, page_size=None):  # pylint: disable=unused-argument
+        try:
+            for name in ("A", "B", "C"):
+                yield {"name": name}
+        finally:
+            closed.append(threading.current_thread().name)
+
+    client.async_client.paginate = paginate
+    nodes = client.paginate("query")
+
+    assert next(nodes) == {"name": "A"}
+    nodes.close()
+
+    assert closed == ["saleor-client-loop"]
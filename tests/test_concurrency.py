@@ -0,0 +1,159 @@
+"""
+Tests for the adaptive concurrency limit of Saleor API calls.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from platform_plugin_saleor.saleor_client.concurrency import AdaptiveLimiter
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    """
+    Patch the monotonic clock of the limiter.
+    """
+    with mock.patch("platform_plugin_saleor.saleor_client.concurrency.time.monotonic", return_value=100.0) as clock:
+        yield clock
+
+
+def test_limit_increases_additively():
+    """
+    Each fast response grows the limit by 1 / limit, about one per window of requests.
+    """
+    async def run():
+        limiter = AdaptiveLimiter(initial_limit=1, latency_target=1.0)
+
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+        assert limiter.limit == 2
+
+        for expected_limit in (2, 2, 3):
+            await limiter.acquire()
+            limiter.release(latency=0.1)
+            assert limiter.limit == expected_limit
+
+        assert limiter.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_limit_is_halved_once_per_congestion_event(clock):
+    """
+    Requests sent before a decrease do not decrease the limit again when they fail.
+    """
+    async def run():
+        limiter = AdaptiveLimiter(initial_limit=8, latency_target=1.0)
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        clock.return_value = 101.0
+        limiter.release(latency=1.0, overloaded=True)
+        assert limiter.limit == 4
+
+        clock.return_value = 101.5
+        limiter.release(latency=1.5, overloaded=True)
+        assert limiter.limit == 4
+
+        clock.return_value = 103.0
+        limiter.release(latency=1.5)
+        assert limiter.limit == 2
+
+    asyncio.run(run())
+
+
+def test_limit_stays_within_bounds(clock):  # pylint: disable=unused-argument
+    """
+    The limit never goes below the minimum nor above the maximum.
+    """
+    limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, max_limit=3)
+    limiter.in_flight = 2
+
+    limiter.release(latency=0.1, overloaded=True)
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        limiter.in_flight += 1
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 3
+
+
+def test_released_slot_is_handed_to_first_waiter():
+    """
+    A released slot goes to the oldest waiting request, before any new one.
+    """
+    async def run():
+        limiter = AdaptiveLimiter(initial_limit=1)
+        granted = []
+
+        async def request(name):
+            await limiter.acquire()
+            granted.append(name)
+
+        await limiter.acquire()
+        waiters = [asyncio.create_task(request(name)) for name in ("first", "second")]
+        await asyncio.sleep(0)
+        assert not granted
+
+        limiter.release()
+        await asyncio.sleep(0)
+        assert granted == ["first"]
+        assert limiter.in_flight == 1
+
+        limiter.release()
+        await asyncio.gather(*waiters)
+        assert granted == ["first", "second"]
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_gives_back_its_slot():
+    """
+    A request cancelled right after being granted a slot releases it for the next one.
+    """
+    async def run():
+        limiter = AdaptiveLimiter(initial_limit=1)
+
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire())
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter.release()
+        cancelled.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        await waiting
+        assert limiter.in_flight == 1
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    """
+    A request cancelled while waiting is not granted a slot afterwards.
+    """
+    async def run():
+        limiter = AdaptiveLimiter(initial_limit=1)
+
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        limiter.release()
+        assert limiter.in_flight == 0
+
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+    asyncio.run(run())
@@ -0,0 +1,136 @@
+"""
+Tests for the command creating the Saleor products of courses.
+"""
+
+import re
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from gql.transport.exceptions import TransportServerError
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.models import SaleorSyncJob
+from platform_plugin_saleor.saleor_client.exceptions import CircuitOpenError
+from test_utils.saleor import FakeSaleorApiClient
+
+COURSE_IDS = [f"course-v1:edX+C{index}+2024" for index in range(10)]
+
+
+@pytest.fixture(name="courses", autouse=True)
+def fixture_courses(db, settings):  # pylint: disable=unused-argument
+    """
+    Create the courses of the catalog and configure the Saleor API.
+    """
+    settings.SALEOR_API_URL = "http://saleor.test/graphql/"
+    settings.SALEOR_API_TOKEN = "token"
+
+    return CourseOverview.objects.bulk_create(
+        CourseOverview(id=course_id, display_name=f"Course {course_id}") for course_id in COURSE_IDS
+    )
+
+
+def create_products(client, *args):
+    """
+    Run the course products command with a Saleor client, in batches of two courses.
+
+    Returns:
+        list: The lines printed by the command.
+    """
+    stdout = StringIO()
+
+    with mock.patch(
+        "platform_plugin_saleor.management.commands.saleor_create_course_products.SaleorApiClient",
+        return_value=client,
+    ):
+        call_command("saleor_create_course_products", *args, "--batch-size", "2", stdout=stdout)
+
+    return stdout.getvalue().splitlines()
+
+
+def test_failed_batch_is_recorded_for_each_course():
+    """
+    A batch failing as a whole fails each of its courses, and the other batches go on.
+    """
+    client = FakeSaleorApiClient(batch_errors={COURSE_IDS[2]: TransportServerError("500 Server Error", 500)})
+
+    output = create_products(client, "--all", "--job", "catalog", "--concurrency", "2")
+
+    job = SaleorSyncJob.objects.get(name="catalog")
+    assert job.status == SaleorSyncJob.RUNNING
+    assert job.processed == 10
+    assert list(job.failures.values_list("course_id", flat=True)) == COURSE_IDS[2:4]
+    assert sorted(client.products) == COURSE_IDS[:2] + COURSE_IDS[4:]
+    assert f"Error creating product for course {COURSE_IDS[3]}: 500 Server Error" in output
+    assert "Created 8 products, 2 failed." in output
+
+    client.batch_errors.clear()
+    create_products(client, "--resume", "catalog")
+
+    job.refresh_from_db()
+    assert job.status == SaleorSyncJob.COMPLETED
+    assert sorted(client.products) == COURSE_IDS
+
+
+def test_open_circuit_stops_the_job():
+    """
+    The job stops without a traceback when the circuit opens, and can be resumed.
+    """
+    client = FakeSaleorApiClient(batch_errors={COURSE_IDS[4]: CircuitOpenError("saleor.test", 30)})
+
+    output = create_products(client, "--all", "--job", "catalog")
+
+    job = SaleorSyncJob.objects.get(name="catalog")
+    assert job.cursor == COURSE_IDS[3]
+    assert output[-2] == (
+        "Error creating products: Saleor API saleor.test is unavailable, retry in 30.0s. "
+        "Continue with --resume catalog."
+    )
+
+    client.batch_errors.clear()
+    create_products(client, "--resume", "catalog")
+
+    job.refresh_from_db()
+    assert job.status == SaleorSyncJob.COMPLETED
+    assert sorted(client.products) == COURSE_IDS
+
+
+def test_results_are_printed_in_course_order():
+    """
+    Batches in flight at once are printed and recorded in the order of their courses.
+    """
+    client = FakeSaleorApiClient(failing={COURSE_IDS[5]})
+
+    output = create_products(client, "--all", "--job", "catalog", "--concurrency", "3")
+
+    printed = [re.search(r"product for course:? (course-v1:[^:\s]+)", line) for line in output]
+    assert [match[1] for match in printed if match] == COURSE_IDS
+    assert SaleorSyncJob.objects.get(name="catalog").cursor == COURSE_IDS[-1]
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_batches_in_flight_are_bounded_by_concurrency(concurrency):
+    """
+    No more than --concurrency batches are submitted before the oldest one is awaited.
+    """
+    client = FakeSaleorApiClient()
+
+    create_products(client, "--all", "--concurrency", str(concurrency))
+
+    assert client.max_in_flight == concurrency
+    assert sorted(client.products) == COURSE_IDS
+
+
+def test_pending_batches_are_cancelled_when_the_command_stops():
+    """
+    The batches still pending when the command is interrupted are cancelled, not sent.
+    """
+    client = FakeSaleorApiClient(crash_after=4)
+
+    with pytest.raises(KeyboardInterrupt):
+        create_products(client, "--all", "--job", "catalog", "--concurrency", "3")
+
+    assert client.calls == [("create", COURSE_IDS[0:2]), ("create", COURSE_IDS[2:4]), ("create", COURSE_IDS[8:10])]
+    assert not client.in_flight
+    assert SaleorSyncJob.objects.get(name="catalog").cursor == COURSE_IDS[3]
@@ -0,0 +1,27 @@
+"""
+Tests for the registry of pre-parsed GraphQL documents.
+"""
+
+from platform_plugin_saleor.saleor_client.documents import compile_document, get_document
+from platform_plugin_saleor.saleor_client.mutations import CREATE_PRODUCT_ATTRIBUTES
+
+
+def test_registered_document_root_field():
+    """
+    Registered constants are served with the details of their operation.
+    """
+    compiled = get_document(CREATE_PRODUCT_ATTRIBUTES)
+
+    assert compiled.name == "CREATE_PRODUCT_ATTRIBUTES"
+    assert compiled.operation_type == "mutation"
+    assert compiled.root_field == "attributeBulkCreate"
+
+
+def test_aliased_root_field():
+    """
+    The root field of an aliased selection is its response key.
+    """
+    compiled = compile_document('mutation { created: productCreate(input: {name: "A"}) { errors { code } } }')
+
+    assert compiled.root_field == "created"
+    assert compiled.operation_name is None
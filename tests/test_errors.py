@@ -0,0 +1,73 @@
+"""
+Tests for the errors raised from Saleor responses.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from platform_plugin_saleor.saleor_client.async_client import AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.circuit_breaker import CircuitBreaker
+from platform_plugin_saleor.saleor_client.exceptions import GraphQLError
+from platform_plugin_saleor.saleor_client.mutations import CREATE_PRODUCT_ATTRIBUTES
+from platform_plugin_saleor.saleor_client.queries import GET_PRODUCT_TYPES
+
+
+def execute(query, response_data):
+    """
+    Execute an operation that Saleor answers with the given data.
+    """
+    client = AsyncSaleorApiClient("http://saleor.test/graphql/", "token", circuit_breaker=CircuitBreaker())
+    client.session.execute = mock.AsyncMock(return_value=response_data)
+
+    return asyncio.run(client.execute(query, {}))
+
+
+def test_bulk_item_errors_are_grouped_by_index():
+    """
+    The errors of the failed items of a bulk mutation keep the index of their item.
+    """
+    invalid_name = {"message": "Invalid.", "code": "INVALID"}
+    duplicate = {"message": "Exists.", "code": "UNIQUE"}
+    response_data = {
+        "attributeBulkCreate": {
+            "results": [
+                {"attribute": None, "errors": [invalid_name, duplicate]},
+                {"attribute": {"id": "QXR0cmlidXRlOjE=", "name": "Org"}, "errors": []},
+                {"attribute": None, "errors": [duplicate]},
+            ],
+            "errors": [],
+        },
+    }
+
+    with pytest.raises(GraphQLError) as exc_info:
+        execute(CREATE_PRODUCT_ATTRIBUTES, response_data)
+
+    assert exc_info.value.item_errors == {
+        0: [{**invalid_name, "index": 0}, {**duplicate, "index": 0}],
+        2: [{**duplicate, "index": 2}],
+    }
+    assert exc_info.value.response_data == response_data
+
+
+def test_query_errors_are_raised():
+    """
+    Errors reported in the payload of a query are raised too.
+    """
+    error = {"field": "filter", "message": "Invalid filter.", "code": "INVALID"}
+
+    with pytest.raises(GraphQLError) as exc_info:
+        execute(GET_PRODUCT_TYPES, {"productTypes": {"edges": [], "errors": [error]}})
+
+    assert exc_info.value.errors == [error]
+    assert not exc_info.value.item_errors
+
+
+def test_successful_responses_are_returned():
+    """
+    Responses without errors are returned as is.
+    """
+    response_data = {"productTypes": {"edges": [{"node": {"id": "1", "errors": ["not a payload"]}}]}}
+
+    assert execute(GET_PRODUCT_TYPES, response_data) == response_data
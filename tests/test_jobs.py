@@ -0,0 +1,131 @@
+"""
+Tests for resumable catalog syncs.
+"""
+
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.models import SaleorCourseProduct, SaleorSyncJob
+from test_utils.saleor import FakeSaleorApiClient
+
+COURSE_IDS = [f"course-v1:edX+C{index}+2024" for index in range(10)]
+
+
+@pytest.fixture(name="courses", autouse=True)
+def fixture_courses(db, settings):  # pylint: disable=unused-argument
+    """
+    Create the courses of the catalog and configure the Saleor API.
+    """
+    settings.SALEOR_API_URL = "http://saleor.test/graphql/"
+    settings.SALEOR_API_TOKEN = "token"
+
+    return CourseOverview.objects.bulk_create(
+        CourseOverview(id=course_id, display_name=f"Course {course_id}") for course_id in COURSE_IDS
+    )
+
+
+def sync(client, *args):
+    """
+    Run the course products command with a Saleor client, in batches of two courses.
+    """
+    with mock.patch(
+        "platform_plugin_saleor.management.commands.saleor_create_course_products.SaleorApiClient",
+        return_value=client,
+    ):
+        call_command("saleor_create_course_products", *args, "--batch-size", "2", stdout=StringIO())
+
+
+def resume(client, products):
+    """
+    Resume the catalog job with a new client, against the products already in Saleor.
+    """
+    client.products = products
+    sync(client, "--resume", "catalog")
+
+    return SaleorSyncJob.objects.get(name="catalog")
+
+
+def test_killed_job_resumes_after_its_cursor():
+    """
+    A job killed halfway continues after the last recorded batch and completes.
+    """
+    killed = FakeSaleorApiClient(crash_after=2)
+
+    with pytest.raises(KeyboardInterrupt):
+        sync(killed, "--all", "--job", "catalog")
+
+    job = SaleorSyncJob.objects.get(name="catalog")
+    assert job.cursor == COURSE_IDS[3]
+    assert job.processed == 4
+
+    client = FakeSaleorApiClient()
+    job = resume(client, killed.products)
+
+    assert job.status == SaleorSyncJob.COMPLETED
+    assert job.processed == 10
+    assert not job.failures.exists()
+    assert sorted(client.products) == COURSE_IDS
+    assert [course_id for _, course_ids in client.calls for course_id in course_ids] == COURSE_IDS[4:]
+    assert dict(SaleorCourseProduct.objects.values_list("course_id", "product_id")) == {
+        course_id: f"product-{course_id}" for course_id in COURSE_IDS
+    }
+
+
+def test_unconfirmed_batches_are_upserted_on_resume():
+    """
+    The batch that reached Saleor without being recorded is upserted, not created again.
+    """
+    killed = FakeSaleorApiClient(crash_after=2)
+
+    with pytest.raises(KeyboardInterrupt):
+        sync(killed, "--all", "--job", "catalog")
+
+    assert COURSE_IDS[4] in killed.products
+
+    client = FakeSaleorApiClient()
+    resume(client, killed.products)
+
+    assert client.calls == [
+        ("upsert", COURSE_IDS[4:6]),
+        ("create", COURSE_IDS[6:8]),
+        ("create", COURSE_IDS[8:10]),
+    ]
+
+
+def test_retried_failures_are_cleared():
+    """
+    Resuming a job retries its failed courses and completes it once they succeed.
+    """
+    client = FakeSaleorApiClient(failing={COURSE_IDS[3]})
+    sync(client, "--all", "--job", "catalog")
+
+    job = SaleorSyncJob.objects.get(name="catalog")
+    assert job.status == SaleorSyncJob.RUNNING
+    assert list(job.failures.values_list("course_id", flat=True)) == [COURSE_IDS[3]]
+
+    retry = FakeSaleorApiClient()
+    job = resume(retry, client.products)
+
+    assert retry.calls == [("upsert", [COURSE_IDS[3]])]
+    assert job.status == SaleorSyncJob.COMPLETED
+    assert not job.failures.exists()
+
+
+def test_failures_of_deleted_courses_are_dropped():
+    """
+    The failures of courses deleted before the job is resumed are not retried.
+    """
+    client = FakeSaleorApiClient(failing={COURSE_IDS[3]})
+    sync(client, "--all", "--job", "catalog")
+    CourseOverview.objects.filter(id=COURSE_IDS[3]).delete()
+
+    retry = FakeSaleorApiClient()
+    job = resume(retry, client.products)
+
+    assert not retry.calls
+    assert job.status == SaleorSyncJob.COMPLETED
+    assert not job.failures.exists()
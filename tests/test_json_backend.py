@@ -0,0 +1,63 @@
+"""
+Tests for the JSON backends of Saleor payloads.
+"""
+
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from platform_plugin_saleor.saleor_client import json_backend
+from platform_plugin_saleor.saleor_client.utils import create_rich_text
+
+pytest.importorskip("orjson")
+
+PAYLOADS = [
+    {"name": "Cours n°1 — «Débutant»", "slug": "cours-1", "tags": ["édition", "日本語", "emoji 🎓"]},
+    {"description": create_rich_text("Learn the basics.\nThen \"quote\" them \\ escape them.")},
+    {"b": 1, "a": [True, False, None], "c": {"z": -1.5, "y": 0, "x": 10**15}},
+    ["course-v1:edX+DemoX+Demo_Course", 49.0, 0.1, {"nested": []}],
+    "control \u0000 \u001f and   separators",
+]
+
+
+def dump_with_stdlib(*args, **kwargs) -> str:
+    """
+    Serialize with the standard library fallback of the backend.
+    """
+    with mock.patch.object(json_backend, "orjson", None):
+        return json_backend.dumps(*args, **kwargs)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("options", [{}, {"sort_keys": True}, {"indent": True}, {"indent": True, "sort_keys": True}])
+def test_stdlib_fallback_writes_the_same_json_as_orjson(payload, options):
+    """
+    Both backends write the same string, so content hashes do not depend on the backend.
+    """
+    assert dump_with_stdlib(payload, **options) == json_backend.dumps(payload, **options)
+
+
+def test_default_is_used_by_both_backends():
+    """
+    Objects that are not JSON types are serialized with the default function.
+    """
+    payload = {"start": date(2024, 1, 31)}
+
+    assert dump_with_stdlib(payload, default=date.isoformat) == '{"start":"2024-01-31"}'
+    assert json_backend.dumps(payload, default=date.isoformat) == '{"start":"2024-01-31"}'
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_loads_round_trips_on_both_backends(payload):
+    """
+    Decoding a document, as text or bytes, returns the serialized object.
+    """
+    document = json_backend.dumps(payload)
+
+    with mock.patch.object(json_backend, "orjson", None):
+        assert json_backend.loads(document) == payload
+        assert json_backend.loads(document.encode("utf-8")) == payload
+
+    assert json_backend.loads(document) == payload
+    assert json_backend.loads(document.encode("utf-8")) == payload
@@ -0,0 +1,124 @@
+"""
+Tests for the registry caching Saleor metadata IDs.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+
+from platform_plugin_saleor.saleor_client.metadata import MetadataRegistry
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    """
+    Patch the monotonic clock of the registry.
+    """
+    with mock.patch("platform_plugin_saleor.saleor_client.metadata.time.monotonic", return_value=100.0) as clock:
+        yield clock
+
+
+@pytest.fixture(name="shared_cache")
+def fixture_shared_cache(settings):
+    """
+    Configure a local memory Django cache shared by the registries of a test.
+    """
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "saleor": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "saleor"},
+    }
+    caches["saleor"].clear()
+
+    return caches["saleor"]
+
+
+def load(registry, key, value):
+    """
+    Look up a key, loading the given value on a miss.
+
+    Returns:
+        tuple: The value returned by the registry and the loader mock.
+    """
+    loader = mock.AsyncMock(return_value=value)
+
+    return asyncio.run(registry.get_or_load(key, loader)), loader
+
+
+def test_values_expire_after_ttl(clock):
+    """
+    A value is kept for the TTL, then loaded again.
+    """
+    registry = MetadataRegistry(ttl=60)
+    registry.set("product_type", "UHJvZHVjdFR5cGU6MQ==")
+
+    clock.return_value = 159.0
+    assert registry.get("product_type") == "UHJvZHVjdFR5cGU6MQ=="
+
+    clock.return_value = 160.0
+    assert registry.get("product_type") is None
+
+
+def test_least_recently_used_value_is_evicted(clock):  # pylint: disable=unused-argument
+    """
+    When full, the registry drops the value read or written the longest ago.
+    """
+    registry = MetadataRegistry(max_entries=2)
+    registry.set("a", 1)
+    registry.set("b", 2)
+    registry.get("a")
+
+    registry.set("c", 3)
+
+    assert [registry.get(key) for key in ("a", "b", "c")] == [1, None, 3]
+
+
+def test_values_are_read_through_the_django_cache(shared_cache):
+    """
+    A value loaded by one process is found in the Django cache by the others.
+    """
+    value, loader = load(MetadataRegistry(cache_alias="saleor"), "warehouse", "V2FyZWhvdXNlOjE=")
+
+    assert value == "V2FyZWhvdXNlOjE="
+    loader.assert_awaited_once()
+    assert shared_cache.get("saleor_metadata:warehouse") == "V2FyZWhvdXNlOjE="
+
+    value, loader = load(MetadataRegistry(cache_alias="saleor"), "warehouse", "other")
+
+    assert value == "V2FyZWhvdXNlOjE="
+    loader.assert_not_awaited()
+
+
+def test_missing_values_are_never_cached(shared_cache):
+    """
+    A value not found in Saleor is looked up again on the next call.
+    """
+    registry = MetadataRegistry(cache_alias="saleor")
+
+    assert load(registry, "attribute:course_id", None)[0] is None
+    value, loader = load(registry, "attribute:course_id", "QXR0cmlidXRlOjE=")
+
+    assert value == "QXR0cmlidXRlOjE="
+    loader.assert_awaited_once()
+    assert shared_cache.get("saleor_metadata:attribute%3Acourse_id") == "QXR0cmlidXRlOjE="
+
+
+def test_invalidate_drops_the_keys_of_the_process(shared_cache):
+    """
+    Invalidating drops the key in process and in the Django cache.
+    """
+    registry = MetadataRegistry(cache_alias="saleor")
+    load(registry, "a", 1)
+    load(registry, "b", 2)
+
+    registry.invalidate("a")
+
+    assert registry.get("a") is None
+    assert shared_cache.get("saleor_metadata:a") is None
+    assert shared_cache.get("saleor_metadata:b") == 2
+
+    asyncio.run(registry.ainvalidate())
+
+    assert registry.get("b") is None
+    assert shared_cache.get("saleor_metadata:b") is None
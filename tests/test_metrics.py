@@ -0,0 +1,184 @@
+"""
+Tests for the metrics of Saleor API calls.
+"""
+
+import asyncio
+import logging
+from io import StringIO
+from unittest import mock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from django.core.management import call_command
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.saleor_client.async_client import AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.circuit_breaker import CircuitBreaker
+from platform_plugin_saleor.saleor_client.metrics import (
+    InMemoryMetricsSink,
+    LoggingMetricsSink,
+    OperationMetrics,
+    StatsdMetricsSink,
+)
+from platform_plugin_saleor.saleor_client.queries import GET_PRODUCT_TYPES
+from test_utils.saleor import FakeSaleorApiClient
+
+RESPONSE_BODY = b'{"data": {"productTypes": {"edges": [], "pageInfo": {"hasNextPage": false}}}}'
+BATCH_RESPONSE_BODY = b"[" + RESPONSE_BODY + b", " + RESPONSE_BODY + b"]"
+
+
+def get_metrics(operation_name="productBulkCreate", duration=0.1, **kwargs):
+    """
+    Return the metrics of a mutation.
+    """
+    return OperationMetrics(operation_name, "mutation", duration=duration, **kwargs)
+
+
+def test_logging_sink_logs_each_operation(caplog):
+    """
+    The logging sink writes a line per operation.
+    """
+    caplog.set_level(logging.INFO)
+
+    LoggingMetricsSink().record(get_metrics(request_bytes=120, response_bytes=80, retries=1, error="TimeoutError"))
+
+    assert caplog.messages == [
+        "Saleor mutation productBulkCreate took 100.0ms "
+        "(request 120B, response 80B, retries 1, error TimeoutError)"
+    ]
+
+
+def test_statsd_sink_sends_timings_gauges_and_counters():
+    """
+    The statsd sink sends the duration, sizes, calls, and retries and errors if any.
+    """
+    client = mock.Mock()
+    sink = StatsdMetricsSink(client, prefix="lms.saleor")
+
+    sink.record(get_metrics(request_bytes=120, response_bytes=80))
+    sink.record(get_metrics(retries=2, error="TransportServerError"))
+
+    assert client.mock_calls == [
+        mock.call.timing("lms.saleor.productBulkCreate.duration", 100.0),
+        mock.call.gauge("lms.saleor.productBulkCreate.request_bytes", 120),
+        mock.call.gauge("lms.saleor.productBulkCreate.response_bytes", 80),
+        mock.call.incr("lms.saleor.productBulkCreate.calls"),
+        mock.call.timing("lms.saleor.productBulkCreate.duration", 100.0),
+        mock.call.gauge("lms.saleor.productBulkCreate.request_bytes", 0),
+        mock.call.gauge("lms.saleor.productBulkCreate.response_bytes", 0),
+        mock.call.incr("lms.saleor.productBulkCreate.calls"),
+        mock.call.incr("lms.saleor.productBulkCreate.retries", 2),
+        mock.call.incr("lms.saleor.productBulkCreate.errors"),
+    ]
+
+
+def test_in_memory_sink_summarizes_each_operation():
+    """
+    The in-memory sink keeps histograms and summarizes the slowest operations first.
+    """
+    sink = InMemoryMetricsSink()
+
+    for duration in (0.3, 0.1, 0.2, 0.4):
+        sink.record(get_metrics(duration=duration, request_bytes=10, response_bytes=5))
+
+    sink.record(get_metrics("getProductTypes", duration=0.05, retries=1, error="TimeoutError"))
+
+    assert sink.histogram("productBulkCreate") == [0.1, 0.2, 0.3, 0.4]
+    assert sink.percentile("productBulkCreate", 50) == 0.3
+    assert sink.percentile("missing", 50) is None
+    assert sink.summary() == {
+        "productBulkCreate": {
+            "calls": 4,
+            "errors": 0,
+            "retries": 0,
+            "total_duration": pytest.approx(1.0),
+            "p50_duration": 0.3,
+            "p95_duration": 0.4,
+            "max_duration": 0.4,
+            "request_bytes": 40,
+            "response_bytes": 20,
+        },
+        "getProductTypes": {
+            "calls": 1,
+            "errors": 1,
+            "retries": 1,
+            "total_duration": 0.05,
+            "p50_duration": 0.05,
+            "p95_duration": 0.05,
+            "max_duration": 0.05,
+            "request_bytes": 0,
+            "response_bytes": 0,
+        },
+    }
+
+    sink.clear()
+    assert not sink.summary()
+
+
+def test_payload_sizes_are_the_bytes_on_the_wire():
+    """
+    The request and response sizes are the bodies sent and received by the transport.
+    """
+    request_bodies = []
+
+    async def graphql(request):
+        request_bodies.append(await request.read())
+        body = BATCH_RESPONSE_BODY if request_bodies[-1].startswith(b"[") else RESPONSE_BODY
+
+        return web.Response(body=body, content_type="application/json")
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/graphql/", graphql)
+
+        async with TestServer(app) as server:
+            sink = InMemoryMetricsSink()
+            client = AsyncSaleorApiClient(
+                str(server.make_url("/graphql/")),
+                "token",
+                circuit_breaker=CircuitBreaker(),
+                metrics_sink=sink,
+            )
+
+            async with client:
+                await client.execute(GET_PRODUCT_TYPES, {"filter": {"search": "Course"}})
+                await client.execute_many([(GET_PRODUCT_TYPES, {}), (GET_PRODUCT_TYPES, {})])
+
+            return sink
+
+    sink = asyncio.run(run())
+
+    [query] = sink.records["getProductTypes"]
+    assert query.request_bytes == len(request_bodies[0])
+    assert query.response_bytes == len(RESPONSE_BODY)
+
+    [batch] = sink.records["batch"]
+    assert batch.request_bytes == len(request_bodies[1])
+    assert batch.response_bytes == len(BATCH_RESPONSE_BODY)
+
+
+@pytest.mark.django_db
+def test_command_prints_the_metrics(settings):
+    """
+    With --metrics, the command prints the metrics collected for each operation.
+    """
+    settings.SALEOR_API_URL = "http://saleor.test/graphql/"
+    settings.SALEOR_API_TOKEN = "token"
+    CourseOverview.objects.create(id="course-v1:edX+DemoX+Demo_Course", display_name="Demo")
+    stdout = StringIO()
+
+    def create_client(metrics_sink, **kwargs):  # pylint: disable=unused-argument
+        metrics_sink.record(get_metrics(duration=0.25, request_bytes=300, response_bytes=120, retries=1))
+        return FakeSaleorApiClient()
+
+    with mock.patch(
+        "platform_plugin_saleor.management.commands.saleor_create_course_products.SaleorApiClient",
+        side_effect=create_client,
+    ):
+        call_command("saleor_create_course_products", "--all", "--metrics", stdout=stdout)
+
+    assert stdout.getvalue().splitlines()[-2:] == [
+        "Saleor operations:",
+        "  - productBulkCreate: 1 calls, p50 250ms, p95 250ms, 0 errors, 1 retries, 300B sent, 120B received",
+    ]
@@ -0,0 +1,132 @@
+"""
+Tests for the paginated list queries of the Saleor client.
+"""
+
+import asyncio
+from contextlib import aclosing
+from unittest import mock
+
+from platform_plugin_saleor.saleor_client.async_client import AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.queries import GET_PRODUCT_TYPES
+
+
+def get_page(names, end_cursor=None):
+    """
+    Return a page of the product types query with nodes of the given names.
+    """
+    return {
+        "productTypes": {
+            "edges": [{"node": {"id": f"id-{name}", "name": name}} for name in names],
+            "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+        },
+    }
+
+
+def get_client(*pages):
+    """
+    Return a client whose queries answer the given pages, in order.
+    """
+    client = AsyncSaleorApiClient("http://saleor.test/graphql/", "token", page_size=2)
+    client.execute = mock.AsyncMock(side_effect=pages)
+
+    return client
+
+
+def get_variables(client):
+    """
+    Return the variables of each query sent by a client.
+    """
+    return [call.args[1] for call in client.execute.call_args_list]
+
+
+def test_paginate_follows_the_end_cursor():
+    """
+    Pages are requested until the last one, each after the cursor of the previous one.
+    """
+    client = get_client(get_page(["A", "B"], "cursor-1"), get_page(["C", "D"], "cursor-2"), get_page(["E"]))
+
+    async def collect():
+        return [node["name"] async for node in client.paginate(GET_PRODUCT_TYPES, {"filter": {"search": "x"}})]
+
+    assert asyncio.run(collect()) == ["A", "B", "C", "D", "E"]
+    assert get_variables(client) == [
+        {"filter": {"search": "x"}, "limit": 2, "after": None},
+        {"filter": {"search": "x"}, "limit": 2, "after": "cursor-1"},
+        {"filter": {"search": "x"}, "limit": 2, "after": "cursor-2"},
+    ]
+
+
+def test_paginate_is_lazy():
+    """
+    The next page is only requested once the nodes of the current one are consumed.
+    """
+    client = get_client(get_page(["A", "B"], "cursor-1"), get_page(["C"]))
+
+    async def take_first():
+        async with aclosing(client.paginate(GET_PRODUCT_TYPES, page_size=10)) as nodes:
+            return await anext(nodes)
+
+    assert asyncio.run(take_first())["name"] == "A"
+    assert get_variables(client) == [{"limit": 10, "after": None}]
+
+
+def test_find_node_stops_at_the_first_match():
+    """
+    Pages after the one holding the matching node are not requested.
+    """
+    client = get_client(get_page(["A", "B"], "cursor-1"), get_page(["C", "D"], "cursor-2"), get_page(["E"]))
+
+    node = asyncio.run(client.find_node(GET_PRODUCT_TYPES, "name", "C"))
+
+    assert node == {"id": "id-C", "name": "C"}
+    assert client.execute.await_count == 2
+
+
+def test_find_node_without_match():
+    """
+    Every page is searched before giving up.
+    """
+    client = get_client(get_page(["A", "B"], "cursor-1"), get_page(["C"]))
+
+    assert asyncio.run(client.find_node(GET_PRODUCT_TYPES, "name", "Z")) is None
+    assert client.execute.await_count == 2
+
+
+def test_find_node_by_name_uses_the_slug_first():
+    """
+    A name is first looked up by its slug, a single node at most.
+    """
+    client = get_client(get_page(["Open edX Course"]))
+
+    node = asyncio.run(client.find_node_by_name(GET_PRODUCT_TYPES, "Open edX Course"))
+
+    assert node["name"] == "Open edX Course"
+    assert get_variables(client) == [{"filter": {"slugs": ["open-edx-course"]}, "limit": 1, "after": None}]
+
+
+def test_find_node_by_name_falls_back_to_search():
+    """
+    Without a node for the slug, only the exact name among the search results is returned.
+    """
+    client = get_client(
+        get_page([]),
+        get_page(["Cursos abiertos de edX", "Cursos abiertos"], "cursor-1"),
+        get_page(["Cursos abiertos: edición 2"]),
+    )
+
+    node = asyncio.run(client.find_node_by_name(GET_PRODUCT_TYPES, "Cursos abiertos"))
+
+    assert node == {"id": "id-Cursos abiertos", "name": "Cursos abiertos"}
+    assert get_variables(client) == [
+        {"filter": {"slugs": ["cursos-abiertos"]}, "limit": 1, "after": None},
+        {"filter": {"search": "Cursos abiertos"}, "limit": 2, "after": None},
+    ]
+
+
+def test_find_node_by_name_ignores_partial_matches():
+    """
+    Nodes whose name only contains the one looked up are not returned.
+    """
+    client = get_client(get_page(["Course (old)"]), get_page(["Course (old)", "Courses"]))
+
+    assert asyncio.run(client.find_node_by_name(GET_PRODUCT_TYPES, "Course")) is None
@@ -0,0 +1,135 @@
+"""
+Tests for the retry policy of Saleor API calls.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import aiohttp
+import pytest
+from gql.transport.exceptions import TransportServerError
+
+from platform_plugin_saleor.saleor_client.async_client import AsyncSaleorApiClient
+from platform_plugin_saleor.saleor_client.circuit_breaker import CircuitBreaker
+from platform_plugin_saleor.saleor_client.retry import RetryPolicy, get_retry_after
+
+
+def server_error(status, retry_after=None):
+    """
+    Build the error gql raises for an HTTP status, from the aiohttp error keeping the headers.
+    """
+    exc = TransportServerError(f"{status} Server Error", status)
+    exc.__cause__ = aiohttp.ClientResponseError(
+        mock.Mock(),
+        (),
+        status=status,
+        headers={"Retry-After": retry_after} if retry_after else {},
+    )
+
+    return exc
+
+
+def send(policy, operation_type, exc, retry=None):
+    """
+    Send an operation failing with an exception, without waiting between attempts.
+
+    Returns:
+        int: The number of attempts.
+    """
+    client = AsyncSaleorApiClient(
+        "http://saleor.test/graphql/",
+        "token",
+        retry_policy=policy,
+        circuit_breaker=CircuitBreaker(failure_threshold=100),
+    )
+    send_with_retry = client._send_with_retry  # pylint: disable=protected-access
+    request = mock.AsyncMock(side_effect=exc)
+
+    with mock.patch("platform_plugin_saleor.saleor_client.async_client.asyncio.sleep"):
+        with pytest.raises(type(exc)):
+            asyncio.run(send_with_retry(operation_type, "operation", request, retry))
+
+    return request.call_count
+
+
+@pytest.mark.parametrize("attempt, max_delay", [(1, 0.5), (2, 1.0), (3, 2.0), (10, 10.0)])
+def test_delay_is_jittered_exponential_backoff(attempt, max_delay):
+    """
+    The delay is drawn up to the base doubled on each attempt, capped by the maximum.
+    """
+    with mock.patch("platform_plugin_saleor.saleor_client.retry.random.uniform", return_value=0.1) as uniform:
+        assert RetryPolicy().get_delay(attempt, server_error(503)) == 0.1
+
+    uniform.assert_called_once_with(0, max_delay)
+
+
+@pytest.mark.parametrize("retry_after, delay", [("3", 3.0), ("120", 10.0), ("-1", 0.0)])
+def test_retry_after_seconds_overrides_backoff(retry_after, delay):
+    """
+    A Retry-After in seconds is used as the delay, capped by the maximum backoff.
+    """
+    assert RetryPolicy().get_delay(1, server_error(429, retry_after)) == delay
+
+
+def test_retry_after_http_date_overrides_backoff():
+    """
+    A Retry-After HTTP date is turned into the delay until that date.
+    """
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    exc = server_error(503, format_datetime(retry_at, usegmt=True))
+
+    assert 28 < get_retry_after(exc) <= 30
+    assert RetryPolicy(backoff_max=60).get_delay(1, exc) == pytest.approx(get_retry_after(exc), abs=1)
+
+
+@pytest.mark.parametrize("retry_after", [None, "soon"])
+def test_missing_or_invalid_retry_after_is_ignored(retry_after):
+    """
+    Without a valid Retry-After header, there is no requested delay.
+    """
+    assert get_retry_after(server_error(503, retry_after)) is None
+    assert get_retry_after(asyncio.TimeoutError()) is None
+
+
+@pytest.mark.parametrize("exc, transient", [
+    (server_error(429), True),
+    (server_error(503), True),
+    (server_error(500), False),
+    (server_error(400), False),
+    (aiohttp.ServerDisconnectedError(), True),
+    (asyncio.TimeoutError(), True),
+    (ValueError(), False),
+])
+def test_transient_failures(exc, transient):
+    """
+    Rate limiting, proxy errors, connection errors and timeouts are transient.
+    """
+    assert RetryPolicy().is_transient(exc) == transient
+
+
+def test_queries_are_retried_up_to_max_attempts():
+    """
+    A query failing transiently is sent max_attempts times in total.
+    """
+    assert send(RetryPolicy(max_attempts=4), "query", server_error(503)) == 4
+
+
+def test_non_transient_failures_are_not_retried():
+    """
+    A failure that would fail again is not retried.
+    """
+    assert send(RetryPolicy(), "query", server_error(400)) == 1
+
+
+def test_mutations_are_not_retried_by_default():
+    """
+    Mutations are only retried when the policy or the caller opts in.
+    """
+    exc = server_error(503)
+
+    assert send(RetryPolicy(), "mutation", exc) == 1
+    assert send(RetryPolicy(), "mutation", exc, retry=True) == 3
+    assert send(RetryPolicy(retry_mutations=True), "mutation", exc) == 3
+    assert send(RetryPolicy(retry_mutations=True), "query", exc, retry=False) == 1
@@ -0,0 +1,31 @@
+"""
+Tests for the compiled serializer of Saleor product inputs.
+"""
+
+import pytest
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.saleor_client.config import EdxCourseOverviewSaleorConfig
+from test_utils.course_overviews.factories import build_courses
+
+
+@pytest.mark.django_db
+def test_serialize_rows_matches_serialize():
+    """
+    Products built column by column from rows equal the ones built from instances.
+    """
+    CourseOverview.objects.bulk_create(build_courses(100))
+    config = EdxCourseOverviewSaleorConfig()
+    serializer = config.product_serializer
+    courses = CourseOverview.objects.order_by("id")
+
+    assert serializer.serialize_rows(courses.values_list(*serializer.row_fields), "product-type") == [
+        serializer.serialize(course, "product-type") for course in courses
+    ]
+
+
+def test_serialize_rows_without_rows():
+    """
+    No rows build no products.
+    """
+    assert not EdxCourseOverviewSaleorConfig().product_serializer.serialize_rows([], "product-type")
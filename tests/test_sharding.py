@@ -0,0 +1,156 @@
+"""
+Tests for the sharding of courses between sync processes.
+"""
+
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.models import SaleorSyncCheckpoint, SaleorSyncJob
+from platform_plugin_saleor.sharding import filter_shard, format_shard, get_shard_index, parse_shard
+from test_utils.saleor import FakeSaleorApiClient
+
+COURSE_IDS = [f"course-v1:edX+C{index}+2024" for index in range(10)]
+SHARD_COURSE_IDS = [
+    [COURSE_IDS[index] for index in (1, 3, 4, 5, 7)],
+    [COURSE_IDS[index] for index in (0, 2, 6, 8, 9)],
+]
+
+
+def create_products(client, *args):
+    """
+    Run the course products command with a Saleor client.
+
+    Returns:
+        str: The output of the command.
+    """
+    stdout = StringIO()
+
+    with mock.patch(
+        "platform_plugin_saleor.management.commands.saleor_create_course_products.SaleorApiClient",
+        return_value=client,
+    ):
+        call_command("saleor_create_course_products", *args, stdout=stdout)
+
+    return stdout.getvalue()
+
+
+@pytest.fixture(name="courses")
+def fixture_courses(db, settings):  # pylint: disable=unused-argument
+    """
+    Create the courses of the catalog and configure the Saleor API.
+    """
+    settings.SALEOR_API_URL = "http://saleor.test/graphql/"
+    settings.SALEOR_API_TOKEN = "token"
+
+    return CourseOverview.objects.bulk_create(
+        CourseOverview(id=course_id, display_name=f"Course {course_id}") for course_id in COURSE_IDS
+    )
+
+
+@pytest.mark.parametrize("value, shard", [("0/1", (0, 1)), ("3/4", (3, 4)), (" 1 / 2 ", (1, 2))])
+def test_parse_shard(value, shard):
+    """
+    A shard is parsed into its index and count.
+    """
+    assert parse_shard(value) == shard
+
+
+@pytest.mark.parametrize("value, message", [
+    ("1", "expected INDEX/COUNT"),
+    ("a/4", "expected INDEX/COUNT"),
+    ("1/2/3", "expected INDEX/COUNT"),
+    ("4/4", "between 0 and COUNT - 1"),
+    ("-1/4", "between 0 and COUNT - 1"),
+    ("0/0", "between 0 and COUNT - 1"),
+])
+def test_parse_invalid_shard(value, message):
+    """
+    Shards that are not an index within the count are rejected.
+    """
+    with pytest.raises(ValueError, match=message):
+        parse_shard(value)
+
+
+def test_format_shard():
+    """
+    A shard is formatted back as given, and no shard as an empty string.
+    """
+    assert format_shard((1, 4)) == "1/4"
+    assert format_shard(None) == ""
+
+
+def test_shard_index_is_stable():
+    """
+    A course always hashes to the same shard, whether given as a key or a string.
+    """
+    course_key = mock.Mock(__str__=lambda self: COURSE_IDS[0])
+
+    assert [get_shard_index(course_id, 2) for course_id in COURSE_IDS] == [1, 0, 1, 0, 0, 0, 1, 0, 1, 1]
+    assert get_shard_index(course_key, 2) == 1
+
+
+def test_shards_split_the_courses():
+    """
+    The shards are disjoint, cover every course and keep their order.
+    """
+    courses = [mock.Mock(id=course_id) for course_id in COURSE_IDS]
+    shards = [[course.id for course in filter_shard(courses, (index, 2))] for index in range(2)]
+
+    assert shards == SHARD_COURSE_IDS
+    assert list(filter_shard(courses, None)) == courses
+    assert list(filter_shard(COURSE_IDS, (1, 2), lambda course_id: course_id)) == SHARD_COURSE_IDS[1]
+
+
+def test_shard_job_only_syncs_its_courses(courses):  # pylint: disable=unused-argument
+    """
+    A sharded job syncs the courses of its shard, and resumes with the same shard.
+    """
+    client = FakeSaleorApiClient(failing={SHARD_COURSE_IDS[1][0]})
+
+    output = create_products(client, "--all", "--job", "catalog", "--shard", "1/2")
+
+    job = SaleorSyncJob.objects.get(name="catalog")
+    assert job.shard == "1/2"
+    assert sorted(client.products) == SHARD_COURSE_IDS[1][1:]
+    assert "Processed 5 courses of shard 1/2" in output
+
+    client.failing.clear()
+    create_products(client, "--resume", "catalog")
+
+    job.refresh_from_db()
+    assert job.status == SaleorSyncJob.COMPLETED
+    assert sorted(client.products) == SHARD_COURSE_IDS[1]
+
+
+def test_incremental_shard_has_its_own_checkpoint(courses):  # pylint: disable=unused-argument
+    """
+    Each shard of an incremental sync moves a checkpoint named after the shard.
+    """
+    client = FakeSaleorApiClient()
+
+    create_products(client, "--incremental", "--shard", "0/2")
+
+    assert sorted(client.products) == SHARD_COURSE_IDS[0]
+    assert list(SaleorSyncCheckpoint.objects.values_list("name", flat=True)) == ["course_products:0/2"]
+
+
+@pytest.mark.parametrize("args, error", [
+    (("--all", "--shard", "2/2"), "Invalid shard '2/2', the index must be between 0 and COUNT - 1."),
+    (("--incremental", "--shard", "x"), "Invalid shard 'x', expected INDEX/COUNT, e.g. 0/4."),
+    (("--resume", "catalog", "--shard", "0/2"), "--resume takes the courses and shard of the job"),
+])
+def test_invalid_shard_is_reported(courses, args, error):  # pylint: disable=unused-argument
+    """
+    An invalid shard, or a shard given to a resumed job, stops the command before any sync.
+    """
+    client = FakeSaleorApiClient()
+
+    output = create_products(client, *args)
+
+    assert error in output
+    assert not client.calls
+    assert not SaleorSyncJob.objects.exists()
@@ -0,0 +1,163 @@
+"""
+Tests for the incremental sync of courses to Saleor products.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.models import SaleorCourseProduct, SaleorSyncCheckpoint
+from platform_plugin_saleor.sync import sync_modified_courses
+from test_utils.saleor import FakeSaleorApiClient
+
+START = datetime(2024, 1, 1)
+
+
+def create_courses(*hours):
+    """
+    Create a course per given hour, modified that many hours after START.
+
+    Returns:
+        list: The course IDs, in creation order.
+    """
+    course_ids = [f"course-v1:edX+C{index}+2024" for index in range(len(hours))]
+    CourseOverview.objects.bulk_create(
+        CourseOverview(id=course_id, display_name=f"Course {index}")
+        for index, course_id in enumerate(course_ids)
+    )
+
+    for course_id, hour in zip(course_ids, hours):
+        CourseOverview.objects.filter(id=course_id).update(modified=START + timedelta(hours=hour))
+
+    return course_ids
+
+
+def rename_course(course_id, name, hour):
+    """
+    Rename a course, modified that many hours after START.
+    """
+    CourseOverview.objects.filter(id=course_id).update(display_name=name, modified=START + timedelta(hours=hour))
+
+
+def get_checkpoint():
+    """
+    Return the value of the default checkpoint.
+    """
+    return SaleorSyncCheckpoint.objects.get().synced_until
+
+
+@pytest.mark.django_db
+def test_checkpoint_moves_to_last_modified_course():
+    """
+    A sync pushes every course and moves the checkpoint to the latest modification.
+    """
+    course_ids = create_courses(0, 1, 2)
+    client = FakeSaleorApiClient()
+
+    report = sync_modified_courses(client, batch_size=2)
+
+    assert list(report.results) == course_ids
+    assert sorted(client.products) == course_ids
+    assert get_checkpoint() == START + timedelta(hours=2)
+
+
+@pytest.mark.django_db
+def test_checkpoint_stops_before_courses_modified_with_a_failure():
+    """
+    The courses modified at the same time as a failed course are synced again next time.
+    """
+    course_ids = create_courses(0, 1, 1)
+    client = FakeSaleorApiClient(failing={course_ids[2]})
+
+    report = sync_modified_courses(client, batch_size=1)
+
+    assert report.failed == [course_ids[2]]
+    assert get_checkpoint() == START
+
+    client.failing.clear()
+    report = sync_modified_courses(client, batch_size=1)
+
+    assert list(report.results) == [course_ids[2]]
+    assert report.skipped == [course_ids[1]]
+    assert get_checkpoint() == START + timedelta(hours=1)
+
+
+@pytest.mark.django_db
+def test_checkpoint_stops_at_failure_in_later_batch():
+    """
+    A failure in a later batch keeps the progress of the earlier ones, and later courses
+    are still pushed without moving the checkpoint past the failure.
+    """
+    course_ids = create_courses(0, 1, 2, 3, 4, 5)
+    client = FakeSaleorApiClient(failing={course_ids[4]})
+
+    report = sync_modified_courses(client, batch_size=2)
+
+    assert report.failed == [course_ids[4]]
+    assert course_ids[5] in client.products
+    assert get_checkpoint() == START + timedelta(hours=3)
+
+    client.failing.clear()
+    report = sync_modified_courses(client, batch_size=2)
+
+    assert list(report.results) == [course_ids[4]]
+    assert report.skipped == [course_ids[5]]
+    assert get_checkpoint() == START + timedelta(hours=5)
+
+
+@pytest.mark.django_db
+def test_unchanged_courses_are_skipped():
+    """
+    Courses whose product input hashes the same as the last push are not sent again.
+    """
+    course_ids = create_courses(0, 1)
+    client = FakeSaleorApiClient()
+    sync_modified_courses(client)
+    client.calls.clear()
+
+    report = sync_modified_courses(client, checkpoint="full")
+
+    assert not report.results
+    assert report.skipped == course_ids
+    assert not client.calls
+    assert SaleorSyncCheckpoint.objects.get(name="full").synced_until == START + timedelta(hours=1)
+
+
+@pytest.mark.django_db
+def test_existing_products_get_only_their_changes():
+    """
+    A product already in Saleor is updated with only the fields that changed.
+    """
+    [course_id] = create_courses(0)
+    client = FakeSaleorApiClient()
+    sync_modified_courses(client)
+    client.calls.clear()
+    rename_course(course_id, "Renamed", 1)
+
+    report = sync_modified_courses(client)
+
+    assert report.results[course_id].ok
+    assert client.calls == [("update", [course_id])]
+    assert client.products[course_id]["name"] == "Renamed"
+    assert SaleorCourseProduct.objects.get(course_id=course_id).snapshot["name"] == "Renamed"
+
+
+@pytest.mark.django_db
+def test_failed_partial_update_falls_back_to_full_input():
+    """
+    A product deleted in Saleor is created again from the full input when its partial
+    update fails.
+    """
+    [course_id] = create_courses(0)
+    client = FakeSaleorApiClient()
+    sync_modified_courses(client)
+    full_input = client.products.pop(course_id)
+    client.calls.clear()
+    rename_course(course_id, "Renamed", 1)
+
+    report = sync_modified_courses(client)
+
+    assert report.results[course_id].ok
+    assert client.calls == [("update", [course_id]), ("upsert", [course_id])]
+    assert client.products[course_id] == {**full_input, "name": "Renamed"}
@@ -0,0 +1,112 @@
+"""
+Tests for the near-real-time sync of course products on save.
+"""
+
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview  # pylint: disable=import-error
+
+from platform_plugin_saleor.signals import sync_course_product_on_save
+from platform_plugin_saleor.sync import SyncReport
+from platform_plugin_saleor.tasks import get_course_sync_key, schedule_course_product_sync, sync_course_product
+
+COURSE_ID = "course-v1:edX+DemoX+Demo_Course"
+
+
+@pytest.fixture(name="sync_settings", autouse=True)
+def fixture_sync_settings(settings):
+    """
+    Enable the sync on save with a clean cache.
+    """
+    settings.SALEOR_COURSE_SYNC_ON_SAVE = True
+    settings.SALEOR_COURSE_SYNC_DELAY = 30
+    cache.clear()
+
+    return settings
+
+
+@pytest.fixture(name="apply_async")
+def fixture_apply_async():
+    """
+    Patch the scheduling of the sync task.
+    """
+    with mock.patch.object(sync_course_product, "apply_async") as apply_async:
+        yield apply_async
+
+
+@pytest.fixture(name="schedule")
+def fixture_schedule():
+    """
+    Patch the scheduling of the sync of a saved course.
+    """
+    with mock.patch("platform_plugin_saleor.signals.schedule_course_product_sync") as schedule:
+        yield schedule
+
+
+def test_saves_are_folded_into_the_pending_sync(apply_async):
+    """
+    Only the first save schedules a task, the next ones are folded into it.
+    """
+    assert schedule_course_product_sync(COURSE_ID)
+    assert not schedule_course_product_sync(COURSE_ID)
+    assert schedule_course_product_sync("course-v1:edX+Other+2024")
+
+    assert apply_async.call_args_list == [
+        mock.call(args=(COURSE_ID,), countdown=30),
+        mock.call(args=("course-v1:edX+Other+2024",), countdown=30),
+    ]
+
+
+def test_pending_mark_is_cleared_before_the_sync(apply_async):
+    """
+    A save made while the task syncs the course schedules a new sync.
+    """
+    schedule_course_product_sync(COURSE_ID)
+
+    def sync_courses(client, course_ids):  # pylint: disable=unused-argument
+        assert cache.get(get_course_sync_key(COURSE_ID)) is None
+        assert schedule_course_product_sync(COURSE_ID)
+        return SyncReport()
+
+    with (
+        mock.patch("platform_plugin_saleor.tasks.get_saleor_api_client_instance") as get_client,
+        mock.patch("platform_plugin_saleor.tasks.sync_courses", side_effect=sync_courses) as sync,
+    ):
+        sync_course_product(COURSE_ID)
+
+    sync.assert_called_once_with(get_client.return_value, [COURSE_ID])
+    assert apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_saved_course_is_synced_once_committed(schedule, django_capture_on_commit_callbacks):
+    """
+    Saving a course schedules its sync when the transaction commits.
+    """
+    post_save.connect(sync_course_product_on_save, sender=CourseOverview)
+
+    try:
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            CourseOverview.objects.create(id=COURSE_ID, display_name="Demo")
+            schedule.assert_not_called()
+    finally:
+        post_save.disconnect(sync_course_product_on_save, sender=CourseOverview)
+
+    assert len(callbacks) == 1
+    schedule.assert_called_once_with(COURSE_ID)
+
+
+def test_sync_on_save_is_disabled_by_setting(sync_settings, schedule):
+    """
+    Nothing is scheduled unless SALEOR_COURSE_SYNC_ON_SAVE is enabled.
+    """
+    sync_settings.SALEOR_COURSE_SYNC_ON_SAVE = False
+
+    with mock.patch("platform_plugin_saleor.signals.transaction.on_commit") as on_commit:
+        sync_course_product_on_save(CourseOverview, CourseOverview(id=COURSE_ID))
+
+    on_commit.assert_not_called()
+    schedule.assert_not_called()
@@ -0,0 +1,183 @@
+"""
+Tests for the checkout and authentication views and their Saleor helpers.
+"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+
+from platform_plugin_saleor.models import SaleorProductVariant, SaleorUser
+from platform_plugin_saleor.saleor_client.exceptions import CircuitOpenError, GraphQLError
+from platform_plugin_saleor.services import helpers, views
+from test_utils.student import anonymous_id_for_user
+
+SKU = "course-v1:edX+DemoX+Demo_Course-verified"
+VARIANT = {"id": "UHJvZHVjdFZhcmlhbnQ6Mg==", "sku": SKU, "name": "verified"}
+CHECKOUT = {"id": "Q2hlY2tvdXQ6MQ=="}
+
+# The webhook URLs import the Open edX enrollment models, only the service URLs are needed.
+pytestmark = pytest.mark.urls("platform_plugin_saleor.services.urls")
+
+
+@pytest.fixture(name="user")
+def fixture_user(db):  # pylint: disable=unused-argument
+    """
+    Return an LMS user.
+    """
+    return get_user_model().objects.create(
+        username="learner", email="learner@example.com", first_name="Ada", last_name="Lovelace",
+    )
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    """
+    Patch the shared Saleor API client of the helpers and views with a mock.
+    """
+    client = mock.Mock()
+    client.create_checkout.return_value = {"checkoutCreate": {"checkout": CHECKOUT}}
+    client.attach_customer.return_value = {"checkoutCustomerAttach": {"checkout": CHECKOUT}}
+
+    with mock.patch.object(helpers, "get_saleor_api_client_instance", return_value=client):
+        with mock.patch.object(views, "get_saleor_api_client_instance", return_value=client):
+            yield client
+
+
+def get_request(user, path="/services/checkout/", **params):
+    """
+    Return a GET request of the user.
+    """
+    request = RequestFactory().get(path, params)
+    request.user = user
+
+    return request
+
+
+def map_variant(variant_id="UHJvZHVjdFZhcmlhbnQ6MQ=="):
+    """
+    Store a variant of the SKU.
+    """
+    SaleorProductVariant.objects.create(sku=SKU, variant_id=variant_id, name="verified")
+
+
+def test_product_variant_is_read_from_the_mapping_first(client, user):  # pylint: disable=unused-argument
+    """
+    A stored variant is returned without querying Saleor.
+    """
+    map_variant()
+
+    assert helpers.get_product_variant(SKU) == {"id": "UHJvZHVjdFZhcmlhbnQ6MQ==", "sku": SKU, "name": "verified"}
+    client.get_product_variant.assert_not_called()
+
+
+def test_product_variant_is_stored_when_found_in_saleor(client, user):  # pylint: disable=unused-argument
+    """
+    A variant found in Saleor is stored, so the next lookup does not query it again.
+    """
+    client.get_product_variant.return_value = {"productVariant": VARIANT}
+
+    assert helpers.get_product_variant(SKU) == VARIANT
+    assert helpers.get_product_variant(SKU) == VARIANT
+    client.get_product_variant.assert_called_once_with(sku=SKU)
+
+
+def test_saleor_user_is_read_from_the_mapping_first(client, user):
+    """
+    A stored Saleor user is returned without querying Saleor.
+    """
+    SaleorUser.objects.create(user=user, saleor_user_id="VXNlcjox")
+
+    assert helpers.get_or_create_saleor_user(user) == {"id": "VXNlcjox", "email": "learner@example.com"}
+    client.get_user_by_email.assert_not_called()
+    client.account_register.assert_not_called()
+
+
+def test_saleor_user_is_registered_and_stored(client, user):
+    """
+    A user unknown to Saleor is registered once, then read from the mapping.
+    """
+    saleor_user = {"id": "VXNlcjoy", "email": "learner@example.com"}
+    client.get_user_by_email.return_value = {"user": None}
+    client.account_register.return_value = {"accountRegister": {"user": saleor_user}}
+
+    assert helpers.get_or_create_saleor_user(user) == saleor_user
+    assert helpers.get_or_create_saleor_user(user) == saleor_user
+
+    client.get_user_by_email.assert_called_once_with("learner@example.com")
+    client.account_register.assert_called_once_with(
+        first_name="Ada",
+        last_name="Lovelace",
+        email="learner@example.com",
+        password=anonymous_id_for_user(user, None),
+    )
+
+
+def test_checkout_redirects_to_the_storefront(client, user):
+    """
+    The checkout is created for the stored variant and user, then the learner is redirected.
+    """
+    map_variant()
+    SaleorUser.objects.create(user=user, saleor_user_id="VXNlcjox")
+
+    response = views.checkout(get_request(user, sku=SKU))
+
+    assert response.status_code == 302
+    assert response["Location"].endswith("/checkout?checkout=Q2hlY2tvdXQ6MQ==")
+    client.attach_customer.assert_called_once_with(customer_id="VXNlcjox", checkout_id="Q2hlY2tvdXQ6MQ==")
+
+
+def test_checkout_retries_after_deleting_stale_mappings(client, user):
+    """
+    When Saleor rejects the stored IDs, they are forgotten and the checkout is retried once with the current ones.
+    """
+    map_variant()
+    SaleorUser.objects.create(user=user, saleor_user_id="VXNlcjox")
+    client.create_checkout.side_effect = [
+        GraphQLError([{"code": "NOT_FOUND", "field": "lines"}]),
+        {"checkoutCreate": {"checkout": CHECKOUT}},
+    ]
+    client.get_product_variant.return_value = {"productVariant": VARIANT}
+    client.get_user_by_email.return_value = {"user": {"id": "VXNlcjoy", "email": "learner@example.com"}}
+
+    response = views.checkout(get_request(user, sku=SKU))
+
+    assert response.status_code == 302
+    assert client.create_checkout.call_args.kwargs["product_variants"] == [VARIANT]
+    client.attach_customer.assert_called_once_with(customer_id="VXNlcjoy", checkout_id="Q2hlY2tvdXQ6MQ==")
+    assert SaleorProductVariant.objects.get(sku=SKU).variant_id == "UHJvZHVjdFZhcmlhbnQ6Mg=="
+    assert SaleorUser.objects.get(user=user).saleor_user_id == "VXNlcjoy"
+
+
+def test_checkout_is_retried_once(client, user):
+    """
+    When Saleor still rejects the current IDs, the error is raised instead of retrying again.
+    """
+    client.create_checkout.side_effect = GraphQLError([{"code": "INVALID", "field": "email"}])
+    client.get_product_variant.return_value = {"productVariant": VARIANT}
+    client.get_user_by_email.return_value = {"user": {"id": "VXNlcjoy", "email": "learner@example.com"}}
+
+    with pytest.raises(GraphQLError):
+        views.checkout(get_request(user, sku=SKU))
+
+    assert client.create_checkout.call_count == 2
+
+
+@pytest.mark.parametrize("view, path", [
+    (views.checkout, "/services/checkout/"),
+    (views.authenticate, "/services/authenticate/"),
+])
+def test_open_circuit_answers_503_with_retry_after(client, user, view, path):
+    """
+    While the circuit is open, the views answer a 503 with the seconds left before Saleor is tried again.
+    """
+    map_variant()
+    SaleorUser.objects.create(user=user, saleor_user_id="VXNlcjox")
+    client.create_checkout.side_effect = CircuitOpenError("http://saleor.test/graphql/", 12.2)
+    client.create_token.side_effect = CircuitOpenError("http://saleor.test/graphql/", 12.2)
+
+    response = view(get_request(user, path, sku=SKU))
+
+    assert response.status_code == 503
+    assert response["Retry-After"] == "13"